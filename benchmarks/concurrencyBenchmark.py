@@ -0,0 +1,30 @@
+import time
+
+from src.glosbe.translating.scrapping import Scrapper
+from tests.localGlosbe import LocalGlosbe
+
+LATENCY = 0.05
+TO_LANGS = ['de', 'es', 'en', 'uk']
+WORDS = ['piec', 'dom', 'kot', 'pies', 'las']
+WORKERS = [None, 2, 4, 8, 20]
+
+
+def measure(scrapper: Scrapper, max_workers: int | None) -> float:
+	start = time.perf_counter()
+	for translation in scrapper.scrap_translation('pl', TO_LANGS, WORDS, max_workers=max_workers):
+		list(translation.records)
+	return time.perf_counter() - start
+
+
+def main():
+	print(f'{len(TO_LANGS)} langs x {len(WORDS)} words, {LATENCY * 1000:.0f} ms server latency')
+	with LocalGlosbe(latency=LATENCY):
+		scrapper = Scrapper()
+		serial = measure(scrapper, None)
+		for max_workers in WORKERS:
+			elapsed = measure(scrapper, max_workers)
+			print(f'max_workers={str(max_workers):>4}: {elapsed:.3f} s ({serial / elapsed:.1f}x)')
+
+
+if __name__ == '__main__':
+	main()
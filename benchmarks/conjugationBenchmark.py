@@ -0,0 +1,48 @@
+import time
+from itertools import islice
+
+from src.glosbe.translating.parsing.parsing import ConjugationParser, TableSelections
+from src.glosbe.translating.web.connector import FetchedPage
+from tests.localGlosbe import load_page
+
+TABLE_COPIES = 20
+ROUNDS = 20
+
+
+def get_large_page() -> str:
+	fragment = load_page('conjugation', word='mieć')
+	head, rest = fragment.split('<table', 1)
+	tables, tail = rest.rsplit('</table>', 1)
+	return head + ('<table' + tables + '</table>') * TABLE_COPIES + tail
+
+
+def filter_after_parsing(page: FetchedPage, selection: str) -> list:
+	tables = list(ConjugationParser(page).parse())
+	if selection == TableSelections.FIRST:
+		return list(islice(tables, 1))
+	return tables[len(tables) // 2:]
+
+
+def parse_selected(page: FetchedPage, selection: str) -> list:
+	return list(ConjugationParser(page, selection=selection).parse())
+
+
+def measure(parse, page: FetchedPage, selection: str) -> float:
+	start = time.perf_counter()
+	for _ in range(ROUNDS):
+		parse(page, selection)
+	return (time.perf_counter() - start) / ROUNDS
+
+
+def main():
+	page = FetchedPage(content=get_large_page().encode('utf-8'))
+	print(f'{2 * TABLE_COPIES} tables, {len(page.text) / 1024:.0f} KiB')
+	for flag, selection in (('-c', TableSelections.FIRST), ('-cc', TableSelections.SECOND_HALF)):
+		assert filter_after_parsing(page, selection) == parse_selected(page, selection)
+		before = measure(filter_after_parsing, page, selection)
+		after = measure(parse_selected, page, selection)
+		print(f'{flag:>3}: all tables then filtered {before * 1000:6.2f} ms, selected only {after * 1000:6.2f} ms ({before / after:.1f}x)')
+
+
+if __name__ == '__main__':
+	main()
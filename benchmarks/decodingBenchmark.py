@@ -0,0 +1,46 @@
+import time
+
+import requests
+
+from benchmarks.parsingCorpus import load_corpus
+from src.glosbe.translating.parsing.parsing import AbstractParserBackend, SoupParserBackend, LxmlParserBackend
+
+ROUNDS = 10
+
+
+def to_response(page: str, encoding: str | None) -> requests.Response:
+	response = requests.Response()
+	response.status_code = 200
+	response._content = page.encode('utf-8')
+	response.encoding = encoding
+	return response
+
+
+def measure(parse, backend: AbstractParserBackend, corpus: list[str], encoding: str | None) -> float:
+	start = time.perf_counter()
+	for _ in range(ROUNDS):
+		for page in corpus:
+			list(parse(backend, to_response(page, encoding)))
+	return (time.perf_counter() - start) / ROUNDS / len(corpus)
+
+
+def parse_text(backend: AbstractParserBackend, response: requests.Response):
+	return backend.parse_translations(response.text)
+
+
+def parse_bytes(backend: AbstractParserBackend, response: requests.Response):
+	return backend.parse_translations(response.content, response.encoding)
+
+
+def main():
+	corpus = load_corpus()
+	print(f'{len(corpus)} pages, {sum(map(len, corpus)) / len(corpus) / 1024:.0f} KiB on average')
+	for backend in (LxmlParserBackend(), SoupParserBackend()):
+		for encoding, header in (('utf-8', 'declared charset'), (None, 'no charset')):
+			text = measure(parse_text, backend, corpus, encoding)
+			content = measure(parse_bytes, backend, corpus, encoding)
+			print(f'{type(backend).__name__:>17}, {header + ":":<17} response.text {text * 1000:6.2f} ms/page, bytes {content * 1000:6.2f} ms/page ({text / content:.2f}x)')
+
+
+if __name__ == '__main__':
+	main()
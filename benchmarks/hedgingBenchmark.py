@@ -0,0 +1,70 @@
+import random
+import statistics
+import time
+from dataclasses import astuple
+from operator import sub
+
+from src.glosbe.translating.scrapping import Scrapper
+from src.glosbe.translating.web.connector import Connector
+from src.glosbe.translating.web.hedging import HedgingDefaults, HedgingStatistics
+from src.glosbe.translating.web.throttling import Throttle
+from tests.localGlosbe import LocalGlosbe
+
+REQUESTS = 1000
+WARM_UP = 5 * HedgingDefaults.MIN_SAMPLES
+FAST_LATENCY = 0.01
+SLOW_LATENCY = 0.5
+SLOW_PROBABILITY = 0.03
+
+
+def get_latency() -> float:
+	return SLOW_LATENCY if random.random() < SLOW_PROBABILITY else FAST_LATENCY * random.uniform(0.8, 1.5)
+
+
+def get_unlimited_throttle() -> Throttle:
+	return Throttle(rate=10_000, burst=10_000, max_rate=10_000)
+
+
+def translate(scrapper: Scrapper, words) -> list[float]:
+	latencies = []
+	for word in words:
+		start = time.perf_counter()
+		next(scrapper.scrap_translation('pl', 'de', word))
+		latencies.append(time.perf_counter() - start)
+	return latencies
+
+
+def measure(glosbe: LocalGlosbe, hedging: bool) -> tuple[list[float], int, HedgingStatistics | None]:
+	'''
+	The hedger gets its first samples in the warm-up, until then it waits for HedgingDefaults.INITIAL_DELAY before hedging
+	:return: the latencies, the number of requests Glosbe has got and the hedging statistics, all after the warm-up
+	'''
+	random.seed(0)
+	scrapper = Scrapper(Connector(throttle=get_unlimited_throttle()), hedging=hedging)
+	translate(scrapper, (f'warm{i}' for i in range(WARM_UP)))
+	requests_before, hedging_before = glosbe.requests_count, scrapper.get_hedging_statistics()
+	latencies = translate(scrapper, (f'piec{i}' for i in range(REQUESTS)))
+	hedging_after = scrapper.get_hedging_statistics()
+	scrapper.set_hedging(False)
+	if hedging_after is None:
+		return latencies, glosbe.requests_count - requests_before, None
+	return latencies, glosbe.requests_count - requests_before, HedgingStatistics(*map(sub, astuple(hedging_after), astuple(hedging_before)))
+
+
+def describe(name: str, latencies: list[float], requests_count: int) -> str:
+	quantiles = statistics.quantiles(latencies, n=100)
+	return (f'{name:>7}: p50 {quantiles[49] * 1000:6.1f} ms, p90 {quantiles[89] * 1000:6.1f} ms, p99 {quantiles[98] * 1000:6.1f} ms, '
+			f'mean {statistics.mean(latencies) * 1000:6.1f} ms, {requests_count} requests')
+
+
+def main():
+	print(f'{REQUESTS} sequential translations after {WARM_UP} for warming up, {SLOW_PROBABILITY:.0%} of responses delayed to {SLOW_LATENCY * 1000:.0f} ms')
+	with LocalGlosbe(latency=get_latency) as glosbe:
+		print(describe('plain', *measure(glosbe, hedging=False)[:2]))
+		latencies, requests_count, hedging = measure(glosbe, hedging=True)
+		print(describe('hedged', latencies, requests_count))
+		print(f'hedge rate {hedging.hedge_rate:.1%}, won by hedge {hedging.won_by_hedge}/{hedging.hedged}')
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,28 @@
+import time
+
+from benchmarks.parsingCorpus import load_corpus
+from src.glosbe.translating.parsing.parsing import AbstractParserBackend, SoupParserBackend, LxmlParserBackend
+
+ROUNDS = 20
+
+
+def measure(backend: AbstractParserBackend, corpus: list[str]) -> float:
+	start = time.perf_counter()
+	for _ in range(ROUNDS):
+		for page in corpus:
+			list(backend.parse_translations(page))
+			list(backend.parse_definitions(page))
+	return (time.perf_counter() - start) / ROUNDS / len(corpus)
+
+
+def main():
+	corpus = load_corpus()
+	print(f'{len(corpus)} pages, {sum(map(len, corpus)) / len(corpus) / 1024:.0f} KiB on average, translations and definitions per page')
+	soup = measure(SoupParserBackend(), corpus)
+	lxml = measure(LxmlParserBackend(), corpus)
+	print(f'BeautifulSoup: {soup * 1000:.2f} ms/page')
+	print(f'lxml:          {lxml * 1000:.2f} ms/page ({soup / lxml:.1f}x)')
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+
+from tests.localGlosbe import load_page
+
+WORDS = ['piec', 'dom', 'kot', 'pies', 'las', 'żółw', 'dać', 'mieć']
+TRANSLATION_COPIES = 12
+EXAMPLE_COPIES = 150
+
+
+def load_corpus() -> list[str]:
+	'''
+	Pages saved from glosbe in the directory given as the first argument,
+	or the test page inflated to the size of a real one when no directory is given
+	'''
+	if len(sys.argv) > 1:
+		return [path.read_text(encoding='utf-8') for path in sorted(Path(sys.argv[1]).glob('*.html'))]
+	return [inflate(load_page('translation', word=word, from_lang='pl', to_lang='de')) for word in WORDS]
+
+
+def inflate(page: str) -> str:
+	page = repeat_between(page, '<ul class="pr-1">', '</ul>', TRANSLATION_COPIES)
+	return repeat_between(page, '<section id="examples">', '</section>', EXAMPLE_COPIES)
+
+
+def repeat_between(page: str, start: str, end: str, copies: int) -> str:
+	head, rest = page.split(start, 1)
+	inner, tail = rest.split(end, 1)
+	return head + start + inner * copies + end + tail
@@ -0,0 +1,41 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.parsingCorpus import load_corpus
+from src.glosbe.translating.parsing.parsing import TranslationParser, SoupParserBackend
+from src.glosbe.translating.parsing.parsingPool import ParsingPool
+from src.glosbe.translating.web.connector import FetchedPage
+
+ROUNDS = 8
+
+
+def measure_threads(pages: list[FetchedPage], parser: TranslationParser) -> float:
+	def parse(page: FetchedPage) -> int:
+		return len(list(TranslationParser(page, backend=parser.backend).parse()))
+
+	start = time.perf_counter()
+	with ThreadPoolExecutor(max_workers=8) as executor:
+		records = sum(executor.map(parse, pages))
+	return records / (time.perf_counter() - start)
+
+
+def measure_pool(pages: list[FetchedPage], parser: TranslationParser, workers: int) -> float:
+	with ParsingPool(max_workers=workers) as pool:
+		start = time.perf_counter()
+		with ThreadPoolExecutor(max_workers=2 * workers) as executor:
+			records = sum(executor.map(lambda page: len(pool.parse(page, parser)), pages))
+		return records / (time.perf_counter() - start)
+
+
+def main():
+	pages = [FetchedPage(content=page.encode('utf-8')) for page in load_corpus()] * ROUNDS
+	parser = TranslationParser(backend=SoupParserBackend())
+	print(f'{len(pages)} pages parsed with BeautifulSoup, {os.cpu_count()} cores')
+	print(f'threads only: {measure_threads(pages, parser):8.0f} records/s')
+	for workers in range(1, (os.cpu_count() or 1) + 1):
+		print(f'{workers:2} workers:   {measure_pool(pages, parser, workers):8.0f} records/s')
+
+
+if __name__ == '__main__':
+	main()
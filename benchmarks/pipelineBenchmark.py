@@ -0,0 +1,47 @@
+import time
+import tracemalloc
+
+from src.glosbe.translating.scrapping import Scrapper
+from tests.localGlosbe import LocalGlosbe
+
+LATENCY = 0.01
+WORKERS = 8
+WORD_COUNTS = [250, 1000, 4000]
+
+
+def get_words(count: int) -> list[str]:
+	return [f'word{i}' for i in range(count)]
+
+
+def measure(translate, count: int) -> tuple[float, float]:
+	tracemalloc.start()
+	start = time.perf_counter()
+	for translation in translate(get_words(count)):
+		list(translation.records)
+	elapsed = time.perf_counter() - start
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	return elapsed, peak / 1024 / 1024
+
+
+def main():
+	print(f'pl -> de, {LATENCY * 1000:.0f} ms server latency, {WORKERS} fetching workers')
+	with LocalGlosbe(latency=LATENCY):
+		scrapper = Scrapper()
+		for count in WORD_COUNTS:
+			concurrent = measure(lambda words: scrapper.scrap_translation('pl', 'de', words, max_workers=WORKERS), count)
+			pipeline = None
+
+			def translate_pipelined(words: list[str]):
+				nonlocal pipeline
+				pipeline = scrapper.scrap_translation_pipelined('pl', 'de', words, fetch_workers=WORKERS)
+				return pipeline
+
+			pipelined = measure(translate_pipelined, count)
+			utilisation = ', '.join(f'{stage.name} {stage.utilisation:.0%}' for stage in pipeline.get_statistics())
+			print(f'{count:5} words: concurrent {concurrent[0]:5.2f} s, peak {concurrent[1]:5.1f} MiB | '
+				  f'pipelined {pipelined[0]:5.2f} s, peak {pipelined[1]:5.1f} MiB ({utilisation})')
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,37 @@
+import time
+import tracemalloc
+
+from benchmarks.parsingCorpus import load_corpus
+from src.glosbe.translating.parsing.parsing import SoupParserBackend
+
+ROUNDS = 10
+
+
+def measure_time(backend: SoupParserBackend, corpus: list[str]) -> float:
+	start = time.perf_counter()
+	for _ in range(ROUNDS):
+		for page in corpus:
+			list(backend.parse_translations(page))
+			list(backend.parse_definitions(page))
+	return (time.perf_counter() - start) / ROUNDS / len(corpus)
+
+
+def measure_peak_memory(backend: SoupParserBackend, page: str) -> int:
+	tracemalloc.start()
+	list(backend.parse_translations(page))
+	_, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return peak
+
+
+def main():
+	corpus = load_corpus()
+	print(f'{len(corpus)} pages, {sum(map(len, corpus)) / len(corpus) / 1024:.0f} KiB on average')
+	for name, backend in (('full tree', SoupParserBackend(is_straining=False)), ('strained', SoupParserBackend())):
+		elapsed = measure_time(backend, corpus)
+		peak = max(measure_peak_memory(backend, page) for page in corpus)
+		print(f'{name:>9}: {elapsed * 1000:7.2f} ms/page, peak {peak / 1024:7.0f} KiB per translation parse')
+
+
+if __name__ == '__main__':
+	main()
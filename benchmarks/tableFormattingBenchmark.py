@@ -0,0 +1,68 @@
+import time
+from itertools import product, islice, chain, count
+
+from pandas import DataFrame
+
+from benchmarks.conjugationBenchmark import get_large_page
+from src.glosbe.translating.parsing.parsing import ConjugationParser
+from src.glosbe.translating.web.connector import FetchedPage
+from src.glosbe.translatingPrinting.formatting import HeaderToDefaultFormatter, TrashRemovingFormatter, DuplicateRemoverTableFormatter, AbstractFormatter, CellTable
+
+ROW_COPIES = [1, 10, 100]
+ROUNDS = 5
+
+
+def remove_trash_by_cell(table: DataFrame) -> DataFrame:
+	for row, col in product(table.index, islice(table.columns, 3)):
+		if str(table.at[row, col]).startswith('Unnamed:'):
+			table.at[row, col] = list(islice(chain(AbstractFormatter.invisibles, count()), col + 1))[-1]
+	table.columns = list(map(lambda c: '' if str(c).startswith('Unnamed:') else c, iter(table.columns)))
+	return table
+
+
+def remove_duplicates_by_cell(table: DataFrame) -> DataFrame:
+	last = None
+	for row, col in product(range(len(table.index)), range(len(table.columns))):
+		curr = table.iloc[row, col]
+		if last is not None and curr == last:
+			table.iloc[row, col] = ''
+		else:
+			last = curr
+	return table
+
+
+def by_cell(table: DataFrame) -> DataFrame:
+	return remove_duplicates_by_cell(remove_trash_by_cell(table.copy()))
+
+
+def vectorised(table: DataFrame) -> CellTable:
+	return DuplicateRemoverTableFormatter.format(TrashRemovingFormatter.format(CellTable.from_frame(table)))
+
+
+def get_tables(row_copies: int) -> list[DataFrame]:
+	page = FetchedPage(content=get_large_page().encode('utf-8'))
+	tables = [HeaderToDefaultFormatter.format(CellTable.from_conjugation_table(table)) for table in ConjugationParser(page).parse()]
+	return [DataFrame(table.cells.tolist() * row_copies) for table in tables]
+
+
+def measure(format_table, tables: list[DataFrame]) -> float:
+	start = time.perf_counter()
+	for _ in range(ROUNDS):
+		for table in tables:
+			format_table(table)
+	return (time.perf_counter() - start) / ROUNDS
+
+
+def main():
+	for row_copies in ROW_COPIES:
+		tables = get_tables(row_copies)
+		for table in tables:
+			assert by_cell(table).equals(vectorised(table).to_frame())
+		cells = sum(table.size for table in tables)
+		before = measure(by_cell, tables)
+		after = measure(vectorised, tables)
+		print(f'{len(tables)} tables, {cells:7} cells: cell by cell {before * 1000:8.2f} ms, vectorised {after * 1000:7.2f} ms ({before / after:.1f}x)')
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,124 @@
+import time
+import tracemalloc
+from itertools import islice, chain, count
+
+import numpy as np
+import pandas as pd
+from more_itertools import split_when
+from pandas import DataFrame, MultiIndex
+from tabulate import tabulate
+
+from benchmarks.conjugationBenchmark import get_large_page
+from src.glosbe.translating.parsing.parsing import ConjugationParser
+from src.glosbe.translating.parsing.tableExtraction import ConjugationTable
+from src.glosbe.translating.web.connector import FetchedPage
+from src.glosbe.translatingPrinting.formatting import TableFormatter, AbstractFormatter
+
+ROW_COPIES = [1, 10, 100]
+ROUNDS = 5
+
+
+def to_default_header(table: DataFrame) -> DataFrame:
+	if len(table.columns) >= 2 and (str(table.iloc[0, 0]) + str(table.iloc[0, 1]) == '01' or isinstance(table.columns, MultiIndex)):
+		table = pd.concat([table.columns.to_frame().T, table], ignore_index=True)
+		table.columns = range(len(table.columns))
+	return table
+
+
+def remove_trash(table: DataFrame) -> DataFrame:
+	trash = np.char.startswith(table.iloc[:, :3].to_numpy(dtype=object).astype(str), 'Unnamed:')
+	for i in np.flatnonzero(trash.any(axis=0)):
+		table.iloc[trash[:, i], i] = list(islice(chain(AbstractFormatter.invisibles, count()), table.columns[i] + 1))[-1]
+	table.columns = ['' if str(c).startswith('Unnamed:') else c for c in table.columns]
+	return table
+
+
+def remove_duplicates(table: DataFrame) -> DataFrame:
+	values = table.to_numpy(dtype=object)
+	cells = values.ravel()
+	is_duplicate = np.zeros(len(cells), dtype=bool)
+	is_duplicate[1:] = np.not_equal(cells[:-1], None) & (cells[1:] == cells[:-1])
+	is_duplicate = is_duplicate.reshape(values.shape)
+	for i in np.flatnonzero(is_duplicate.any(axis=0)):
+		table.iloc[is_duplicate[:, i], i] = ''
+	return table
+
+
+def split(table: DataFrame):
+	current = []
+	for row in table.values.tolist():
+		if any(row):
+			current.append(row)
+			continue
+		yield from split_when(current, lambda row1, row2: row1[0] and row1[0] != row2[0])
+		current = []
+	yield from split_when(current, lambda row1, row2: row1[0] and row1[0] != row2[0])
+
+
+def merge(tables):
+	merged = None
+	for table in tables:
+		if (len([v for v in table.iloc[:, 0] if v]) == 1) and (merged is None or len(table.columns) == len(merged.columns)):
+			merged = table if merged is None else pd.concat([merged, table], ignore_index=True)
+		else:
+			if merged is not None:
+				yield merged
+			merged = None
+			yield table
+	if merged is not None:
+		yield merged
+
+
+def adjust_size(table: DataFrame) -> DataFrame:
+	df = pd.DataFrame(table, columns=table.columns)
+	df.replace('', np.nan, inplace=True)
+	df.dropna(how='all', axis=1, inplace=True)
+	df.replace(np.nan, '', inplace=True)
+	return df
+
+
+def format_with_frames(table: ConjugationTable) -> list[DataFrame]:
+	'''
+	The formatting as it was before, with a DataFrame built for every step
+	'''
+	table = remove_duplicates(remove_trash(to_default_header(table.to_frame())))
+	tables = (pd.DataFrame(part, columns=range(len(part[0]))) for part in split(table))
+	return [adjust_size(table).pipe(lambda df: df.set_index(df.columns.array[0])) for table in merge(tables)]
+
+
+def format_with_cells(table: ConjugationTable) -> list:
+	return list(TableFormatter.format(table))
+
+
+def get_tables(row_copies: int) -> list[ConjugationTable]:
+	page = FetchedPage(content=get_large_page().encode('utf-8'))
+	return [ConjugationTable(table.header, table.rows * row_copies) for table in ConjugationParser(page).parse()]
+
+
+def measure(format_tables, tables: list[ConjugationTable]) -> tuple[float, float]:
+	tracemalloc.start()
+	format_tables(tables)
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	start = time.perf_counter()
+	for _ in range(ROUNDS):
+		format_tables(tables)
+	return (time.perf_counter() - start) / ROUNDS, peak / 1024 / 1024
+
+
+def main():
+	for row_copies in ROW_COPIES:
+		tables = get_tables(row_copies)
+		for table in tables:
+			with_frames = [tabulate(frame, tablefmt='rounded_outline') for frame in format_with_frames(table)]
+			with_cells = [TableFormatter.format_into_string(cells) for cells in format_with_cells(table)]
+			assert with_frames == with_cells
+		cells = sum(len(table.rows) * len(table.rows[0]) for table in tables)
+		before, before_peak = measure(lambda tables: [format_with_frames(table) for table in tables], tables)
+		after, after_peak = measure(lambda tables: [format_with_cells(table) for table in tables], tables)
+		print(f'{len(tables)} tables, {cells:7} cells: DataFrames {before * 1000:7.2f} ms, peak {before_peak:5.1f} MiB | '
+			  f'cell matrix {after * 1000:7.2f} ms, peak {after_peak:5.1f} MiB ({before / after:.1f}x)')
+
+
+if __name__ == '__main__':
+	main()
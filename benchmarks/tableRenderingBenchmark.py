@@ -0,0 +1,46 @@
+import time
+
+import tabulate as tabulating
+from tabulate import tabulate
+
+from benchmarks.conjugationBenchmark import get_large_page
+from src.glosbe.translating.parsing.parsing import ConjugationParser
+from src.glosbe.translating.parsing.tableExtraction import ConjugationTable
+from src.glosbe.translating.web.connector import FetchedPage
+from src.glosbe.translatingPrinting.formatting import TableFormatter
+from src.glosbe.translatingPrinting.tableRendering import RoundedOutlineRenderer
+
+WORDS = ['mieć', 'делать', '做']
+ROW_COPIES = [1, 10, 100]
+ROUNDS = 5
+
+
+def get_tables(word: str, row_copies: int) -> list[list[list]]:
+	page = FetchedPage(content=get_large_page().replace('mieć', word).encode('utf-8'))
+	tables = [ConjugationTable(table.header, table.rows * row_copies) for table in ConjugationParser(page).parse()]
+	return [table.to_rows() for table in TableFormatter.format_many(tables)]
+
+
+def measure(render, tables: list[list[list]]) -> float:
+	start = time.perf_counter()
+	for _ in range(ROUNDS):
+		for rows in tables:
+			render(rows)
+	return (time.perf_counter() - start) / ROUNDS
+
+
+def main():
+	print(f'wide characters {"on" if tabulating.WIDE_CHARS_MODE else "off (wcwidth is not installed)"}')
+	for word in WORDS:
+		for row_copies in ROW_COPIES:
+			tables = get_tables(word, row_copies)
+			for rows in tables:
+				assert tabulate(rows, tablefmt='rounded_outline') == RoundedOutlineRenderer.render(rows)
+			cells = sum(len(rows) * len(rows[0]) for rows in tables)
+			before = measure(lambda rows: tabulate(rows, tablefmt='rounded_outline'), tables)
+			after = measure(RoundedOutlineRenderer.render, tables)
+			print(f'{word:>6}, {len(tables)} tables, {cells:6} cells: tabulate {before * 1000:7.2f} ms, renderer {after * 1000:6.2f} ms ({before / after:.1f}x)')
+
+
+if __name__ == '__main__':
+	main()
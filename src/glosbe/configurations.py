@@ -10,6 +10,7 @@ from more_itertools import partition
 from .constants import FLAGS
 from .layoutAdjusting.layoutAdjuster import LayoutAdjustmentsMethods
 from .translating.scrapping import TranslationTypes
+from .translatingPrinting.formatting import OutputFormats
 from .translatingPrinting.translationPrinter import TranslationPrinter
 
 C = FLAGS.CONFIGURATIONAL
@@ -27,6 +28,7 @@ class Paths:
 class ConfigMessages:
     LANGUAGE_IN_SAVED: str = 'Language {} is already saved'
     LANGUAGE_NOT_IN_SAVED: str = 'Language {} has not been in saved'
+    WRONG_OUTPUT_FORMAT: str = 'Output format {} does not exist, the possible ones are: {}'
 
 
 class Configurations:
@@ -41,6 +43,9 @@ class Configurations:
         C.LAYOUT_ADJUSTMENT_METHOD_LONG_FLAG: LayoutAdjustmentsMethods.NONE,
         C.LAYOUT_ADJUSTMENT_LANG_LONG_FLAG: '',
         C.DOUBLE_MODE_STYLE_LONG_FLAG: TranslationTypes.LANG,
+        C.MAX_WORKERS_LONG_FLAG: 4,
+        C.MAX_RECORDS_LONG_FLAG: 0,
+        C.OUTPUT_FORMAT_LONG_FLAG: OutputFormats.TEXT,
     }
 
     @classmethod
@@ -159,6 +164,25 @@ class Configurations:
     def get_adjustment_lang(cls) -> str:
         return cls.get_conf(C.LAYOUT_ADJUSTMENT_LANG_LONG_FLAG)
 
+    @classmethod
+    def get_max_workers(cls) -> int:
+        return int(cls.get_conf(C.MAX_WORKERS_LONG_FLAG))
+
+    @classmethod
+    def get_max_records(cls) -> int | None:
+        '''
+        :return: the number of records to show for each translation, None if all of them
+        '''
+        return int(cls.get_conf(C.MAX_RECORDS_LONG_FLAG)) or None
+
+    @classmethod
+    def get_output_format(cls) -> str:
+        '''
+        :return: one of OutputFormats, text for the formatting for reading and if the saved one does not exist
+        '''
+        output_format = cls.get_conf(C.OUTPUT_FORMAT_LONG_FLAG)
+        return output_format if output_format in OutputFormats.get_formats() else OutputFormats.TEXT
+
     @classmethod
     def load_config_languages_by_limit(cls, *to_skips: str, limit=None) -> Iterable[str]:
         if limit is None:
@@ -37,10 +37,18 @@ class FLAGS:
         ADD_LANG_SHORT_FLAG = '-al'
         REMOVE_LANG_LONG_FLAG = '--remove-lang'
         REMOVE_LANG_SHORT_FLAG = '-rl'
+        MAX_WORKERS_LONG_FLAG = '--max-workers'
+        MAX_WORKERS_SHORT_FLAG = '-mw'
+        MAX_RECORDS_LONG_FLAG = '--max-records'
+        MAX_RECORDS_SHORT_FLAG = '-mr'
+        OUTPUT_FORMAT_LONG_FLAG = '--output-format'
+        OUTPUT_FORMAT_SHORT_FLAG = '-of'
 
     @dataclass(frozen=True)
     class FUNCTIONAL:
         SILENT_LONG_FLAG = '--silent'
+        PACED_LONG_FLAG = '--paced'
+        HEDGING_LONG_FLAG = '--hedging'
         REVERSE_LONG_FLAG = '--reverse'
         REVERSE_SHORT_FLAG = '-r'
         SYNOPSIS_LONG_FLAG = '--synopsis'
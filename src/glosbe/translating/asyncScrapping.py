@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import traceback
+from typing import AsyncIterator
+
+import aiohttp
+
+from .parsing.parsing import TranslationParser, Record, WrongStatusCodeError, ConjugationParser, AbstractParser, DefinitionParser, Definition
+from .scrapping import TranslationResult, ErrorMessages, get_product, get_status_code_message, ConjugationScrapper
+from .web.connector import Connector, TransArgs, FetchedPage, TranslatorArgumentException
+
+
+class AsyncScrapper:
+    '''
+    asyncio counterpart of Scrapper. Pages are fetched with aiohttp and parsed with the same parsers
+    in the default executor of the loop, so many lookups can be in flight without the parsing holding the loop up:
+
+        async with AsyncScrapper() as scrapper:
+            async for translation in scrapper.scrap_translation('pl', ['de', 'es'], ['piec', 'dom']):
+                ...
+    '''
+
+    def __init__(self, max_connections: int = 100):
+        self._max_connections = max_connections
+        self._session: aiohttp.ClientSession | None = None
+
+    async def __aenter__(self) -> AsyncScrapper:
+        self._get_session()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._max_connections)
+            self._session = aiohttp.ClientSession(connector=connector, headers=Connector._get_default_headers())
+        return self._session
+
+    async def _get_page(self, url: str) -> FetchedPage:
+        async with self._get_session().get(url, allow_redirects=True) as response:
+            return FetchedPage(response.status, await response.read(), response.charset)
+
+    async def scrap_translation(self, from_lang: str, to_langs: list[str, ...] | str, words: list[str, ...] | str, by_word=False) -> AsyncIterator[TranslationResult]:
+        if isinstance(words, str):
+            words = [words]
+        if isinstance(to_langs, str):
+            to_langs = [to_langs]
+        langs_words = get_product(to_langs, words, by_word)
+        tasks = [asyncio.ensure_future(self.translate_single(from_lang, to_lang, word)) for to_lang, word in langs_words]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def translate_single(self, from_lang: str, to_lang: str, word: str) -> TranslationResult:
+        trans_args = TransArgs(from_lang, to_lang, word)
+        try:
+            records = await self._translate_from_url(trans_args)
+        except TranslatorArgumentException:
+            logging.exception(f'Exception: Invalid argument {str(trans_args)}')
+            records = [Record(ErrorMessages.INVALID_ARGUMENT.format(str(trans_args)))]
+        return TranslationResult(trans_args, records)
+
+    async def _translate_from_url(self, trans_args: TransArgs) -> list[Record]:
+        try:
+            page = await self._get_page(trans_args.to_url())
+            return await self._parse(TranslationParser(page))
+        except WrongStatusCodeError as err:
+            logging.error(f'{err.page.status_code}: {err.page.text}')
+            return [Record(get_status_code_message(err.page.status_code, trans_args))]
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            logging.exception(traceback.format_exc())
+            return [Record(ErrorMessages.CONNECTION_ERROR)]
+
+    async def scrap_conjugation(self, lang: str, word: str) -> AsyncIterator:
+        page = await self._get_page(ConjugationScrapper.get_conjugation_url(lang, word))
+        for table in await self._parse(ConjugationParser(page)):
+            yield table
+
+    async def scrap_definition(self, lang: str, word: str) -> AsyncIterator[Definition]:
+        page = await self._get_page(TransArgs(lang, lang, word).to_url())
+        for definition in await self._parse(DefinitionParser(page)):
+            yield definition
+
+    @staticmethod
+    async def _parse(parser: AbstractParser) -> list:
+        return await asyncio.get_running_loop().run_in_executor(None, lambda: list(parser.parse()))
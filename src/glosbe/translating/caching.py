@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, astuple, asdict
+from pathlib import Path
+from typing import Any, Callable, Hashable
+
+import requests
+
+from .coalescing import SingleFlight
+from .parsing.parsing import Record, Definition
+from .parsing.tableExtraction import ConjugationTable
+from .web.connector import TransArgs
+
+
+@dataclass(frozen=True)
+class CacheDefaults:
+    FILE_NAME = 'cache.sqlite'
+    TTL = 7 * 24 * 60 * 60
+    MAX_ENTRIES = 10_000
+    CONJUGATION_TTL = 90 * 24 * 60 * 60
+    CONJUGATION_MAX_ENTRIES = 2_000
+    DEFINITION_TTL = 30 * 24 * 60 * 60
+    DEFINITION_MAX_ENTRIES = 5_000
+    DOCUMENT_MAX_ENTRIES = 32
+    DOCUMENT_TTL = 5 * 60
+
+
+class AbstractSqliteCache(ABC):
+    '''
+    Key-value cache in an SQLite table with time-to-live and least recently used eviction
+    '''
+
+    _table: str
+
+    def __init__(self, path: Path, ttl: float = CacheDefaults.TTL, max_entries: int = CacheDefaults.MAX_ENTRIES):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute(f'CREATE TABLE IF NOT EXISTS {self._table} (key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)')
+        self._connection.execute(f'CREATE INDEX IF NOT EXISTS {self._table}_accessed ON {self._table} (accessed)')
+        self._size = self._connection.execute(f'SELECT COUNT(*) FROM {self._table}').fetchone()[0]
+
+    def get(self, key: Any) -> Any | None:
+        key = self._to_key(key)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(f'SELECT value, created FROM {self._table} WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            value, created = row
+            if now - created > self._ttl:
+                self._connection.execute(f'DELETE FROM {self._table} WHERE key = ?', (key,))
+                self._size -= 1
+                return None
+            self._connection.execute(f'UPDATE {self._table} SET accessed = ? WHERE key = ?', (now, key))
+        return self._deserialize(json.loads(value))
+
+    def set(self, key: Any, value: Any) -> None:
+        key = self._to_key(key)
+        value = json.dumps(self._serialize(value), ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            is_new = self._connection.execute(f'SELECT 1 FROM {self._table} WHERE key = ?', (key,)).fetchone() is None
+            self._connection.execute(f'INSERT OR REPLACE INTO {self._table} VALUES (?, ?, ?, ?)', (key, value, now, now))
+            self._size += is_new
+            if self._size > self._max_entries:
+                self._evict(self._size - self._max_entries)
+
+    def _evict(self, count: int) -> None:
+        self._connection.execute(f'DELETE FROM {self._table} WHERE key IN (SELECT key FROM {self._table} ORDER BY accessed LIMIT ?)', (count,))
+        self._size -= count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute(f'DELETE FROM {self._table}')
+            self._size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @abstractmethod
+    def _to_key(self, key: Any) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _serialize(self, value: Any) -> Any:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _deserialize(self, value: Any) -> Any:
+        raise NotImplementedError
+
+
+class TranslationCache(AbstractSqliteCache):
+
+    _table = 'translations'
+
+    def _to_key(self, trans_args: TransArgs) -> str:
+        return f'{trans_args.from_lang}/{trans_args.to_lang}/{trans_args.word}'
+
+    def _serialize(self, records: list[Record]) -> list:
+        return list(map(astuple, records))
+
+    def _deserialize(self, records: list) -> list[Record]:
+        return [Record(*record) for record in records]
+
+
+class ConjugationCache(AbstractSqliteCache):
+
+    _table = 'conjugation_tables'
+
+    def __init__(self, path: Path, ttl: float = CacheDefaults.CONJUGATION_TTL, max_entries: int = CacheDefaults.CONJUGATION_MAX_ENTRIES):
+        super().__init__(path, ttl, max_entries)
+
+    def _to_key(self, lang_word_selection: tuple[str, ...]) -> str:
+        return '/'.join(lang_word_selection)
+
+    def _serialize(self, tables: list[ConjugationTable]) -> list:
+        return list(map(asdict, tables))
+
+    def _deserialize(self, tables: list) -> list[ConjugationTable]:
+        return [ConjugationTable(**table) for table in tables]
+
+
+class DefinitionCache(AbstractSqliteCache):
+
+    _table = 'definitions'
+
+    def __init__(self, path: Path, ttl: float = CacheDefaults.DEFINITION_TTL, max_entries: int = CacheDefaults.DEFINITION_MAX_ENTRIES):
+        super().__init__(path, ttl, max_entries)
+
+    def _to_key(self, lang_to_lang_word: tuple[str, str, str]) -> str:
+        return '/'.join(lang_to_lang_word)
+
+    def _serialize(self, definitions: list[Definition]) -> list:
+        return list(map(astuple, definitions))
+
+    def _deserialize(self, definitions: list) -> list[Definition]:
+        return [Definition(*definition) for definition in definitions]
+
+
+@dataclass
+class ParsedPage:
+    page: requests.Response
+    document: Any = None
+
+
+class DocumentCache:
+    '''
+    In-memory cache of the parsed pages of a single invocation, so that all the items of a page
+    are extracted from one download and one parsing. A page that is being loaded is waited for instead of loaded again.
+    Only the pages fetched successfully are kept, and for no longer than ttl seconds
+    '''
+
+    def __init__(self, max_entries: int = CacheDefaults.DOCUMENT_MAX_ENTRIES, ttl: float = CacheDefaults.DOCUMENT_TTL):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._pages: OrderedDict[Hashable, tuple[float, ParsedPage]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._single_flight = SingleFlight()
+
+    def get(self, key: Hashable, load: Callable[[], ParsedPage]) -> ParsedPage:
+        with self._lock:
+            if (entry := self._pages.get(key)) is not None:
+                created, page = entry
+                if time.monotonic() - created <= self._ttl:
+                    self._pages.move_to_end(key)
+                    return page
+                del self._pages[key]
+        return self._single_flight.do(key, lambda: self._set(key, load()))
+
+    def _set(self, key: Hashable, page: ParsedPage) -> ParsedPage:
+        if page.page.status_code != 200:
+            return page
+        with self._lock:
+            self._pages[key] = time.monotonic(), page
+            if len(self._pages) > self._max_entries:
+                self._pages.popitem(last=False)
+        return page
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+
+    def __len__(self) -> int:
+        return len(self._pages)
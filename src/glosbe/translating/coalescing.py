@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Hashable
+
+
+@dataclass
+class CoalescingStatistics:
+    issued: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    '''
+    Runs a call once per key at a time: callers asking for a key that is already in flight
+    wait for the running call and share its result instead of issuing their own
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future] = {}
+        self._statistics = CoalescingStatistics()
+
+    def do(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._in_flight[key] = Future()
+                self._statistics.issued += 1
+            else:
+                self._statistics.coalesced += 1
+
+        if not is_leader:
+            return future.result()
+        try:
+            result = call()
+            future.set_result(result)
+            return result
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def mark_coalesced(self) -> None:
+        with self._lock:
+            self._statistics.coalesced += 1
+
+    def get_statistics(self) -> CoalescingStatistics:
+        with self._lock:
+            return replace(self._statistics)
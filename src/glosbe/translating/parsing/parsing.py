@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import codecs
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
-from typing import Iterable
+from html.parser import HTMLParser
+from itertools import islice
+from typing import Iterable, Callable, Any
 
-import pandas as pd
 import requests
-from bs4 import BeautifulSoup, NavigableString
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
 from bs4.element import Tag
 
+from .tableExtraction import TableExtractor, ConjugationTable, find_tables
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:
+    etree = lxml_html = None
+
 
 class WrongStatusCodeError(ConnectionError):
     def __init__(self, page: requests.Response, *args):
@@ -32,32 +43,93 @@ class Definition:
     example: str = ''
 
 
-class AbstractParser(ABC):
+@dataclass(frozen=True)
+class Selectors:
+    TRANSLATION_CLASS = 'inline leading-10'
+    DEFINITION_CLASS = 'pb-2'
+    EXAMPLES_TO_SKIP = ('adjective', 'verb', 'noun')
+    ASCII_SPACES = ' \n\t\x0c\r'
 
-    def __init__(self, page: requests.Response = None, **kwargs):
-        self._page = page
 
-    def set_page(self, page: requests.Response):
-        self._page = page
+def collapse_blank(text: str) -> str:
+    '''
+    Turns a whitespace-only string into a single newline or space, the way BeautifulSoup does
+    '''
+    if not text or text.strip(Selectors.ASCII_SPACES):
+        return text
+    return '\n' if '\n' in text else ' '
 
-    def parse(self):
-        if self._page.status_code != 200:
-            raise WrongStatusCodeError(self._page)
-        yield from self._parse()
+
+class AbstractParserBackend(ABC):
+    '''
+    Extracts the records and the definitions from a glosbe page, given either as text or as the raw bytes with their encoding,
+    or from a document built once with get_document when both are needed from the same page
+    '''
 
     @abstractmethod
-    def _parse(self):
-        raise NotImplemented
+    def parse_translations(self, text: str | bytes, encoding: str = None) -> Iterable[Record]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def parse_definitions(self, text: str | bytes, encoding: str = None) -> Iterable[Definition]:
+        raise NotImplementedError
 
+    @abstractmethod
+    def get_document(self, text: str | bytes, encoding: str = None) -> Any:
+        raise NotImplementedError
 
-class TranslationParser(AbstractParser):
+    @abstractmethod
+    def extract_translations(self, document: Any) -> Iterable[Record]:
+        raise NotImplementedError
 
-    def __init__(self, page: requests.Response = None, **kwargs):
-        super().__init__(page, **kwargs)
+    @abstractmethod
+    def extract_definitions(self, document: Any) -> Iterable[Definition]:
+        raise NotImplementedError
 
-    def _parse(self) -> Iterable[Record]:
-        soup = BeautifulSoup(self._page.text, features="html.parser")
-        trans_elems = soup.find_all('div', {'class': 'inline leading-10'})
+    @staticmethod
+    def _clean_definition_text(text: str) -> str:
+        return text\
+            .removeprefix('\n')\
+            .removesuffix('\n')\
+            .replace('\n\n', ' ')\
+            .replace('\n', ' ')\
+            .removeprefix(' ')\
+            .removeprefix(' ')
+
+    @staticmethod
+    def _clean_example(example: str) -> str:
+        return '' if example in Selectors.EXAMPLES_TO_SKIP else example
+
+
+class SoupParserBackend(AbstractParserBackend):
+    '''
+    Builds only the subtrees of the translation or definition blocks unless is_straining is turned off
+    '''
+
+    @staticmethod
+    def _is_class(*class_names: str) -> Callable[[str | None], bool]:
+        return lambda value: value is not None and ' '.join(value.split()) in class_names
+
+    _translation_strainer = SoupStrainer('div', {'class': _is_class(Selectors.TRANSLATION_CLASS)})
+    _definition_strainer = SoupStrainer('li', {'class': _is_class(Selectors.DEFINITION_CLASS)})
+    _document_strainer = SoupStrainer(['div', 'li'], {'class': _is_class(Selectors.TRANSLATION_CLASS, Selectors.DEFINITION_CLASS)})
+
+    def __init__(self, is_straining: bool = True):
+        self._is_straining = is_straining
+
+    def _get_soup(self, text: str | bytes, encoding: str | None, strainer: SoupStrainer) -> BeautifulSoup:
+        if isinstance(text, bytes):
+            text = text.decode(encoding or 'utf-8', errors='replace')  # html.parser takes only str, decoding here skips the encoding detection of bs4
+        return BeautifulSoup(text, features="html.parser", parse_only=strainer if self._is_straining else None)
+
+    def get_document(self, text: str | bytes, encoding: str = None) -> BeautifulSoup:
+        return self._get_soup(text, encoding, self._document_strainer)
+
+    def parse_translations(self, text: str | bytes, encoding: str = None) -> Iterable[Record]:
+        return self.extract_translations(self._get_soup(text, encoding, self._translation_strainer))
+
+    def extract_translations(self, soup: BeautifulSoup) -> Iterable[Record]:
+        trans_elems = soup.find_all('div', {'class': Selectors.TRANSLATION_CLASS})
         actual_trans = filter(lambda trans_elem: trans_elem.select_one('h3'), trans_elems)
         records = map(self._parse_single_translation_tag, actual_trans)
         return records
@@ -85,33 +157,11 @@ class TranslationParser(AbstractParser):
     def _get_ith(self, items: list[Tag, ...], i: int):
         return items[i].text if len(items) > i else ''
 
+    def parse_definitions(self, text: str | bytes, encoding: str = None) -> Iterable[Definition]:
+        return self.extract_definitions(self._get_soup(text, encoding, self._definition_strainer))
 
-class ConjugationParser(AbstractParser):
-    def __init__(self, page: requests.Response = None, **kwargs):
-        super().__init__(page, **kwargs)
-
-    def _parse(self):
-        try:
-            return pd.read_html(self._page.text, keep_default_na=False, header=None)
-        except ValueError as e:
-            match e.args[0]:
-                case "invalid literal for int() with base 10: '100%'":
-                    return [pd.DataFrame({'Error': []})]
-                case "No tables found":
-                    #TODO: implement error printing
-                    return [pd.DataFrame({'Error': [e.args[0]]})]
-                case _:
-                    raise e
-
-
-class DefinitionParser(AbstractParser):
-
-    def __init__(self, page: requests.Response = None, **kwargs):
-        super().__init__(page, **kwargs)
-
-    def _parse(self):
-        soup = BeautifulSoup(self._page.text, features="html.parser")
-        definitions_nodes = soup.find_all('li', {'class': 'pb-2'})
+    def extract_definitions(self, soup: BeautifulSoup) -> Iterable[Definition]:
+        definitions_nodes = soup.find_all('li', {'class': Selectors.DEFINITION_CLASS})
         definitions = map(self._parse_definition, definitions_nodes)
         return definitions
 
@@ -122,17 +172,294 @@ class DefinitionParser(AbstractParser):
 
     def _parse_definition_text(self, definition_tag: Tag) -> str:
         core_content = ''.join((content for content in definition_tag.contents if isinstance(content, (NavigableString, str))))
-        return core_content\
-            .removeprefix('\n')\
-            .removesuffix('\n')\
-            .replace('\n\n', ' ')\
-            .replace('\n', ' ')\
-            .removeprefix(' ')\
-            .removeprefix(' ')
+        return self._clean_definition_text(core_content)
 
     def _parse_example(self, definition_tag: Tag) -> str:
         example_tag = definition_tag.select_one('div', {'class': 'border-l-2 pl-2 border-gray-200 text-gray-600 '})
         example = example_tag.text.replace('\n', '') if example_tag else ''
-        if any((to_skip == example for to_skip in ('adjective', 'verb', 'noun'))):
-            return ''
-        return example
\ No newline at end of file
+        return self._clean_example(example)
+
+
+class LxmlParserBackend(AbstractParserBackend):
+    '''
+    Walks the lxml tree with precompiled XPath expressions, each block is located in a single pass over the page
+    '''
+
+    _translation_blocks = etree.XPath(f'//div[normalize-space(@class)="{Selectors.TRANSLATION_CLASS}"][.//h3]') if etree else None
+    _first_h3 = etree.XPath('(.//h3)[1]') if etree else None
+    _inner_spans = etree.XPath('(.//span)[1]//span') if etree else None
+    _definition_blocks = etree.XPath(f'//li[normalize-space(@class)="{Selectors.DEFINITION_CLASS}"]') if etree else None
+    _own_texts = etree.XPath('text()') if etree else None
+    _texts = etree.XPath('.//text()') if etree else None
+    _first_div = etree.XPath('(.//div)[1]') if etree else None
+    _local = threading.local()
+
+    def get_document(self, text: str | bytes, encoding: str = None):
+        return self._get_tree(text, encoding)
+
+    def parse_translations(self, text: str | bytes, encoding: str = None) -> Iterable[Record]:
+        return self.extract_translations(self._get_tree(text, encoding))
+
+    def extract_translations(self, tree) -> Iterable[Record]:
+        return map(self._parse_translation_block, self._translation_blocks(tree))
+
+    def _parse_translation_block(self, block) -> Record:
+        translation = self._get_text(self._first_h3(block)[0]).replace('\n', '')
+        spans = [self._get_text(span) for span in self._inner_spans(block)[:2]]
+        spans += [''] * (2 - len(spans))
+        return Record(translation, *spans)
+
+    def parse_definitions(self, text: str | bytes, encoding: str = None) -> Iterable[Definition]:
+        return self.extract_definitions(self._get_tree(text, encoding))
+
+    def extract_definitions(self, tree) -> Iterable[Definition]:
+        return map(self._parse_definition_block, self._definition_blocks(tree))
+
+    def _parse_definition_block(self, block) -> Definition:
+        definition_text = self._clean_definition_text(''.join(map(collapse_blank, self._own_texts(block))))
+        example_divs = self._first_div(block)
+        example = self._get_text(example_divs[0]).replace('\n', '') if example_divs else ''
+        return Definition(definition_text, self._clean_example(example))
+
+    def _get_text(self, element) -> str:
+        return ''.join(map(collapse_blank, self._texts(element)))
+
+    @classmethod
+    def _get_tree(cls, text: str | bytes, encoding: str = None):
+        if not text or text.isspace():
+            return lxml_html.Element('html')
+        if isinstance(text, bytes) and encoding:
+            return lxml_html.document_fromstring(text, parser=cls._get_html_parser(encoding))
+        return lxml_html.document_fromstring(text)
+
+    @classmethod
+    def _get_html_parser(cls, encoding: str):
+        '''
+        lxml parsers are costly to create and cannot be shared between threads, so each thread keeps its own one per encoding
+        '''
+        parsers = cls._local.__dict__.setdefault('parsers', {})
+        if encoding not in parsers:
+            parsers[encoding] = lxml_html.HTMLParser(encoding=encoding)
+        return parsers[encoding]
+
+
+def get_default_backend() -> AbstractParserBackend:
+    return LxmlParserBackend() if etree is not None else SoupParserBackend()
+
+
+class AbstractParser(ABC):
+
+    def __init__(self, page: requests.Response = None, max_records: int = None, **kwargs):
+        '''
+        :param max_records: the parsing stops once that many items are yielded, no limit if not given
+        '''
+        self._page = page
+        self.max_records = max_records
+
+    def set_page(self, page: requests.Response):
+        self._page = page
+
+    def parse(self):
+        if self._page.status_code != 200:
+            raise WrongStatusCodeError(self._page)
+        yield from islice(self._parse(), self.max_records)
+
+    @abstractmethod
+    def _parse(self):
+        raise NotImplemented
+
+
+class AbstractDocumentParser(AbstractParser, ABC):
+    '''
+    Extracts its items with a backend, from the document of the page if one has been given and from the text of the page otherwise
+    '''
+
+    def __init__(self, page: requests.Response = None, backend: AbstractParserBackend = None, **kwargs):
+        super().__init__(page, **kwargs)
+        self.backend = backend or get_default_backend()
+        self._document = None
+
+    def set_page(self, page: requests.Response, document: Any = None):
+        '''
+        :param document: the page already parsed with get_document of the backend
+        '''
+        super().set_page(page)
+        self._document = document
+
+    def _parse(self) -> Iterable:
+        if self._document is None:
+            return self._parse_content(self._page.content, self._page.encoding)
+        return self._extract(self._document)
+
+    @abstractmethod
+    def _parse_content(self, content: bytes, encoding: str | None) -> Iterable:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _extract(self, document: Any) -> Iterable:
+        raise NotImplementedError
+
+
+class TranslationParser(AbstractDocumentParser):
+
+    def _parse_content(self, content: bytes, encoding: str | None) -> Iterable[Record]:
+        return self.backend.parse_translations(content, encoding)
+
+    def _extract(self, document: Any) -> Iterable[Record]:
+        return self.backend.extract_translations(document)
+
+
+class StreamingTranslationParser(TranslationParser):
+    '''
+    Parses the page while it is being downloaded and yields each record as soon as its block closes.
+    Gives the same records as TranslationParser, the page should be requested with stream=True
+    '''
+
+    chunk_size = 1024
+
+    def _parse(self) -> Iterable[Record]:
+        collector = _TranslationBlockCollector()
+        decoder = codecs.getincrementaldecoder(self._page.encoding or 'utf-8')(errors='replace')
+        for chunk in self._page.iter_content(self.chunk_size):
+            collector.feed(decoder.decode(chunk))
+            yield from self._pop_all(collector.records)
+        collector.feed(decoder.decode(b'', final=True))
+        collector.close()
+        yield from self._pop_all(collector.records)
+
+    @staticmethod
+    def _pop_all(records: deque[Record]) -> Iterable[Record]:
+        while records:
+            yield records.popleft()
+
+
+class _TranslationBlockCollector(HTMLParser):
+    '''
+    Incremental counterpart of the tree search in TranslationParser: tracks the open tags of the current
+    translation block and collects the texts of its first h3 and of the spans inside its first span
+    '''
+
+    VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'))
+    BLOCK_CLASS = 'inline leading-10'
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.records: deque[Record] = deque()
+        self._open_tags: list[str] = []
+        self._reset_block()
+
+    def _reset_block(self) -> None:
+        self._h3: list[str] | None = None
+        self._h3_depth: int | None = None
+        self._main_span_depth: int | None = None
+        self._is_main_span_closed = False
+        self._spans: list[list[str]] = []
+        self._open_spans: list[tuple[int, list[str]]] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in self.VOID_TAGS:
+            return
+        if not self._open_tags:
+            if tag == 'div' and dict(attrs).get('class') == self.BLOCK_CLASS:
+                self._open_tags.append(tag)
+            return
+        depth = len(self._open_tags)
+        self._open_tags.append(tag)
+        if tag == 'h3' and self._h3 is None:
+            self._h3, self._h3_depth = [], depth
+        if tag != 'span':
+            return
+        if self._main_span_depth is None:
+            self._main_span_depth = depth
+        elif not self._is_main_span_closed:
+            self._spans.append([])
+            self._open_spans.append((depth, self._spans[-1]))
+
+    def handle_data(self, data: str) -> None:
+        data = collapse_blank(data)
+        if self._h3_depth is not None:
+            self._h3.append(data)
+        for _, span in self._open_spans:
+            span.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag not in self._open_tags:
+            return
+        while self._open_tags:
+            closed = self._open_tags.pop()
+            self._close(len(self._open_tags))
+            if closed == tag:
+                break
+        if not self._open_tags:
+            self._finish_block()
+
+    def _close(self, depth: int) -> None:
+        if depth == self._h3_depth:
+            self._h3_depth = None
+        if depth == self._main_span_depth:
+            self._is_main_span_closed = True
+        if self._open_spans and self._open_spans[-1][0] == depth:
+            self._open_spans.pop()
+
+    def _finish_block(self) -> None:
+        if self._h3 is not None:
+            spans = [''.join(span) for span in self._spans]
+            part_of_speech = spans[0] if len(spans) > 0 else ''
+            gender = spans[1] if len(spans) > 1 else ''
+            self.records.append(Record(''.join(self._h3).replace('\n', ''), part_of_speech, gender))
+        self._reset_block()
+
+
+@dataclass(frozen=True)
+class TableSelections:
+    ALL = 'all'
+    FIRST = 'first'
+    SECOND_HALF = 'second-half'
+
+
+class ConjugationParser(AbstractParser):
+    '''
+    Extracts the tables lazily and only the selected ones: the parsing stops after the first table
+    or starts right at the first table of the second half
+    '''
+
+    NO_TABLES_FOUND = 'No tables found'
+    chunk_size = 1024
+
+    def __init__(self, page: requests.Response = None, selection: str = TableSelections.ALL, **kwargs):
+        super().__init__(page, **kwargs)
+        self.selection = selection
+
+    def _parse(self) -> Iterable[ConjugationTable]:
+        content = memoryview(self._page.content)
+        if self.selection == TableSelections.SECOND_HALF and (starts := find_tables(self._page.content)):
+            content = content[starts[len(starts) // 2]:]
+        tables = self._extract(content, self._page.encoding)
+        if self.selection == TableSelections.FIRST:
+            tables = islice(tables, 1)
+        is_empty = True
+        for table in tables:
+            is_empty = False
+            yield table
+        if is_empty:
+            yield ConjugationTable([['Error']], [[self.NO_TABLES_FOUND]])
+
+    def _extract(self, content: memoryview, encoding: str | None) -> Iterable[ConjugationTable]:
+        extractor = TableExtractor()
+        decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+        for start in range(0, len(content), self.chunk_size):
+            extractor.feed(decoder.decode(content[start:start + self.chunk_size]))
+            while extractor.tables:
+                yield extractor.tables.popleft()
+        extractor.feed(decoder.decode(b'', final=True))
+        extractor.close()
+        yield from extractor.tables
+
+
+class DefinitionParser(AbstractDocumentParser):
+
+    def _parse_content(self, content: bytes, encoding: str | None) -> Iterable[Definition]:
+        return self.backend.parse_definitions(content, encoding)
+
+    def _extract(self, document: Any) -> Iterable[Definition]:
+        return self.backend.extract_definitions(document)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from copy import copy
+from dataclasses import astuple
+from typing import Any
+
+import requests
+
+from .parsing import AbstractParser, WrongStatusCodeError
+from ..web.connector import FetchedPage
+
+
+def _warm_up() -> None:
+    import bs4  # noqa: F401
+    try:
+        import lxml.html  # noqa: F401
+    except ImportError:
+        pass
+
+
+def _parse_in_worker(template: AbstractParser, page: FetchedPage) -> tuple[type, list[tuple]]:
+    parser = copy(template)
+    parser.set_page(page)
+    items = list(parser.parse())
+    return (type(items[0]) if items else None), [astuple(item) for item in items]
+
+
+class ParsingPool:
+    '''
+    Parses the pages in worker processes to get round the GIL when many pages are fetched concurrently.
+    The workers are started and have the parsing libraries imported before the first page comes,
+    the raw bytes of the page are sent to them and the items come back as plain tuples
+    '''
+
+    def __init__(self, max_workers: int = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_warm_up)
+        wait([self._executor.submit(int) for _ in range(self.max_workers)])
+
+    def __enter__(self) -> ParsingPool:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+
+    def parse(self, page: requests.Response, template: AbstractParser) -> list[Any]:
+        '''
+        :param template: parser with the settings to parse the page with, its page is not used
+        '''
+        if page.status_code != 200:
+            raise WrongStatusCodeError(page)
+        template = copy(template)
+        template.set_page(None)
+        item_type, items = self._executor.submit(_parse_in_worker, template, FetchedPage(page.status_code, page.content, page.encoding)).result()
+        return [item_type(*item) for item in items]
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
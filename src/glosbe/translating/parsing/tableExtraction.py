@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+@dataclass
+class ConjugationTable:
+    '''
+    Table as plain rows of cell texts, the header rows are kept apart from the body rows
+    '''
+    header: list[list[str]] = field(default_factory=list)
+    rows: list[list[str]] = field(default_factory=list)
+
+    def to_frame(self) -> DataFrame:
+        '''
+        :return: the DataFrame pandas.read_html would give for the table, without its numeric type inference
+        '''
+        import pandas as pd
+        return pd.DataFrame(self.rows, columns=self._get_columns(pd))
+
+    def get_column_labels(self) -> list[str] | list[tuple[str, ...]] | None:
+        '''
+        :return: the labels pandas.read_html would give to the columns, a tuple of the labels of every level for each column if the header has many rows
+        '''
+        header = self.header if len(self.header) <= 1 else [row for row in self.header if any(row)]
+        match len(header):
+            case 0:
+                return None
+            case 1:
+                return self._deduplicate([name or f'Unnamed: {i}' for i, name in enumerate(header[0])])
+            case _:
+                levels = [[name or f'Unnamed: {i}_level_{level}' for i, name in enumerate(row)] for level, row in enumerate(header)]
+                return list(zip(*levels))
+
+    def _get_columns(self, pd):
+        labels = self.get_column_labels()
+        return pd.MultiIndex.from_tuples(labels) if labels and isinstance(labels[0], tuple) else labels
+
+    @staticmethod
+    def _deduplicate(names: list[str]) -> list[str]:
+        seen: dict[str, int] = {}
+        unique = []
+        for name in names:
+            while name in seen:
+                seen[name] += 1
+                name = f'{name}.{seen[name]}'
+            seen.setdefault(name, 0)
+            unique.append(name)
+        return unique
+
+
+@dataclass
+class _Cell:
+    tag: str
+    rowspan: int
+    colspan: int
+    texts: list[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return ' '.join(''.join(self.texts).split())
+
+
+class TableExtractor(HTMLParser):
+    '''
+    Collects the top-level tables of a page into ConjugationTables as soon as they close.
+    Rows and spans are read the way pandas.read_html reads them: thead rows, or else the leading rows of th cells only,
+    make the header, tfoot rows are appended to the body and the text of a spanned cell is copied to every cell it spans
+    '''
+
+    CELL_TAGS = ('td', 'th')
+    SECTION_TAGS = ('thead', 'tbody', 'tfoot')
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tables: deque[ConjugationTable] = deque()
+        self._depth = 0
+        self._reset_table()
+
+    def _reset_table(self) -> None:
+        self._sections: dict[str, list[list[_Cell]]] = {section: [] for section in self.SECTION_TAGS}
+        self._section = 'tbody'
+        self._row: list[_Cell] | None = None
+        self._cell: _Cell | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == 'br' and self._cell is not None:
+            self._cell.texts.append('\n')
+        elif tag == 'table':
+            self._depth += 1
+            if self._depth == 1:
+                self._reset_table()
+            return
+        if self._depth != 1:
+            return
+        if tag in self.SECTION_TAGS:
+            self._close_row()
+            self._section = tag
+        elif tag == 'tr':
+            self._close_row()
+            self._row = []
+        elif tag in self.CELL_TAGS:
+            self._close_cell()
+            if self._row is None:
+                self._row = []
+            attrs = dict(attrs)
+            self._cell = _Cell(tag, self._get_span(attrs.get('rowspan')), self._get_span(attrs.get('colspan')))
+
+    def handle_data(self, data: str) -> None:
+        if self._cell is not None:
+            self._cell.texts.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == 'table' and self._depth:
+            if self._depth == 1:
+                self._close_row()
+                self.tables.append(self._build_table())
+            self._depth -= 1
+        if self._depth != 1:
+            return
+        if tag in self.CELL_TAGS:
+            self._close_cell()
+        elif tag == 'tr':
+            self._close_row()
+        elif tag in self.SECTION_TAGS:
+            self._close_row()
+            self._section = 'tbody'
+
+    def _close_cell(self) -> None:
+        if self._cell is not None:
+            self._row.append(self._cell)
+            self._cell = None
+
+    def _close_row(self) -> None:
+        self._close_cell()
+        if self._row is not None:
+            self._sections[self._section].append(self._row)
+            self._row = None
+
+    @staticmethod
+    def _get_span(value: str | None) -> int:
+        return int(value) if value and value.isdigit() and int(value) > 0 else 1
+
+    def _build_table(self) -> ConjugationTable:
+        header_rows, body_rows, foot_rows = (self._sections[section] for section in self.SECTION_TAGS)
+        if not header_rows:
+            while body_rows and all(cell.tag == 'th' for cell in body_rows[0]):
+                header_rows.append(body_rows.pop(0))
+        header = self._expand_spans(header_rows)
+        rows = self._expand_spans(body_rows) + self._expand_spans(foot_rows)
+        width = max(map(len, header + rows), default=0)
+        for row in header + rows:
+            row += [''] * (width - len(row))
+        return ConjugationTable(header, rows)
+
+    @staticmethod
+    def _expand_spans(rows: list[list[_Cell]]) -> list[list[str]]:
+        expanded = []
+        remainder: list[tuple[int, str, int]] = []  # (index, text, rows left) of the cells spanning from the rows above
+        for row in rows:
+            texts, next_remainder = [], []
+            index = 0
+            for cell in row:
+                while remainder and remainder[0][0] <= index:
+                    prev_index, prev_text, prev_rowspan = remainder.pop(0)
+                    texts.append(prev_text)
+                    if prev_rowspan > 1:
+                        next_remainder.append((prev_index, prev_text, prev_rowspan - 1))
+                    index += 1
+                text = cell.text
+                for _ in range(cell.colspan):
+                    texts.append(text)
+                    if cell.rowspan > 1:
+                        next_remainder.append((index, text, cell.rowspan - 1))
+                    index += 1
+            for prev_index, prev_text, prev_rowspan in remainder:
+                texts.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_index, prev_text, prev_rowspan - 1))
+            expanded.append(texts)
+            remainder = next_remainder
+
+        while remainder:
+            texts, next_remainder = [], []
+            for prev_index, prev_text, prev_rowspan in remainder:
+                texts.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_index, prev_text, prev_rowspan - 1))
+            expanded.append(texts)
+            remainder = next_remainder
+        return expanded
+
+
+_TABLE_TAG = re.compile(r'<(/?)table\b', re.IGNORECASE)
+_TABLE_TAG_BYTES = re.compile(rb'<(/?)table\b', re.IGNORECASE)
+
+
+def find_tables(text: str | bytes) -> list[int]:
+    '''
+    Finds where the top-level tables start by their tags only, without parsing the page.
+    The offsets are in bytes for a page given in bytes, which is expected in an ASCII-compatible encoding
+    '''
+    depth = 0
+    starts = []
+    for match in (_TABLE_TAG_BYTES if isinstance(text, bytes) else _TABLE_TAG).finditer(text):
+        if match.group(1):
+            depth = max(0, depth - 1)
+            continue
+        if depth == 0:
+            starts.append(match.start())
+        depth += 1
+    return starts
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Iterable, Iterator
+
+
+@dataclass(frozen=True)
+class PipelineDefaults:
+    CAPACITY = 64
+    QUEUE_SIZE = 16
+    FETCH_WORKERS = 8
+    PARSE_WORKERS = 1
+    POLL_INTERVAL = 0.1
+
+
+@dataclass
+class StageStatistics:
+    '''
+    Times are summed over the workers of the stage: busy running the stage, starved waiting for an input
+    and blocked waiting for room in the queue of the next stage
+    '''
+    name: str
+    workers: int
+    items: int = 0
+    busy: float = 0.0
+    starved: float = 0.0
+    blocked: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def utilisation(self) -> float:
+        return self.busy / (self.elapsed * self.workers) if self.elapsed else 0.0
+
+
+class _Stopped(Exception):
+    pass
+
+
+@dataclass
+class _Failure:
+    error: BaseException
+
+
+_END = object()
+
+
+class _Stage:
+    def __init__(self, name: str, func: Callable[[Any], Any], workers: int):
+        self.func = func
+        self.statistics = StageStatistics(name, workers)
+        self.lock = threading.Lock()
+        self.running = workers
+
+    def count(self, busy: float = 0.0, starved: float = 0.0, blocked: float = 0.0, is_item: bool = False) -> None:
+        with self.lock:
+            self.statistics.items += is_item
+            self.statistics.busy += busy
+            self.statistics.starved += starved
+            self.statistics.blocked += blocked
+
+
+class Pipeline:
+    '''
+    Runs the items through stages of worker threads connected by bounded queues, so that the stages overlap.
+    At most capacity items are between the source and the consumer at a time: the source is not read further
+    until the consumer takes the oldest item, which keeps the memory flat however many items there are.
+    The results come out in the order of the items, an exception raised by a stage is raised to the consumer for its item.
+    Every iteration runs the items through the stages again, with its own threads and statistics
+
+        pipeline = Pipeline(urls).add_stage('fetch', fetch, workers=8).add_stage('parse', parse)
+        for parsed in pipeline:
+            ...
+    '''
+
+    def __init__(self, items: Iterable, capacity: int = PipelineDefaults.CAPACITY, queue_size: int = PipelineDefaults.QUEUE_SIZE):
+        self._items = items
+        self._capacity = capacity
+        self._queue_size = queue_size
+        self._stages: list[_Stage] = []
+        self._started = 0.0
+
+    def add_stage(self, name: str, func: Callable[[Any], Any], workers: int = 1) -> Pipeline:
+        self._stages.append(_Stage(name, func, workers))
+        return self
+
+    def get_statistics(self) -> list[StageStatistics]:
+        now = time.monotonic()
+        statistics = []
+        for stage in self._stages:
+            with stage.lock:
+                elapsed = stage.statistics.elapsed or (now - self._started if self._started else 0.0)
+                statistics.append(replace(stage.statistics, elapsed=elapsed))
+        return statistics
+
+    def __iter__(self) -> Iterator:
+        if not self._stages:
+            yield from self._items
+            return
+        self._stages = [_Stage(stage.statistics.name, stage.func, stage.statistics.workers) for stage in self._stages]
+        self._started = time.monotonic()
+        stopped = threading.Event()
+        in_flight = threading.Semaphore(self._capacity)
+        queues = [queue.Queue(maxsize=self._queue_size) for _ in range(len(self._stages) + 1)]
+        threads = [threading.Thread(target=self._feed, args=(in_flight, queues[0], stopped), daemon=True)]
+        for i, stage in enumerate(self._stages):
+            next_workers = self._stages[i + 1].statistics.workers if i + 1 < len(self._stages) else 1
+            for _ in range(stage.statistics.workers):
+                threads.append(threading.Thread(target=self._work, args=(stage, queues[i], queues[i + 1], next_workers, stopped), daemon=True))
+        for thread in threads:
+            thread.start()
+        try:
+            yield from self._collect(in_flight, queues[-1], threads)
+        finally:
+            stopped.set()
+
+    def _feed(self, in_flight: threading.Semaphore, target: queue.Queue, stopped: threading.Event) -> None:
+        items = iter(self._items)
+        index = 0
+        try:
+            while True:
+                while not in_flight.acquire(timeout=PipelineDefaults.POLL_INTERVAL):
+                    self._check_stopped(stopped)
+                try:
+                    item = next(items)
+                except StopIteration:
+                    break
+                self._put(target, (index, item), stopped)
+                index += 1
+        except _Stopped:
+            return
+        except BaseException as err:
+            self._put_quietly(target, (index, _Failure(err)), stopped)
+        for _ in range(self._stages[0].statistics.workers):
+            self._put_quietly(target, _END, stopped)
+
+    def _work(self, stage: _Stage, source: queue.Queue, target: queue.Queue, next_workers: int, stopped: threading.Event) -> None:
+        try:
+            while True:
+                start = time.monotonic()
+                received = self._get(source, stopped)
+                stage.count(starved=time.monotonic() - start)
+                if received is _END:
+                    break
+                index, item = received
+                start = time.monotonic()
+                if not isinstance(item, _Failure):
+                    try:
+                        item = stage.func(item)
+                    except BaseException as err:
+                        item = _Failure(err)
+                stage.count(busy=time.monotonic() - start, is_item=True)
+                start = time.monotonic()
+                self._put(target, (index, item), stopped)
+                stage.count(blocked=time.monotonic() - start)
+        except _Stopped:
+            return
+        with stage.lock:
+            stage.running -= 1
+            is_last = stage.running == 0
+            if is_last:
+                stage.statistics.elapsed = time.monotonic() - self._started
+        if is_last:
+            for _ in range(next_workers):
+                self._put_quietly(target, _END, stopped)
+
+    def _collect(self, in_flight: threading.Semaphore, source: queue.Queue, threads: list[threading.Thread]) -> Iterator:
+        waiting: dict[int, Any] = {}
+        next_index = 0
+        while True:
+            received = self._get_collected(source, threads)
+            if received is _END:
+                break
+            index, item = received
+            waiting[index] = item
+            while next_index in waiting:
+                item = waiting.pop(next_index)
+                next_index += 1
+                in_flight.release()
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+
+    @staticmethod
+    def _get_collected(source: queue.Queue, threads: list[threading.Thread]) -> Any:
+        '''
+        Waits for the next result as long as any of the threads can still give it
+        '''
+        while True:
+            try:
+                return source.get(timeout=PipelineDefaults.POLL_INTERVAL)
+            except queue.Empty:
+                if not any(thread.is_alive() for thread in threads) and source.empty():
+                    raise RuntimeError('The pipeline has stopped before giving all the results')
+
+    @staticmethod
+    def _check_stopped(stopped: threading.Event) -> None:
+        if stopped.is_set():
+            raise _Stopped
+
+    def _get(self, source: queue.Queue, stopped: threading.Event) -> Any:
+        while True:
+            try:
+                return source.get(timeout=PipelineDefaults.POLL_INTERVAL)
+            except queue.Empty:
+                self._check_stopped(stopped)
+
+    def _put(self, target: queue.Queue, item: Any, stopped: threading.Event) -> None:
+        while True:
+            try:
+                return target.put(item, timeout=PipelineDefaults.POLL_INTERVAL)
+            except queue.Full:
+                self._check_stopped(stopped)
+
+    def _put_quietly(self, target: queue.Queue, item: Any, stopped: threading.Event) -> None:
+        try:
+            self._put(target, item, stopped)
+        except _Stopped:
+            pass
@@ -1,14 +1,23 @@
 import logging
 import traceback
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, Future
+from copy import copy
+from dataclasses import dataclass, field, astuple
 from itertools import product
-from typing import Iterable, Any
+from pathlib import Path
+from typing import Iterable, Any, Type
 
 import requests
 import requests.exceptions as request_exceptions
 
-from .parsing.parsing import TranslationParser, Record, WrongStatusCodeError, ConjugationParser, AbstractParser, DefinitionParser
-from .web.connector import Connector, TransArgs, TranslatorArgumentException
+from .caching import TranslationCache, CacheDefaults, AbstractSqliteCache, ConjugationCache, DefinitionCache, DocumentCache, ParsedPage
+from .coalescing import SingleFlight, CoalescingStatistics
+from .parsing.parsing import TranslationParser, Record, WrongStatusCodeError, ConjugationParser, AbstractParser, DefinitionParser, StreamingTranslationParser, AbstractParserBackend, TableSelections, AbstractDocumentParser, Definition
+from .parsing.parsingPool import ParsingPool
+from .pipeline import Pipeline, PipelineDefaults
+from .web.connector import Connector, TransArgs, TranslatorArgumentException, ConnectionStatistics
+from .web.hedging import Hedger, HedgingStatistics
+from .web.resilience import ExceededRetriesError, CircuitOpenError
 
 
 @dataclass(frozen=True)
@@ -41,6 +50,7 @@ class ErrorMessages:
     INVALID_ARGUMENT = 'Error! An argument has not been set {}'
     EXCEEDED_NUMBER_OF_RETRIES = 'Error! Exceeded maximum number of retries - check your network connection'
     CONNECTION_ERROR = 'Connection error! Check your network connection'
+    SERVICE_UNAVAILABLE = 'Error! Glosbe is not responding at the moment, try again later'
 
 
 def get_product(firsts, seconds, by_seconds=False):
@@ -49,68 +59,242 @@ def get_product(firsts, seconds, by_seconds=False):
     return product(firsts, seconds)
 
 
+def get_status_code_message(status_code: int, trans_args: TransArgs) -> str:
+    match status_code:
+        case 404:
+            return PageCodeMessages.PAGE_NOT_FOUND_404.format(str(trans_args))
+        case 303:
+            return PageCodeMessages.PAGE_NOT_FOUND_303
+        case _:
+            return PageCodeMessages.UNHANDLED_PAGE_FULL_MESSAGE.format(status_code)
+
+
 class AbstractScrapper:
 
-    def __init__(self, parser: AbstractParser, **kwargs):
+    def __init__(self, parser: AbstractParser, connector: Connector = None, cache: AbstractSqliteCache = None, documents: DocumentCache = None,
+                 parsing_pool: ParsingPool = None, **kwargs):
+        '''
+        :param documents: parsed pages shared with the other scrappers, the pages are parsed on their own if not given
+        :param parsing_pool: worker processes to parse the pages in instead of the calling thread, takes precedence over documents
+        '''
         self._parser: AbstractParser = parser
-        self._session: requests.sessions.Session | None = None
-
-    def __setattr__(self, name, value):
-        match name:
-            case 'session':
-                if isinstance(value, requests.sessions.Session):
-                    self.__dict__['_' + name] = value
-                else:
-                    raise ValueError
-            case _:
-                super().__setattr__(name, value)
+        self._connector: Connector = connector or Connector.get_shared()
+        self._cache = cache
+        self._documents = documents
+        self._parsing_pool = parsing_pool
+
+    def _get_template(self, template: AbstractParser = None, max_records: int = None) -> AbstractParser:
+        parser = copy(template or self._parser)
+        parser.max_records = max_records
+        return parser
+
+    def _get_parser(self, url: str, template: AbstractParser = None, max_records: int = None) -> AbstractParser:
+        parser = self._get_template(template, max_records)
+        if self._documents is not None and isinstance(parser, AbstractDocumentParser):
+            parsed_page = self._documents.get((url, type(parser.backend)), lambda: self._load_document(url, parser.backend))
+            parser.set_page(parsed_page.page, parsed_page.document)
+        else:
+            parser.set_page(self._connector.get_page(url))
+        return parser
+
+    def _load_document(self, url: str, backend: AbstractParserBackend) -> ParsedPage:
+        page = self._connector.get_page(url)
+        return ParsedPage(page, backend.get_document(page.content, page.encoding) if page.status_code == 200 else None)
+
+    def _scrap(self, url: str, cache_key: Any, parser: AbstractParser = None, max_records: int = None) -> Iterable:
+        '''
+        :param parser: template of the parser to use instead of the default one of the scrapper
+        :param max_records: the page is parsed only until that many items are found, no limit if not given
+        '''
+        if self._cache is not None and (cached := self._cache.get(cache_key)) is not None:
+            return cached[:max_records]
+        if self._parsing_pool is not None:
+            parsed = self._parsing_pool.parse(self._connector.get_page(url), self._get_template(parser, max_records))
+        else:
+            parsed = self._get_parser(url, parser, max_records).parse()
+        if self._cache is not None:
+            parsed = list(parsed)
+            if self._is_complete(parsed, max_records):
+                self._cache.set(cache_key, parsed)
+        return parsed
+
+    def _fetch(self, url: str, cache_key: Any, max_records: int = None) -> list | requests.Response:
+        '''
+        First half of _scrap for running the fetching and the parsing apart
+        :return: the cached items if there are any and the page otherwise
+        '''
+        if self._cache is not None and (cached := self._cache.get(cache_key)) is not None:
+            return cached[:max_records]
+        return self._connector.get_page(url)
+
+    def _parse_fetched(self, fetched: list | requests.Response, cache_key: Any, parser: AbstractParser = None, max_records: int = None) -> list:
+        '''
+        Second half of _scrap, parses what _fetch has given unless it comes from the cache
+        '''
+        if isinstance(fetched, list):
+            return fetched
+        if self._parsing_pool is not None:
+            parsed = self._parsing_pool.parse(fetched, self._get_template(parser, max_records))
+        else:
+            parser = self._get_template(parser, max_records)
+            parser.set_page(fetched)
+            parsed = list(parser.parse())
+        if self._cache is not None and self._is_complete(parsed, max_records):
+            self._cache.set(cache_key, parsed)
+        return parsed
+
+    @staticmethod
+    def _is_complete(parsed: list, max_records: int | None) -> bool:
+        '''
+        Cut results are not cached, fewer items than the limit mean that the whole page has been parsed
+        '''
+        return max_records is None or len(parsed) < max_records
 
 
 class TranslatorScrapper(AbstractScrapper):
 
-    def __init__(self, **kwargs):
-        super().__init__(parser=TranslationParser(), **kwargs)
+    def __init__(self, backend: AbstractParserBackend = None, **kwargs):
+        super().__init__(parser=TranslationParser(backend=backend), **kwargs)
+        self._single_flight = SingleFlight()
+
+    def get_coalescing_statistics(self) -> CoalescingStatistics:
+        return self._single_flight.get_statistics()
 
-    def translate(self, from_lang: str, to_langs: list[str, ...] | str, words: list[str, ...] | str, by_word=False) -> Iterable[TranslationResult]:
+    def translate(self, from_lang: str, to_langs: list[str, ...] | str, words: list[str, ...] | str, by_word=False, max_workers: int = None, max_records: int = None) -> Iterable[TranslationResult]:
+        '''
+        :param max_records: the number of records to get for each translation, all if not given
+        '''
         if isinstance(words, str):
             words = [words]
         if isinstance(to_langs, str):
             to_langs = [to_langs]
-        langs_words = get_product(to_langs, words, by_word)
-        for to_lang, word in langs_words:
-            yield self.translate_single(from_lang, to_lang, word)
+        langs_words = list(get_product(to_langs, words, by_word))
+        if max_workers is None or max_workers <= 1:
+            records = self._get_records_serially(from_lang, langs_words, max_records)
+        else:
+            records = self._get_records_concurrently(from_lang, langs_words, max_workers, max_records)
+        for (to_lang, word), lang_word_records in zip(langs_words, records):
+            yield TranslationResult(TransArgs(from_lang, to_lang, word), list(lang_word_records))
+
+    def _get_records_serially(self, from_lang: str, langs_words: list[tuple[str, str]], max_records: int = None) -> Iterable[list[Record]]:
+        fetched: dict[tuple[str, str], list[Record]] = {}
+        for lang_word in langs_words:
+            if lang_word in fetched:
+                self._single_flight.mark_coalesced()
+            else:
+                fetched[lang_word] = self._get_records(TransArgs(from_lang, *lang_word), max_records)
+            yield fetched[lang_word]
+
+    def _get_records_concurrently(self, from_lang: str, langs_words: list[tuple[str, str]], max_workers: int, max_records: int = None) -> Iterable[list[Record]]:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: dict[tuple[str, str], Future] = {}
+            for lang_word in langs_words:
+                if lang_word in futures:
+                    self._single_flight.mark_coalesced()
+                else:
+                    futures[lang_word] = executor.submit(self._get_records, TransArgs(from_lang, *lang_word), max_records)
+            for lang_word in langs_words:
+                yield futures[lang_word].result()
+
+    def translate_single(self, from_lang: str, to_lang: str, word: str, max_records: int = None) -> TranslationResult:
+        trans_args = TransArgs(from_lang, to_lang, word)
+        return TranslationResult(trans_args, list(self._get_records(trans_args, max_records)))
 
-    def translate_single(self, from_lang: str, to_lang: str, word: str) -> TranslationResult:
+    def translate_streaming(self, from_lang: str, to_lang: str, word: str, max_records: int = None) -> TranslationResult:
+        '''
+        :return: result whose records are parsed lazily while the page is being downloaded,
+        the connection is closed as soon as max_records records are read
+        '''
         trans_args = TransArgs(from_lang, to_lang, word)
+        return TranslationResult(trans_args, self._translate_from_url(trans_args, stream=True, max_records=max_records))
+
+    def translate_pipelined(self, from_lang: str, to_langs: list[str, ...] | str, words: list[str, ...] | str, by_word=False, max_records: int = None,
+                            fetch_workers: int = PipelineDefaults.FETCH_WORKERS, parse_workers: int = PipelineDefaults.PARSE_WORKERS, capacity: int = PipelineDefaults.CAPACITY) -> Pipeline:
+        '''
+        Fetches and parses in separate stages so that the downloads go on while the pages are parsed, for large batches.
+        The words are read lazily and at most capacity translations are held at a time,
+        the same page is fetched once only if it is asked for again while it is still in flight
+        :return: pipeline of the results in order, more stages can be added to it before it is iterated
+        '''
+        if isinstance(words, str):
+            words = [words]
+        if isinstance(to_langs, str):
+            to_langs = [to_langs]
+        all_trans_args = (TransArgs(from_lang, *lang_word) for lang_word in get_product(to_langs, words, by_word))
+        return Pipeline(all_trans_args, capacity=capacity)\
+            .add_stage('fetch', lambda trans_args: self._fetch_translation(trans_args, max_records), workers=fetch_workers)\
+            .add_stage('parse', lambda fetched: self._parse_translation(*fetched, max_records), workers=parse_workers)
+
+    def _fetch_translation(self, trans_args: TransArgs, max_records: int = None) -> tuple[TransArgs, list[Record] | requests.Response]:
         try:
-            records = self._translate_from_url(trans_args)
+            return trans_args, self._single_flight.do(('fetch', *astuple(trans_args), max_records), lambda: self._fetch(trans_args.to_url(), trans_args, max_records))
         except TranslatorArgumentException:
-            logging.exception(f'Exception: Invalid argument {str(trans_args)}')
-            records = [Record(ErrorMessages.INVALID_ARGUMENT.format(str(trans_args)))]
-        return TranslationResult(trans_args, records)
+            return trans_args, [self._get_invalid_argument_record(trans_args)]
+        except request_exceptions.ConnectionError as err:
+            return trans_args, [self._get_error_record(err, trans_args)]
 
-    def _translate_from_url(self, trans_args: TransArgs) -> Iterable[Record]:
+    def _parse_translation(self, trans_args: TransArgs, fetched: list[Record] | requests.Response, max_records: int = None) -> TranslationResult:
         try:
-            page: requests.Response = self._session.get(trans_args.to_url(), allow_redirects=True)
-            self._parser.set_page(page)
-            yield from self._parser.parse()
+            records = self._parse_fetched(fetched, trans_args, max_records=max_records)
         except WrongStatusCodeError as err:
-            logging.error(f'{err.page.status_code}: {err.page.text}')
-            yield Record(self._get_status_code_message(err, trans_args))
-        except request_exceptions.ConnectionError as err:
-            logging.exception(traceback.format_exc())
-            yield Record(ErrorMessages.CONNECTION_ERROR)
+            records = [self._get_error_record(err, trans_args)]
+        return TranslationResult(trans_args, records)
+
+    def _get_records(self, trans_args: TransArgs, max_records: int = None) -> list[Record]:
+        try:
+            return self._single_flight.do((*astuple(trans_args), max_records), lambda: list(self._translate_from_url(trans_args, max_records=max_records)))
         except TranslatorArgumentException:
-            raise TranslatorArgumentException
+            return [self._get_invalid_argument_record(trans_args)]
 
-    def _get_status_code_message(self, err: WrongStatusCodeError, trans_args: TransArgs) -> str:
-        match err.page.status_code:
-            case 404:
-                return PageCodeMessages.PAGE_NOT_FOUND_404.format(str(trans_args))
-            case 303:
-                return PageCodeMessages.PAGE_NOT_FOUND_303
+    @staticmethod
+    def _get_invalid_argument_record(trans_args: TransArgs) -> Record:
+        logging.exception(f'Exception: Invalid argument {str(trans_args)}')
+        return Record(ErrorMessages.INVALID_ARGUMENT.format(str(trans_args)))
+
+    def _translate_from_url(self, trans_args: TransArgs, stream: bool = False, max_records: int = None) -> Iterable[Record]:
+        try:
+            if stream:
+                yield from self._stream(trans_args.to_url(), trans_args, max_records)
+            else:
+                yield from self._scrap(trans_args.to_url(), trans_args, max_records=max_records)
+        except (WrongStatusCodeError, request_exceptions.ConnectionError) as err:
+            yield self._get_error_record(err, trans_args)
+
+    def _get_error_record(self, err: WrongStatusCodeError | request_exceptions.ConnectionError, trans_args: TransArgs) -> Record:
+        match err:
+            case WrongStatusCodeError():
+                logging.error(f'{err.page.status_code}: {err.page.text}')
+                return Record(self._get_status_code_message(err, trans_args))
+            case CircuitOpenError():
+                logging.error(f'Circuit open, skipped: {str(trans_args)}')
+                return Record(ErrorMessages.SERVICE_UNAVAILABLE)
+            case ExceededRetriesError():
+                logging.exception(traceback.format_exc())
+                return Record(ErrorMessages.EXCEEDED_NUMBER_OF_RETRIES)
             case _:
-                return PageCodeMessages.UNHANDLED_PAGE_FULL_MESSAGE.format(err.page.status_code)
+                logging.exception(traceback.format_exc())
+                return Record(ErrorMessages.CONNECTION_ERROR)
+
+    def _stream(self, url: str, cache_key: Any, max_records: int = None) -> Iterable[Record]:
+        if self._cache is not None and (cached := self._cache.get(cache_key)) is not None:
+            yield from cached[:max_records]
+            return
+        page: requests.Response = self._connector.get_page(url, stream=True)
+        parsed = []
+        try:
+            for record in StreamingTranslationParser(page, max_records=max_records).parse():
+                parsed.append(record)
+                yield record
+        except WrongStatusCodeError:
+            page.content  # read the error page before closing to keep it for reporting
+            raise
+        finally:
+            page.close()
+        if self._cache is not None and self._is_complete(parsed, max_records):
+            self._cache.set(cache_key, parsed)
+
+    def _get_status_code_message(self, err: WrongStatusCodeError, trans_args: TransArgs) -> str:
+        return get_status_code_message(err.page.status_code, trans_args)
 
 
 class ConjugationScrapper(AbstractScrapper):
@@ -118,62 +302,112 @@ class ConjugationScrapper(AbstractScrapper):
     def __init__(self, **kwargs):
         super().__init__(parser=ConjugationParser(), **kwargs)
 
-    def get_conjugation(self, lang: str, word: str) -> Iterable:
+    def get_conjugation(self, lang: str, word: str, selection: str = TableSelections.ALL) -> Iterable:
+        cache_key = (lang, word) if selection == TableSelections.ALL else (lang, word, selection)
+        yield from self._scrap(self.get_conjugation_url(lang, word), cache_key, ConjugationParser(selection=selection))
+
+    @staticmethod
+    def get_conjugation_url(lang: str, word: str) -> str:
         trans_args = TransArgs(lang, 'en' if lang != 'en' else 'es', word)
-        page: requests.Response = self._session.get(f'{trans_args.to_url()}/fragment/details', allow_redirects=True)
-        self._parser.set_page(page)
-        yield from self._parser.parse()
+        return f'{trans_args.to_url()}/fragment/details'
 
 
 class DefinitionScrapper(AbstractScrapper):
-    def __init__(self, **kwargs):
-        super().__init__(parser=DefinitionParser(), **kwargs)
+    def __init__(self, backend: AbstractParserBackend = None, **kwargs):
+        super().__init__(parser=DefinitionParser(backend=backend), **kwargs)
 
-    def scrap_definitions(self, lang: str, word: str) -> Iterable:
-        trans_args = TransArgs(lang, lang, word)
-        page: requests.Response = self._session.get(trans_args.to_url(), allow_redirects=True)
-        self._parser.set_page(page)
-        yield from self._parser.parse()
+    def scrap_definitions(self, lang: str, word: str, to_lang: str = None) -> Iterable:
+        '''
+        :param to_lang: language of the translation page to take the definitions from, the page of lang itself if not given
+        '''
+        trans_args = TransArgs(lang, to_lang or lang, word)
+        yield from self._scrap(trans_args.to_url(), (lang, trans_args.to_lang, word))
 
 
 class Scrapper:
-    def __init__(self):
+    def __init__(self, connector: Connector = None, cache_dir: Path = None, parser_backend: AbstractParserBackend = None, parsing_pool: ParsingPool = None,
+                 hedging: bool = False):
+        '''
+        :param cache_dir: directory of the on-disk cache of the scrapped pages, no caching if not given
+        :param parser_backend: extracts the translations and definitions from the pages, lxml if installed and BeautifulSoup otherwise by default
+        :param parsing_pool: worker processes to parse the pages in for large batches, the pages are then parsed separately for each kind of item
+        :param hedging: turns on hedging on the connector, see set_hedging
+
+        The translation and definition pages fetched successfully are downloaded and parsed once for CacheDefaults.DOCUMENT_TTL seconds, see clear_documents
+        '''
         self.args = TransArgs()
-        self._connector = Connector()
-        self._conjugation_scrapper = ConjugationScrapper()
-        self._translation_scrapper = TranslatorScrapper()
-        self._definition_scrapper = DefinitionScrapper()
-
-    def scrap_translation(self, from_lang: str, to_langs: list[str, ...], words: list[str, ...], by_word=False) -> Iterable[TranslationResult]:
-        self._connector.establish_session()
-        self._translation_scrapper.session = self._connector.session
-
-        yield from self._translation_scrapper.translate(from_lang, to_langs, words, by_word=by_word)
-
-        self._connector.close_session()
-
-    def scrap_conjugation(self, lang: str, word: str) -> Iterable:
-        self._connector.establish_session()
-        self._conjugation_scrapper.session = self._connector.session
-
-        yield from self._conjugation_scrapper.get_conjugation(lang, word)
-
-        self._connector.close_session()
-
-    def scrap_translation_and_conjugation(self, from_lang: str, to_lang: str, word: str, by_word=False) -> Iterable[TranslationResult] | Any:
-        self._connector.establish_session()
-        self._translation_scrapper.session = self._connector.session
-        self._conjugation_scrapper.session = self._connector.session
-
-        translation_result = self._translation_scrapper.translate(from_lang, to_lang, word, by_word=by_word)
-        conjugation_result = self._conjugation_scrapper.get_conjugation(from_lang, word)
-        yield translation_result
-        yield conjugation_result
-
-        self._connector.close_session()
+        self._connector = connector or Connector.get_shared()
+        self._documents = DocumentCache()
+        self._conjugation_scrapper = ConjugationScrapper(connector=self._connector, cache=self._create_cache(ConjugationCache, cache_dir), parsing_pool=parsing_pool)
+        self._translation_scrapper = TranslatorScrapper(backend=parser_backend, connector=self._connector, cache=self._create_cache(TranslationCache, cache_dir), documents=self._documents, parsing_pool=parsing_pool)
+        self._definition_scrapper = DefinitionScrapper(backend=parser_backend, connector=self._connector, cache=self._create_cache(DefinitionCache, cache_dir), documents=self._documents, parsing_pool=parsing_pool)
+        if hedging:
+            self.set_hedging(True)
+
+    @staticmethod
+    def _create_cache(cache_type: Type[AbstractSqliteCache], cache_dir: Path | None) -> AbstractSqliteCache | None:
+        return cache_type(cache_dir / CacheDefaults.FILE_NAME) if cache_dir is not None else None
+
+    def clear_documents(self) -> None:
+        self._documents.clear()
+
+    def get_connection_statistics(self) -> ConnectionStatistics:
+        return self._connector.get_statistics()
+
+    def get_coalescing_statistics(self) -> CoalescingStatistics:
+        return self._translation_scrapper.get_coalescing_statistics()
+
+    def set_hedging(self, state: bool) -> None:
+        '''
+        Hedging sends a second request for a page that is slower to come than most of the recent ones and takes the first response.
+        It cuts the tail latency for the cost of a few more requests, the hedger of the connector is kept if it already has one
+        '''
+        if not state:
+            self._connector.set_hedger(None)
+        elif self._connector.get_hedging_statistics() is None:
+            self._connector.set_hedger(Hedger())
+
+    def get_hedging_statistics(self) -> HedgingStatistics | None:
+        return self._connector.get_hedging_statistics()
+
+    def scrap_translation(self, from_lang: str, to_langs: list[str, ...], words: list[str, ...], by_word=False, max_workers: int = None, max_records: int = None) -> Iterable[TranslationResult]:
+        '''
+        :param max_records: the number of records to get for each translation, all if not given
+        '''
+        yield from self._translation_scrapper.translate(from_lang, to_langs, words, by_word=by_word, max_workers=max_workers, max_records=max_records)
+
+    def scrap_translation_pipelined(self, from_lang: str, to_langs: list[str, ...], words: list[str, ...], by_word=False, max_records: int = None,
+                                    fetch_workers: int = PipelineDefaults.FETCH_WORKERS, parse_workers: int = PipelineDefaults.PARSE_WORKERS, capacity: int = PipelineDefaults.CAPACITY) -> Pipeline:
+        '''
+        For large batches, see TranslatorScrapper.translate_pipelined
+        '''
+        return self._translation_scrapper.translate_pipelined(from_lang, to_langs, words, by_word=by_word, max_records=max_records,
+                                                              fetch_workers=fetch_workers, parse_workers=parse_workers, capacity=capacity)
+
+    def scrap_translation_streaming(self, from_lang: str, to_lang: str, word: str, max_records: int = None) -> TranslationResult:
+        return self._translation_scrapper.translate_streaming(from_lang, to_lang, word, max_records=max_records)
+
+    def scrap_conjugation(self, lang: str, word: str, selection: str = TableSelections.ALL) -> Iterable:
+        '''
+        :param selection: one of TableSelections, the tables that are not selected are not parsed
+        '''
+        yield from self._conjugation_scrapper.get_conjugation(lang, word, selection)
+
+    def scrap_translation_and_conjugation(self, from_lang: str, to_lang: str, word: str, by_word=False, selection: str = TableSelections.ALL, max_records: int = None) -> Iterable[TranslationResult] | Any:
+        '''
+        Fetches the conjugation in the background while the translation is being fetched, both on the shared connector
+        '''
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            conjugation_future = executor.submit(lambda: list(self._conjugation_scrapper.get_conjugation(from_lang, word, selection)))
+            yield list(self._translation_scrapper.translate(from_lang, to_lang, word, by_word=by_word, max_records=max_records))
+            yield conjugation_future.result()
 
     def scrap_definition(self, lang: str, word: str) -> Iterable:
-        self._connector.establish_session()
-        self._definition_scrapper.session = self._connector.session
         yield from self._definition_scrapper.scrap_definitions(lang, word)
-        self._connector.close_session()
+
+    def scrap_translation_and_definition(self, from_lang: str, to_lang: str, word: str, max_records: int = None) -> tuple[TranslationResult, list[Definition]]:
+        '''
+        Takes the translation and the definitions from the same translation page, downloaded and parsed once
+        '''
+        translation = self._translation_scrapper.translate_single(from_lang, to_lang, word, max_records=max_records)
+        return translation, list(self._definition_scrapper.scrap_definitions(from_lang, word, to_lang=to_lang))
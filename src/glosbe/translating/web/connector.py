@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import atexit
+import threading
+import time
 from dataclasses import dataclass
 
 import requests
+import requests.exceptions as request_exceptions
+from requests.adapters import HTTPAdapter
+
+from .hedging import Hedger, HedgingStatistics
+from .resilience import RetryPolicy, CircuitBreaker, ExceededRetriesError, ResilienceDefaults
+from .throttling import Throttle, ThrottleState
 
 
 @dataclass(frozen=True)
 class WebConstants:
+    SCHEME = "https"
     MAIN_URL = "glosbe.com"
 
 
@@ -19,41 +29,207 @@ class TransArgs:
     def to_url(self) -> str:
         if not self:
             raise TranslatorArgumentException(self)
-        return f'https://{WebConstants.MAIN_URL}/{self.from_lang}/{self.to_lang}/{self.word}'
+        return f'{WebConstants.SCHEME}://{WebConstants.MAIN_URL}/{self.from_lang}/{self.to_lang}/{self.word}'
 
     def __bool__(self):
         return all(filter(bool, (self.from_lang, self.to_lang, self.word)))
 
 
+@dataclass
+class FetchedPage:
+    '''
+    Response-like page for clients other than requests, readable by the parsers
+    '''
+    status_code: int = 200
+    content: bytes = b''
+    encoding: str | None = 'utf-8'
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+
 class TranslatorArgumentException(ValueError):
     def __init__(self, trans_args: TransArgs):
         self.trans_args = trans_args
 
 
-class Connector:
+@dataclass(frozen=True)
+class PoolDefaults:
+    POOL_SIZE = 10
+    IDLE_TIMEOUT = 60.0
 
-    def __init__(self):
+
+@dataclass
+class ConnectionStatistics:
+    requests: int = 0
+    connections: int = 0
+
+    @property
+    def reuse_rate(self) -> float:
+        if not self.requests:
+            return 0.0
+        return max(self.requests - self.connections, 0) / self.requests
+
+
+class Connector:
+    '''
+    Owns a keep-alive session shared by the scrappers. The session outlives single calls
+    and is only recreated after being idle for longer than idle_timeout seconds.
+    Requests go through the throttle, whose adapted limits persist as long as the connector does,
+    are retried on connection errors, timeouts and throttling or server error responses, and fail fast while the circuit breaker is open.
+    '''
+
+    _shared: Connector = None
+
+    def __init__(self, pool_size: int = PoolDefaults.POOL_SIZE, idle_timeout: float = PoolDefaults.IDLE_TIMEOUT, throttle: Throttle = None,
+                 retry_policy: RetryPolicy = None, circuit_breaker: CircuitBreaker = None, hedger: Hedger = None,
+                 timeout: float = ResilienceDefaults.REQUEST_TIMEOUT):
+        '''
+        :param timeout: seconds to wait for the connection and for each read of the response before giving up on the request
+        :param hedger: sends a second request when the first one is slower than usual, no hedging if not given
+        '''
         self._session: requests.Session | None = None
+        self._throttle = throttle or Throttle()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._hedger = hedger
+        self._timeout = timeout
+        self._pool_size = pool_size
+        self._idle_timeout = idle_timeout
+        self._last_used = 0.0
+        self._closed_statistics = ConnectionStatistics()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls) -> Connector:
+        if cls._shared is None:
+            cls._shared = Connector()
+            atexit.register(cls._shared.close_session)
+        return cls._shared
 
     def establish_session(self):
-        self._session = requests.Session()
-        self._session.headers.update(Connector._get_default_headers())
+        with self._lock:
+            if self._session is not None and self._is_idle_for_too_long():
+                self._close_session()
+            if self._session is None:
+                self._session = self._create_session()
+            self._last_used = time.monotonic()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self._pool_size, pool_maxsize=self._pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(Connector._get_default_headers())
+        return session
+
+    def _is_idle_for_too_long(self) -> bool:
+        return time.monotonic() - self._last_used > self._idle_timeout
 
     def __getattr__(self, name):
         match name:
             case 'session':
-                return self._session
+                return self.get_session()
             case _:
                 raise AttributeError
 
     def get_session(self) -> requests.Session:
+        self.establish_session()
         return self._session
 
     def close_session(self):
+        with self._lock:
+            self._close_session()
+
+    def _close_session(self):
+        if self._session is None:
+            return
+        closed = self._get_open_statistics()
+        self._closed_statistics.requests += closed.requests
+        self._closed_statistics.connections += closed.connections
         self._session.close()
+        self._session = None
+
+    def get_page(self, url: str, stream: bool = False) -> requests.Response:
+        '''
+        :param stream: return as soon as the headers arrive and leave the body to be read with iter_content
+        '''
+        for retry in range(self._retry_policy.retries + 1):
+            self._circuit_breaker.before_request()
+            is_last = retry == self._retry_policy.retries
+            try:
+                response = self._get_hedged_page(url, stream) if self._hedger is not None else self._get_throttled_page(url, stream)
+            except (request_exceptions.ConnectionError, request_exceptions.Timeout) as err:
+                self._circuit_breaker.record_failure()
+                if is_last:
+                    raise ExceededRetriesError(url) from err
+                time.sleep(self._retry_policy.get_delay(retry))
+                continue
+            except Exception:
+                self._circuit_breaker.record_failure()
+                raise
+
+            if response.status_code in ResilienceDefaults.FAILURE_STATUS_CODES:
+                self._circuit_breaker.record_failure()
+            else:
+                self._circuit_breaker.record_success()
+            if is_last or not self._retry_policy.should_retry(response.status_code):
+                return response
+            response.close()
+            time.sleep(self._retry_policy.get_delay(retry, self._get_retry_after(response)))
+
+    def _get_hedged_page(self, url: str, stream: bool = False) -> requests.Response:
+        return self._hedger.get(lambda: self._get_throttled_page(url, stream))
+
+    def _get_throttled_page(self, url: str, stream: bool = False) -> requests.Response:
+        self._throttle.acquire()
+        response = None
+        try:
+            response = self.get_session().get(url, allow_redirects=True, stream=stream, timeout=self._timeout)
+            return response
+        finally:
+            if response is not None:
+                self._throttle.release(response.status_code, self._get_retry_after(response))
+            else:
+                self._throttle.release()
+
+    def set_hedger(self, hedger: Hedger | None) -> None:
+        '''
+        :param hedger: replaces the current one, which is shut down, no hedging if None
+        '''
+        if self._hedger is not None and self._hedger is not hedger:
+            self._hedger.shutdown()
+        self._hedger = hedger
+
+    def get_hedging_statistics(self) -> HedgingStatistics | None:
+        return self._hedger.get_statistics() if self._hedger is not None else None
+
+    def get_throttle_state(self) -> ThrottleState:
+        return self._throttle.get_state()
 
-    def get_page(self, url: str) -> requests.Response:
-        return self._session.get(url, allow_redirects=True)
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> float | None:
+        retry_after = response.headers.get('Retry-After', '')
+        return float(retry_after) if retry_after.isdigit() else None
+
+    def get_statistics(self) -> ConnectionStatistics:
+        with self._lock:
+            current = self._get_open_statistics()
+            return ConnectionStatistics(self._closed_statistics.requests + current.requests, self._closed_statistics.connections + current.connections)
+
+    def _get_open_statistics(self) -> ConnectionStatistics:
+        statistics = ConnectionStatistics()
+        if self._session is None:
+            return statistics
+        pool_managers = {id(adapter.poolmanager): adapter.poolmanager for adapter in self._session.adapters.values() if isinstance(adapter, HTTPAdapter)}
+        for pool_manager in pool_managers.values():
+            for key in pool_manager.pools.keys():
+                pool = pool_manager.pools.get(key)
+                if pool is not None:
+                    statistics.requests += pool.num_requests
+                    statistics.connections += pool.num_connections
+        return statistics
 
     @staticmethod
     def _get_default_headers() -> dict:
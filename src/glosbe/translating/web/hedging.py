@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, replace
+from typing import Callable
+
+import requests
+
+
+@dataclass(frozen=True)
+class HedgingDefaults:
+    PERCENTILE = 0.9
+    WINDOW = 100
+    MIN_SAMPLES = 10
+    INITIAL_DELAY = 1.0
+    MAX_WORKERS = 16
+
+
+@dataclass
+class HedgingStatistics:
+    requests: int = 0
+    hedged: int = 0
+    won_by_hedge: int = 0
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedged / self.requests if self.requests else 0.0
+
+
+class LatencyTracker:
+    def __init__(self, window: int = HedgingDefaults.WINDOW):
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def get_percentile(self, percentile: float) -> float:
+        with self._lock:
+            latencies = sorted(self._latencies)
+        return latencies[min(len(latencies) - 1, int(percentile * len(latencies)))]
+
+
+class Hedger:
+    '''
+    Sends a second identical request if the first has not answered within the given percentile of recent latencies.
+    The first response wins, the other one is cancelled if it has not started yet or closed once it arrives
+    '''
+
+    def __init__(self, percentile: float = HedgingDefaults.PERCENTILE, window: int = HedgingDefaults.WINDOW,
+                 min_samples: int = HedgingDefaults.MIN_SAMPLES, initial_delay: float = HedgingDefaults.INITIAL_DELAY, max_workers: int = HedgingDefaults.MAX_WORKERS):
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._initial_delay = initial_delay
+        self._latencies = LatencyTracker(window)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='hedging')
+        self._statistics = HedgingStatistics()
+        self._lock = threading.Lock()
+
+    def get_delay(self) -> float:
+        if len(self._latencies) < max(1, self._min_samples):
+            return self._initial_delay
+        return self._latencies.get_percentile(self._percentile)
+
+    def get(self, request: Callable[[], requests.Response]) -> requests.Response:
+        primary = self._executor.submit(self._measure, request)
+        done, _ = wait([primary], timeout=self.get_delay())
+        if done:
+            self._count(is_hedged=False, is_won_by_hedge=False)
+            return primary.result()
+
+        hedge = self._executor.submit(self._measure, request)
+        winner = self._get_first_successful(primary, hedge)
+        self._discard(hedge if winner is primary else primary)
+        self._count(is_hedged=True, is_won_by_hedge=winner is hedge)
+        return winner.result()
+
+    def _measure(self, request: Callable[[], requests.Response]) -> requests.Response:
+        start = time.monotonic()
+        response = request()
+        self._latencies.record(time.monotonic() - start)
+        return response
+
+    @staticmethod
+    def _get_first_successful(*futures: Future) -> Future:
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            successful = next((future for future in done if future.exception() is None), None)
+            if successful is not None:
+                return successful
+        return futures[0]
+
+    @classmethod
+    def _discard(cls, future: Future) -> None:
+        if not future.cancel():
+            future.add_done_callback(cls._close_response)
+
+    @staticmethod
+    def _close_response(future: Future) -> None:
+        if future.exception() is None:
+            future.result().close()
+
+    def _count(self, is_hedged: bool, is_won_by_hedge: bool) -> None:
+        with self._lock:
+            self._statistics.requests += 1
+            self._statistics.hedged += is_hedged
+            self._statistics.won_by_hedge += is_won_by_hedge
+
+    def get_statistics(self) -> HedgingStatistics:
+        with self._lock:
+            return replace(self._statistics)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
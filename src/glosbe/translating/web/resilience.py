@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+
+import requests.exceptions as request_exceptions
+
+
+@dataclass(frozen=True)
+class ResilienceDefaults:
+    RETRIES = 3
+    BASE_DELAY = 0.5
+    MAX_DELAY = 8.0
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    FAILURE_STATUS_CODES = (500, 502, 503, 504)
+    FAILURE_THRESHOLD = 5
+    RESET_TIMEOUT = 30.0
+    REQUEST_TIMEOUT = 15.0
+
+
+class ExceededRetriesError(request_exceptions.ConnectionError):
+    pass
+
+
+class CircuitOpenError(request_exceptions.ConnectionError):
+    pass
+
+
+class RetryPolicy:
+    '''
+    Capped exponential backoff with full jitter: the n-th retry waits a random time up to min(max_delay, base_delay * 2^n)
+    '''
+
+    def __init__(self, retries: int = ResilienceDefaults.RETRIES, base_delay: float = ResilienceDefaults.BASE_DELAY, max_delay: float = ResilienceDefaults.MAX_DELAY):
+        self.retries = retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+
+    def get_delay(self, retry: int, retry_after: float = None) -> float:
+        delay = random.uniform(0, min(self._max_delay, self._base_delay * 2 ** retry))
+        return max(delay, min(retry_after or 0, self._max_delay))
+
+    def should_retry(self, status_code: int) -> bool:
+        return status_code in ResilienceDefaults.RETRY_STATUS_CODES
+
+
+@dataclass(frozen=True)
+class CircuitStates:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker:
+    '''
+    Opens after failure_threshold consecutive failures and rejects requests until reset_timeout passes,
+    then lets a single trial request through and closes again if it succeeds.
+    A trial that has not reported back within reset_timeout is given up on and another one is let through
+    '''
+
+    def __init__(self, failure_threshold: int = ResilienceDefaults.FAILURE_THRESHOLD, reset_timeout: float = ResilienceDefaults.RESET_TIMEOUT):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+        self._state = CircuitStates.CLOSED
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def before_request(self) -> None:
+        with self._lock:
+            match self._state:
+                case CircuitStates.OPEN | CircuitStates.HALF_OPEN if time.monotonic() - self._opened_at >= self._reset_timeout:
+                    self._state = CircuitStates.HALF_OPEN
+                    self._opened_at = time.monotonic()
+                case CircuitStates.OPEN | CircuitStates.HALF_OPEN:
+                    raise CircuitOpenError('Glosbe is not responding, the request has not been sent')
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._state = CircuitStates.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == CircuitStates.HALF_OPEN or self._failures >= self._failure_threshold:
+                self._state = CircuitStates.OPEN
+                self._opened_at = time.monotonic()
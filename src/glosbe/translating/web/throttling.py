@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ThrottlingDefaults:
+    RATE = 20.0
+    MIN_RATE = 0.5
+    MAX_RATE = 50.0
+    RATE_INCREASE = 0.5
+    BURST = 20
+    CONCURRENCY = 8
+    MIN_CONCURRENCY = 1
+    MAX_CONCURRENCY = 32
+    DECREASE_FACTOR = 0.5
+    THROTTLING_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+@dataclass
+class ThrottleState:
+    rate: float
+    concurrency_limit: float
+    in_flight: int
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while (wait := self._try_acquire()) > 0:
+            time.sleep(wait)
+
+    def _try_acquire(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+
+class Throttle:
+    '''
+    Token bucket rate limiting combined with an AIMD concurrency limit. Throttling responses (429, 5xx)
+    halve both the rate and the number of requests in flight, every successful response raises them additively
+    '''
+
+    def __init__(self, rate: float = ThrottlingDefaults.RATE, burst: int = ThrottlingDefaults.BURST, concurrency: int = ThrottlingDefaults.CONCURRENCY,
+                 min_rate: float = ThrottlingDefaults.MIN_RATE, max_rate: float = ThrottlingDefaults.MAX_RATE,
+                 min_concurrency: int = ThrottlingDefaults.MIN_CONCURRENCY, max_concurrency: int = ThrottlingDefaults.MAX_CONCURRENCY):
+        self._bucket = TokenBucket(rate, burst)
+        self._min_rate, self._max_rate = min_rate, max_rate
+        self._min_concurrency, self._max_concurrency = min_concurrency, max_concurrency
+        self._concurrency_limit = float(concurrency)
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < int(self._concurrency_limit))
+            self._in_flight += 1
+        self._bucket.acquire()
+
+    def release(self, status_code: int = None, retry_after: float = None) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if status_code in ThrottlingDefaults.THROTTLING_STATUS_CODES:
+                self._decrease(retry_after)
+            elif status_code is not None:
+                self._increase()
+            self._condition.notify_all()
+
+    def _decrease(self, retry_after: float = None) -> None:
+        self._concurrency_limit = max(self._min_concurrency, self._concurrency_limit * ThrottlingDefaults.DECREASE_FACTOR)
+        self._bucket.rate = max(self._min_rate, self._bucket.rate * ThrottlingDefaults.DECREASE_FACTOR)
+        if retry_after:
+            self._bucket.pause(retry_after)
+
+    def _increase(self) -> None:
+        self._concurrency_limit = min(self._max_concurrency, self._concurrency_limit + 1 / self._concurrency_limit)
+        self._bucket.rate = min(self._max_rate, self._bucket.rate + ThrottlingDefaults.RATE_INCREASE)
+
+    def get_state(self) -> ThrottleState:
+        with self._condition:
+            return ThrottleState(self._bucket.rate, self._concurrency_limit, self._in_flight)
@@ -3,6 +3,7 @@ from typing import Any
 from ..configurations import Configurations
 from ..layoutAdjusting.layoutAdjuster import LayoutAdjustmentsMethods
 from ..translating.scrapping import TranslationTypes
+from ..translatingPrinting.formatting import OutputFormats
 from ..translatingPrinting.translationPrinter import TranslationPrinter
 from ..constants import FLAGS as F
 
@@ -42,6 +43,9 @@ class ConfigDisplayer:
             case F.C.LAYOUT_ADJUSTMENT_METHOD_LONG_FLAG:
                 TranslationPrinter.out('Possible values: ', end='')
                 TranslationPrinter.out(str([LayoutAdjustmentsMethods.NATIVE, LayoutAdjustmentsMethods.KEYBOARD, LayoutAdjustmentsMethods.NONE])[1:-1])
+            case F.C.OUTPUT_FORMAT_LONG_FLAG:
+                TranslationPrinter.out('Possible values: ', end='')
+                TranslationPrinter.out(str(OutputFormats.get_formats())[1:-1])
             case F.C.LAYOUT_ADJUSTMENT_LANG_LONG_FLAG:
                 TranslationPrinter.out('Possible values: ', end='')
                 TranslationPrinter.out(str(['uk', 'de', 'zh'])[1:-1])
@@ -1,20 +1,31 @@
 from __future__ import annotations
 
+import json
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import replace
-from itertools import product, islice, count, chain
-from typing import Iterable, Callable, Any
+from dataclasses import dataclass, replace, asdict
+from itertools import islice, count, chain
+from typing import Iterable, Callable, Any, TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
-from more_itertools import bucket, split_when
+from more_itertools import bucket, peekable, pairwise
 from numpy import ndarray
-from pandas import DataFrame, RangeIndex, MultiIndex
-from pandas.core.indexes.numeric import Int64Index, NumericIndex
 from tabulate import tabulate
 
-from ..translating.parsing.parsing import Record
+from ..translating.parsing.parsing import Record, Definition
+from ..translating.parsing.tableExtraction import ConjugationTable
 from ..translating.scrapping import TranslationResult, TranslationTypes
+from .tableRendering import RoundedOutlineRenderer
+
+if TYPE_CHECKING:
+	from pandas import DataFrame
+
+
+def _is_frame(value: Any) -> bool:
+	'''
+	Checks for a DataFrame without importing pandas, there cannot be one as long as nothing has imported it
+	'''
+	return 'pandas' in sys.modules and isinstance(value, sys.modules['pandas'].DataFrame)
 
 
 class AbstractFormatter(ABC):
@@ -248,7 +259,7 @@ class RecordFormatter(AbstractFormatter, AbstractIntoStringFormatter, AbstractIn
 
 	@classmethod
 	def format_many_into_printable_iterable(cls, records: Iterable, **kwargs):
-		records = list(records)
+		records = peekable(records)
 		if not records:
 			records = [Record(cls.NO_RECORDS_MESSAGE)]
 		yield from super().format_many_into_printable_iterable(records, **kwargs)
@@ -264,13 +275,16 @@ class TranslationFormatter(AbstractFormatter, AbstractIntoStringFormatter, Abstr
 	post_all = ''
 
 	@classmethod
-	def format(cls, translation: TranslationResult, **kwargs) -> TranslationResult:
-		translation.records = RecordFormatter.format_many(translation.records, **kwargs)
+	def format(cls, translation: TranslationResult, max_records: int = None, **kwargs) -> TranslationResult:
+		'''
+		:param max_records: the records after that many are neither read nor formatted
+		'''
+		translation.records = RecordFormatter.format_many(islice(translation.records, max_records), **kwargs)
 		return translation
 
 	@classmethod
 	def format_into_string(cls, translation: TranslationResult, **kwargs) -> str:
-		return ''.join(cls.format_into_printable_iterable(**kwargs))
+		return ''.join(cls.format_into_printable_iterable(translation, **kwargs))
 
 	@classmethod
 	def format_many_into_string(cls, translations: Iterable[TranslationResult], main_division: TranslationTypes = None, prefix_style: TranslationTypes = None, level: int =None) -> str:
@@ -325,13 +339,175 @@ class TranslationFormatter(AbstractFormatter, AbstractIntoStringFormatter, Abstr
 		yield ''.join(super().format_into_printable_iterable(translation, **kwargs))
 
 
+@dataclass(frozen=True)
+class OutputFormats:
+	TEXT = 'text'
+	JSON = 'json'
+	JSONL = 'jsonl'
+	TSV = 'tsv'
+
+	@classmethod
+	def get_formats(cls) -> list[str]:
+		return [cls.TEXT, cls.JSON, cls.JSONL, cls.TSV]
+
+
+class StructuredFormatter(AbstractFormatter):
+	'''
+	Turns the results into plain dicts and lists as they are scrapped, without the formatting for reading
+	'''
+
+	@classmethod
+	def format(cls, to_format: TranslationResult | Record | Definition | ConjugationTable | DataFrame, max_records: int = None, **kwargs) -> dict:
+		match to_format:
+			case TranslationResult():
+				records = islice(to_format.records, max_records)
+				return {**asdict(to_format.trans_args), 'records': [asdict(record) for record in records]}
+			case ConjugationTable():
+				return asdict(to_format)
+			case _ if _is_frame(to_format):
+				return {'header': [list(map(str, to_format.columns))], 'rows': to_format.values.tolist()}
+			case _:
+				return asdict(to_format)
+
+	@classmethod
+	def format_to_rows(cls, to_format: TranslationResult | Record | Definition | ConjugationTable | DataFrame, **kwargs) -> Iterable[list[str]]:
+		data = cls.format(to_format, **kwargs)
+		match to_format:
+			case TranslationResult():
+				trans_args = [data['from_lang'], data['to_lang'], data['word']]
+				for record in data['records'] or [asdict(Record())]:
+					yield trans_args + list(record.values())
+			case table if isinstance(table, ConjugationTable) or _is_frame(table):
+				yield from data['header']
+				yield from data['rows']
+			case _:
+				yield list(data.values())
+
+
+class JsonLinesFormatter(AbstractIntoStringFormatter, AbstractIntoPrintableIterableFormatter):
+	'''
+	One JSON object in a line for each result
+	'''
+
+	sep = ''
+	post_one = '\n'
+	post_all = ''
+
+	@classmethod
+	def format_into_string(cls, to_format: Any, **kwargs) -> str:
+		return json.dumps(StructuredFormatter.format(to_format, **kwargs), ensure_ascii=False)
+
+	@classmethod
+	def _format_core_into_printable_iterable(cls, to_format: Any, **kwargs) -> Iterable[str]:
+		yield cls.format_into_string(to_format, **kwargs)
+
+	@classmethod
+	def format_into_printable_iterable(cls, to_format: Any, **kwargs) -> Iterable[str]:
+		yield ''.join(super().format_into_printable_iterable(to_format, **kwargs))
+
+
+class JsonFormatter(JsonLinesFormatter):
+	'''
+	A JSON array of the results, still one result in a line
+	'''
+
+	pre_all = '[\n'
+	sep = ',\n'
+	post_one = ''
+	post_all = '\n]\n'
+
+
+class TsvFormatter(AbstractIntoStringFormatter, AbstractIntoPrintableIterableFormatter):
+	'''
+	Tab separated values, a line for each record of a translation, definition or row of a table.
+	The translations have the from_lang, to_lang, word, translation, part_of_speech and gender columns,
+	the tabs, the new lines and the backslashes in the values are escaped with a backslash
+	'''
+
+	sep = ''
+	post_all = ''
+
+	_escapes = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+	@classmethod
+	def format_into_string(cls, to_format: Any, **kwargs) -> str:
+		return ''.join(cls._format_core_into_printable_iterable(to_format, **kwargs))
+
+	@classmethod
+	def _format_core_into_printable_iterable(cls, to_format: Any, **kwargs) -> Iterable[str]:
+		for row in StructuredFormatter.format_to_rows(to_format, **kwargs):
+			yield '\t'.join(str(value).translate(cls._escapes) for value in row) + '\n'
+
+
+class CellTable:
+	'''
+	Table being formatted: its cells in a NumPy object matrix, changed in place or cut into views by the table formatters,
+	with the labels of the columns, their positions if there are none, and the row names once they are taken out of the cells.
+	It becomes a DataFrame only by to_frame
+	'''
+
+	def __init__(self, cells: ndarray, columns: list | None = None, row_names: ndarray = None, index_name: Any = None):
+		self.cells = cells
+		self.columns = columns
+		self.row_names = row_names
+		self.index_name = index_name
+
+	@classmethod
+	def from_conjugation_table(cls, table: ConjugationTable) -> CellTable:
+		columns = table.get_column_labels()
+		width = len(columns) if columns is not None else max(map(len, table.rows), default=0)
+		return cls(_to_matrix(table.rows, width), columns)
+
+	@classmethod
+	def from_frame(cls, table: DataFrame) -> CellTable:
+		return cls(table.to_numpy(dtype=object, copy=True), list(table.columns))
+
+	@property
+	def width(self) -> int:
+		return self.cells.shape[1]
+
+	def is_multi_level(self) -> bool:
+		return bool(self.columns) and isinstance(self.columns[0], tuple)
+
+	def get_label(self, i: int) -> Any:
+		return self.columns[i] if self.columns is not None else i
+
+	def get_header_rows(self) -> list[list]:
+		if self.columns is None:
+			return [list(range(self.width))]
+		if self.is_multi_level():
+			return [list(level) for level in zip(*self.columns)]
+		return [list(self.columns)]
+
+	def to_rows(self) -> list[list]:
+		if self.row_names is None:
+			return self.cells.tolist()
+		return [[row_name, *row] for row_name, row in zip(self.row_names.tolist(), self.cells.tolist())]
+
+	def to_frame(self) -> DataFrame:
+		import pandas as pd
+		columns = pd.MultiIndex.from_tuples(self.columns) if self.is_multi_level() else self.columns
+		index = None if self.row_names is None else pd.Index(self.row_names, name=self.index_name)
+		return pd.DataFrame(self.cells, columns=columns, index=index)
+
+
+def _to_matrix(rows: list[list], width: int) -> ndarray:
+	cells = np.empty((len(rows), width), dtype=object)
+	for i, row in enumerate(rows):
+		cells[i] = row
+	return cells
+
+
 class TableFormatter(AbstractFormatter, AbstractIntoStringFormatter):
 	@classmethod
-	def format_into_string(cls, table, **kwargs) -> str:
-		return tabulate(table, tablefmt='rounded_outline')
+	def format_into_string(cls, table: CellTable | DataFrame, **kwargs) -> str:
+		if isinstance(table, CellTable):
+			return RoundedOutlineRenderer.render(table.to_rows())
+		return tabulate(table, tablefmt=RoundedOutlineRenderer.tablefmt)
 
 	@classmethod
-	def format(cls, table: DataFrame, **kwargs) -> Iterable[DataFrame]:
+	def format(cls, table: ConjugationTable | DataFrame | CellTable, **kwargs) -> Iterable[CellTable]:
+		table = cls._to_cell_table(table)
 		table = HeaderToDefaultFormatter.format(table)
 		table = DataTableFormatter.format(table)
 		tables = TableSplitter.format_to_many(table)
@@ -345,19 +521,31 @@ class TableFormatter(AbstractFormatter, AbstractIntoStringFormatter):
 		for table in tables:
 			yield from cls.format(table, **kwargs)
 
+	@classmethod
+	def _to_cell_table(cls, table: ConjugationTable | DataFrame | CellTable) -> CellTable:
+		match table:
+			case ConjugationTable():
+				return CellTable.from_conjugation_table(table)
+			case _ if _is_frame(table):
+				return CellTable.from_frame(table)
+			case _:
+				return table
+
 
 class HeaderToDefaultFormatter(AbstractFormatter):
 	@classmethod
-	def format(cls, table: DataFrame, **kwargs):
-		if len(table.columns) >= 2 and (str(table.iloc[0, 0]) + str(table.iloc[0, 1]) == '01' or isinstance(table.columns, MultiIndex)):
-			table = pd.concat([table.columns.to_frame().T, table], ignore_index=True)
-			table.columns = range(len(table.columns))
+	def format(cls, table: CellTable, **kwargs) -> CellTable:
+		cells = table.cells
+		if table.width >= 2 and (table.is_multi_level() or len(cells) and str(cells[0, 0]) + str(cells[0, 1]) == '01'):
+			header = table.get_header_rows()
+			table.cells = np.concatenate([_to_matrix(header, table.width), cells])
+			table.columns = None
 		return table
 
 
 class DataTableFormatter(AbstractFormatter):
 	@classmethod
-	def format(cls, table: DataFrame, **kwargs) -> DataFrame:
+	def format(cls, table: CellTable, **kwargs) -> CellTable:
 		table = TrashRemovingFormatter.format(table)
 		table = DuplicateRemoverTableFormatter.format(table)
 		return table
@@ -368,42 +556,48 @@ class TrashRemovingFormatter(AbstractFormatter):
 	_unnamed = 'Unnamed:'
 
 	@classmethod
-	def format(cls, table: DataFrame, **kwargs) -> DataFrame:
-		for row, col in product(table.index, islice(table.columns, 3)):
-			if cls._is_trash(table.at[row, col]):
-				table.at[row, col] = list(islice(chain(cls.invisibles, count()), col + 1))[-1]
+	def format(cls, table: CellTable, **kwargs) -> CellTable:
+		head = table.cells[:, :3]
+		trash = cls._is_trash(head)
+		for i in np.flatnonzero(trash.any(axis=0)):
+			head[trash[:, i], i] = cls._get_replacement(table.get_label(i))
 
-		table.columns = list(map(lambda c: '' if cls._is_trash(c) else c, iter(table.columns)))
+		if table.columns is not None:
+			table.columns = ['' if str(c).startswith(cls._unnamed) else c for c in table.columns]
 
 		return table
 
 	@classmethod
-	def _is_trash(cls, val):
-		return str(val).startswith(cls._unnamed)
+	def _is_trash(cls, values: ndarray) -> ndarray:
+		return np.char.startswith(values.astype(str), cls._unnamed)
+
+	@classmethod
+	def _get_replacement(cls, col: int) -> str | int:
+		return list(islice(chain(cls.invisibles, count()), col + 1))[-1]
 
 
 class DuplicateRemoverTableFormatter(AbstractFormatter):
 	_replacing_value = ''
 
 	@classmethod
-	def format(cls, table: DataFrame, **kwargs) -> DataFrame:
-		last = None
-		for row, col in product(range(len(table.index)), range(len(table.columns))):
-			curr = table.iloc[row, col]
-			if last is not None and curr == last:
-				table.iloc[row, col] = cls._replacing_value
-			else:
-				last = curr
+	def format(cls, table: CellTable, **kwargs) -> CellTable:
+		'''
+		Going row by row, clears the cells equal to the cell before them
+		'''
+		cells = table.cells.ravel()
+		is_duplicate = np.zeros(len(cells), dtype=bool)
+		is_duplicate[1:] = np.not_equal(cells[:-1], None) & (cells[1:] == cells[:-1])
+		table.cells[is_duplicate.reshape(table.cells.shape)] = cls._replacing_value
 		return table
 
 
 class TableSplitter(AbstractToManyFormatter):
 	@classmethod
-	def format_to_many(cls, table: DataFrame):
-		by_empties = EmptyRowSplitter.format_to_many(table.values.tolist())
+	def format_to_many(cls, table: CellTable) -> Iterable[CellTable]:
+		by_empties = EmptyRowSplitter.format_to_many(table.cells)
 		by_types = TypeSplitter.format_many_to_many(by_empties)
 		for by_type in by_types:
-			yield pd.DataFrame(by_type, columns=range(len(by_type[0])))
+			yield CellTable(by_type)
 
 	@classmethod
 	def get_presence_list(cls, row: list[str]) -> list[bool]:
@@ -412,66 +606,70 @@ class TableSplitter(AbstractToManyFormatter):
 
 class EmptyRowSplitter(AbstractToManyFormatter):
 	@classmethod
-	def format_to_many(cls, table: list) -> Iterable[ndarray]:
-		curr_table = []
-		for row in table:
-			if any(row):
-				curr_table.append(row)
-			else:
-				yield curr_table
-				curr_table = []
-		yield curr_table
+	def format_to_many(cls, cells: ndarray) -> Iterable[ndarray]:
+		'''
+		:return: views of the parts of the cells between the rows with no value
+		'''
+		empty_rows = np.flatnonzero(~cells.astype(bool).any(axis=1))
+		start = 0
+		for end in chain(empty_rows, [len(cells)]):
+			if end > start:
+				yield cells[start:end]
+			start = end + 1
 
 
 class TypeSplitter(AbstractToManyFormatter):
 
 	@classmethod
-	def format_to_many(cls, table: ndarray) -> Iterable[list]:
-		return split_when(table, cls._should_split)
-
-	@classmethod
-	def _should_split(cls, row1, row2) -> bool:
-		return row1[0] and row1[0] != row2[0]
+	def format_to_many(cls, cells: ndarray) -> Iterable[ndarray]:
+		'''
+		:return: views of the parts of the cells split after each row whose name is not the name of the next row
+		'''
+		names, next_names = cells[:-1, 0], cells[1:, 0]
+		ends = np.flatnonzero(names.astype(bool) & (names != next_names)) + 1
+		for start, end in pairwise(chain([0], ends, [len(cells)])):
+			yield cells[start:end]
 
 
 class TableSizeAdjusterFormatter(AbstractFormatter):
 	@classmethod
-	def format(cls, table: DataFrame, **kwargs) -> DataFrame:
-		df = pd.DataFrame(table, columns=table.columns)
-		df.replace('', np.nan, inplace=True)
-		df.dropna(how='all', axis=1, inplace=True)
-		df.replace(np.nan, '', inplace=True)
-		return df
+	def format(cls, table: CellTable, **kwargs) -> CellTable:
+		cells = table.cells
+		is_na = np.equal(cells, None) | np.not_equal(cells, cells)
+		is_kept = ~(is_na | (cells == '')).all(axis=0)
+		if not is_kept.all():
+			kept = np.flatnonzero(is_kept)
+			cells, is_na = cells[:, kept], is_na[:, kept]
+			table = CellTable(cells, [table.get_label(i) for i in kept])
+		cells[is_na] = ''
+		return table
 
 
 class TableMerger(AbstractFromManyToManyFormatter):
 
 	@classmethod
-	def format_from_many(cls, tables: Iterable) -> Iterable:
-		merged = None
+	def format_from_many(cls, tables: Iterable[CellTable]) -> Iterable[CellTable]:
+		merged: list[CellTable] = []
 		for table in tables:
-			if (len([v for v in table.iloc[:, 0] if v]) == 1) and (merged is None or len(table.columns) == len(merged.columns)):
-				merged = table if merged is None else pd.concat([merged, table], ignore_index=True)
+			if np.count_nonzero(table.cells[:, 0].astype(bool)) == 1 and (not merged or table.width == merged[0].width):
+				merged.append(table)
 			else:
-				if merged is not None:
-					yield merged
-				merged = None
+				if merged:
+					yield cls._merge(merged)
+				merged = []
 				yield table
-		if merged is not None:
-			yield merged
-
+		if merged:
+			yield cls._merge(merged)
 
-class HeaderTableFormatter(AbstractFormatter):
 	@classmethod
-	def format(cls, table: DataFrame, **kwargs) -> DataFrame:
-		if isinstance(table.columns, (RangeIndex, Int64Index, NumericIndex)):
-			table, table.columns = table[1:], table.iloc[0]
-		return table
+	def _merge(cls, tables: list[CellTable]) -> CellTable:
+		return tables[0] if len(tables) == 1 else CellTable(np.concatenate([table.cells for table in tables]))
 
 
 class RowNamesTableFormatter(AbstractFormatter):
 	@classmethod
-	def format(cls, table: DataFrame, **kwargs) -> DataFrame:
-		if isinstance(table.index, (RangeIndex, Int64Index, NumericIndex)):
-			table = table.set_index(table.columns.array[0])
-		return table
\ No newline at end of file
+	def format(cls, table: CellTable, **kwargs) -> CellTable:
+		if table.row_names is None:
+			columns = [table.get_label(i) for i in range(1, table.width)]
+			table = CellTable(table.cells[:, 1:], columns, table.cells[:, 0], table.get_label(0))
+		return table
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import sys
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, TextIO
+
+
+@dataclass(frozen=True)
+class OutputDefaults:
+    BUFFER_SIZE = 64 * 1024
+    BREAK_TIME = 0.2
+
+
+class AbstractOutputSink(ABC):
+
+    @abstractmethod
+    def write(self, text: str) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        pass
+
+    def is_interactive(self) -> bool:
+        return False
+
+
+class CallbackSink(AbstractOutputSink):
+    '''
+    Passes every write to the function straight away
+    '''
+
+    def __init__(self, func: Callable[[str], object]):
+        self._func = func
+
+    def write(self, text: str) -> None:
+        self._func(text)
+
+
+class StreamSink(AbstractOutputSink):
+    '''
+    Writes to a text stream, sys.stdout at the time of writing by default.
+    The writes are gathered and written at once when there is buffer_size of them or on flush,
+    unless the buffer size is 0; a terminal is written through to by default, a pipe or a file is buffered
+    '''
+
+    def __init__(self, stream: TextIO = None, buffer_size: int = None):
+        self._stream = stream
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self.buffer_size = buffer_size if buffer_size is not None else (0 if self.is_interactive() else OutputDefaults.BUFFER_SIZE)
+
+    @property
+    def stream(self) -> TextIO:
+        return self._stream or sys.stdout
+
+    def is_interactive(self) -> bool:
+        try:
+            return self.stream.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+    def write(self, text: str) -> None:
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self.stream.write(''.join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+        self.stream.flush()
+
+
+class PacedSink(AbstractOutputSink):
+    '''
+    Shows the writes one by one with at least break_time seconds between them, for reading them as they come in a terminal
+    '''
+
+    def __init__(self, sink: AbstractOutputSink, break_time: float = OutputDefaults.BREAK_TIME):
+        self._sink = sink
+        self.break_time = break_time
+        self._last_write = None
+
+    def is_interactive(self) -> bool:
+        return self._sink.is_interactive()
+
+    def write(self, text: str) -> None:
+        if self._last_write is not None:
+            remaining = self.break_time - (time.monotonic() - self._last_write)
+            if remaining > 0:
+                time.sleep(remaining)
+        self._sink.write(text)
+        self._sink.flush()
+        self._last_write = time.monotonic()
+
+    def flush(self) -> None:
+        self._sink.flush()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import zip_longest
+from typing import Any, Iterable
+
+import tabulate as tabulating
+from tabulate import tabulate, SEPARATING_LINE
+
+
+@lru_cache(maxsize=4096)
+def _is_text(value: str) -> bool:
+    '''
+    :return: whether tabulate takes the value for a string, and not for a number or a bool
+    '''
+    if value in ('True', 'False'):
+        return False
+    try:
+        float(value)
+    except ValueError:
+        return True
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _measure(text: str, wide_chars: bool) -> tuple[str, int] | None:
+    '''
+    :return: the text as it is shown in the table and its display width, None if tabulate would treat it in a special way
+    '''
+    if '\x1b' in text or text == SEPARATING_LINE:
+        return None
+    text = text.strip()
+    width = tabulating.wcwidth.wcswidth(text) if wide_chars else len(text)
+    return (text, width) if width >= 0 else None
+
+
+class RoundedOutlineRenderer:
+    '''
+    Renders the rows as tabulate does with the rounded_outline format, without guessing the type of every cell
+    and with the display width of each distinct cell computed once.
+    A column is laid out as text as soon as one of its cells is not a number, which is the case of the conjugation tables,
+    the tables with a column of numbers only or with terminal escape codes are left to tabulate
+    '''
+
+    tablefmt = 'rounded_outline'
+
+    @classmethod
+    def render(cls, rows: list[list]) -> str:
+        columns = list(zip_longest(*rows))
+        if not columns or not all(map(cls._has_text, columns)):
+            return tabulate(rows, tablefmt=cls.tablefmt)
+        wide_chars = tabulating.wcwidth is not None and tabulating.WIDE_CHARS_MODE
+        laid_out, widths = [], []
+        for column in columns:
+            cells = [_measure('' if value is None else f'{value}', wide_chars) for value in column]
+            if None in cells:
+                return tabulate(rows, tablefmt=cls.tablefmt)
+            width = max(cell_width for _, cell_width in cells)
+            laid_out.append([text.ljust(width - cell_width + len(text)) for text, cell_width in cells])
+            widths.append(width)
+        return '\n'.join(cls._get_lines(laid_out, widths))
+
+    @classmethod
+    def _get_lines(cls, columns: list[list[str]], widths: list[int]) -> Iterable[str]:
+        yield '╭' + '┬'.join('─' * (width + 2) for width in widths) + '╮'
+        for row in zip(*columns):
+            yield '│ ' + ' │ '.join(row) + ' │'
+        yield '╰' + '┴'.join('─' * (width + 2) for width in widths) + '╯'
+
+    @classmethod
+    def _has_text(cls, column: tuple[Any, ...]) -> bool:
+        return any(isinstance(value, str) and _is_text(value) for value in column)
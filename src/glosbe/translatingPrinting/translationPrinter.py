@@ -1,16 +1,16 @@
-import sys
-import time
-from time import sleep
 from typing import Iterable, Any
 
-from .formatting import TranslationFormatter
+from .formatting import TranslationFormatter, OutputFormats, JsonFormatter, JsonLinesFormatter, TsvFormatter, AbstractIntoPrintableIterableFormatter
+from .outputSinks import AbstractOutputSink, StreamSink, PacedSink, OutputDefaults
+from ..translating.pipeline import Pipeline
 from ..translating.scrapping import TranslationResult
 
 
 class TranslationPrinter:
-    out_func = lambda to_print: print(to_print, end='')
+    sink: AbstractOutputSink = StreamSink()
     _is_turned_on = True
-    break_time = 0.2
+    _is_paced = False
+    break_time = OutputDefaults.BREAK_TIME
 
     @classmethod
     def turn_off(cls) -> None:
@@ -24,30 +24,91 @@ class TranslationPrinter:
     def turn(cls, state: bool) -> None:
         cls._is_turned_on = state
 
+    @classmethod
+    def set_sink(cls, sink: AbstractOutputSink) -> None:
+        cls.sink.flush()
+        cls.sink = sink
+
+    @classmethod
+    def set_pacing(cls, state: bool) -> None:
+        '''
+        Pacing shows the translations one by one with the break time between them, only when printing to a terminal
+        '''
+        cls._is_paced = state
+
     @classmethod
     def out(cls, to_print: Any, end=None) -> None:
+        cls._write(to_print, end, cls.sink)
+        cls.sink.flush()
+
+    @classmethod
+    def _write(cls, to_print: Any, end, sink: AbstractOutputSink) -> None:
         if not cls._is_turned_on:
             return
-        if end:
-            cls.out_func(f'{to_print}{end}')
-        else:
-            cls.out_func(to_print)
+        sink.write(f'{to_print}{end}' if end else str(to_print))
+
+    @classmethod
+    def _get_printing_sink(cls) -> AbstractOutputSink:
+        return PacedSink(cls.sink, cls.break_time) if cls._is_paced and cls.sink.is_interactive() else cls.sink
 
     @classmethod
-    def print_with_formatting(cls, translations: Iterable[TranslationResult], *, prefix_style=None, main_division=None, to_lang=None) -> None:
-        formatted = TranslationFormatter.format_many(translations, to_lang=to_lang)
+    def print_with_formatting(cls, translations: Iterable[TranslationResult], *, prefix_style=None, main_division=None, to_lang=None, max_records: int = None) -> None:
+        formatted = TranslationFormatter.format_many(translations, to_lang=to_lang, max_records=max_records)
         cls.print(formatted, prefix_style=prefix_style, main_division=main_division)
 
+    @classmethod
+    def print_pipeline(cls, translations: Pipeline, *, prefix_style=None, to_lang=None, max_records: int = None) -> None:
+        '''
+        Formats the translations in one more stage of the pipeline and prints them as they come, without grouping
+        '''
+        if not cls._is_turned_on:
+            return
+        format_translation = lambda translation: TranslationFormatter.format_into_string(TranslationFormatter.format(translation, to_lang=to_lang, max_records=max_records), prefix_style=prefix_style)
+        sink = cls._get_printing_sink()
+        try:
+            for to_print in translations.add_stage('format', format_translation):
+                cls._write(to_print, None, sink)
+                if sink.is_interactive():
+                    sink.flush()
+        finally:
+            sink.flush()
+
+    @classmethod
+    def print_structured(cls, results: Iterable, output_format: str, *, max_records: int = None) -> None:
+        '''
+        Prints the translations, definitions or tables in one of the machine readable OutputFormats, each result as soon as it comes
+        '''
+        if not cls._is_turned_on:
+            return
+        formatter = cls._get_structured_formatter(output_format)
+        try:
+            for to_print in formatter.format_many_into_printable_iterable(results, max_records=max_records):
+                cls._write(to_print, None, cls.sink)
+                if cls.sink.is_interactive():
+                    cls.sink.flush()
+        finally:
+            cls.sink.flush()
+
+    @classmethod
+    def _get_structured_formatter(cls, output_format: str) -> type[AbstractIntoPrintableIterableFormatter]:
+        match output_format:
+            case OutputFormats.JSON:
+                return JsonFormatter
+            case OutputFormats.JSONL:
+                return JsonLinesFormatter
+            case OutputFormats.TSV:
+                return TsvFormatter
+            case _:
+                raise ValueError(f'Not a structured output format: {output_format}')
+
     @classmethod
     def print(cls, translations: Iterable[TranslationResult], prefix_style=None, main_division=None) -> None:
         if not cls._is_turned_on:
             return
         printable = TranslationFormatter.format_many_into_printable_iterable(translations, prefix_style=prefix_style, main_division=main_division)
-        curr_time = time.time()
-        for to_print in printable:
-            cls.out(to_print, end='')
-            iter_time = time.time()
-            elapsed_time = iter_time - curr_time
-            if cls.break_time - elapsed_time > 0:
-                sleep(cls.break_time - elapsed_time)
-            curr_time = time.time()
\ No newline at end of file
+        sink = cls._get_printing_sink()
+        try:
+            for to_print in printable:
+                cls._write(to_print, None, sink)
+        finally:
+            sink.flush()
@@ -1,17 +1,18 @@
-from itertools import chain, islice
+from itertools import chain
+from pathlib import Path
 from typing import Callable, Iterable
 
 from more_itertools import unique_everseen
-from pandas import DataFrame
 from smartcli import Parameter, HiddenNode, Cli, Root, CliCollection, Flag
 
-from .configurations import Configurations
+from .configurations import Configurations, Paths, ConfigMessages
 from .constants import FLAGS as F
 from .layoutAdjusting.layoutAdjuster import LayoutAdjustmentsMethods, LayoutAdjusterFactory
-from .translating.parsing.parsing import Definition
+from .translating.parsing.parsing import Definition, TableSelections
 from .translating.scrapping import TranslationTypes, TranslationResult, Scrapper
 from .translatingPrinting.configDisplayer import ConfigDisplayer
-from .translatingPrinting.formatting import TableFormatter
+from .translatingPrinting.formatting import TableFormatter, OutputFormats
+from .translatingPrinting.outputSinks import CallbackSink
 from .translatingPrinting.translationPrinter import TranslationPrinter
 from .wordFilter import WordFilter
 
@@ -21,8 +22,8 @@ TO_LANGS_COL = 'to_langs'
 WORDS_COL = 'words'
 CONFS_COL = 'configurations'
 
-just_set = (F.C.LANG_LIMIT_LONG_FLAG, F.C.DOUBLE_MODE_STYLE_LONG_FLAG, F.C.LAYOUT_ADJUSTMENT_METHOD_LONG_FLAG, F.C.LAYOUT_ADJUSTMENT_LANG_LONG_FLAG)
-just_display = (F.C.LANG_LIMIT_LONG_FLAG, F.C.DEFAULT_MODE_LONG_FLAG, F.C.LANGS_SHOW_LONG_FLAG, F.C.DOUBLE_MODE_STYLE_LONG_FLAG, F.C.LAYOUT_ADJUSTMENT_METHOD_LONG_FLAG, F.C.LAYOUT_ADJUSTMENT_LANG_LONG_FLAG)
+just_set = (F.C.LANG_LIMIT_LONG_FLAG, F.C.DOUBLE_MODE_STYLE_LONG_FLAG, F.C.LAYOUT_ADJUSTMENT_METHOD_LONG_FLAG, F.C.LAYOUT_ADJUSTMENT_LANG_LONG_FLAG, F.C.MAX_WORKERS_LONG_FLAG, F.C.MAX_RECORDS_LONG_FLAG, F.C.OUTPUT_FORMAT_LONG_FLAG)
+just_display = (F.C.LANG_LIMIT_LONG_FLAG, F.C.DEFAULT_MODE_LONG_FLAG, F.C.LANGS_SHOW_LONG_FLAG, F.C.DOUBLE_MODE_STYLE_LONG_FLAG, F.C.LAYOUT_ADJUSTMENT_METHOD_LONG_FLAG, F.C.LAYOUT_ADJUSTMENT_LANG_LONG_FLAG, F.C.MAX_WORKERS_LONG_FLAG, F.C.MAX_RECORDS_LONG_FLAG, F.C.OUTPUT_FORMAT_LONG_FLAG)
 display_with_arg = (F.C.LAST_LANG_LONG_FLAG, )
 other_config = (F.C.LAST_1_LONG_FLAG, F.C.LAST_2_LONG_FLAG, F.C.ADD_LANG_LONG_FLAG, F.C.REMOVE_LANG_LONG_FLAG, F.C.SETTINGS_LONG_FLAG, F.F.SYNOPSIS_LONG_FLAG)
 
@@ -31,7 +32,10 @@ modes = (F.M.SINGLE_LONG_FLAG, F.M.LANG_LONG_FLAG, F.M.WORD_LONG_FLAG)
 
 class TranslatorCli(Cli):
 
-    def __init__(self, args: list[str] = None):
+    def __init__(self, args: list[str] = None, cache_dir: Path = Paths.RESOURCES_DIR):
+        '''
+        :param cache_dir: directory of the on-disk cache of the scrapped pages
+        '''
         super().__init__(args=args)
         self._current_modes: CliCollection
         self._from_langs: CliCollection
@@ -61,7 +65,7 @@ class TranslatorCli(Cli):
         self._cconjugation_flag: Flag
         self._definition_flag: Flag
 
-        self._scrapper = Scrapper()
+        self._scrapper = Scrapper(cache_dir=cache_dir)
         self._translation_printer = TranslationPrinter()
         self._word_filter = WordFilter()
         self._is_translating = True
@@ -151,9 +155,14 @@ class TranslatorCli(Cli):
         self.root.add_flag(F.C.DOUBLE_MODE_STYLE_LONG_FLAG, F.C.DOUBLE_MODE_STYLE_SHORT_FLAG, flag_limit=1)
         self.root.add_flag(F.C.LAYOUT_ADJUSTMENT_METHOD_LONG_FLAG, F.C.LAYOUT_ADJUSTMENT_METHOD_SHORT_FLAG, flag_limit=1)
         self.root.add_flag(F.C.LAYOUT_ADJUSTMENT_LANG_LONG_FLAG, F.C.LAYOUT_ADJUSTMENT_LANG_SHORT_FLAG, flag_limit=1)
+        self.root.add_flag(F.C.MAX_WORKERS_LONG_FLAG, F.C.MAX_WORKERS_SHORT_FLAG, flag_lower_limit=0, flag_limit=1)
+        self.root.add_flag(F.C.MAX_RECORDS_LONG_FLAG, F.C.MAX_RECORDS_SHORT_FLAG, flag_lower_limit=0, flag_limit=1)
+        self.root.add_flag(F.C.OUTPUT_FORMAT_LONG_FLAG, F.C.OUTPUT_FORMAT_SHORT_FLAG, flag_limit=1)
 
     def _create_functional_flags(self) -> None:
         self.root.add_flag(F.F.SILENT_LONG_FLAG, flag_limit=0)
+        self.root.add_flag(F.F.PACED_LONG_FLAG, flag_limit=0)
+        self.root.add_flag(F.F.HEDGING_LONG_FLAG, flag_limit=0)
         self.root.add_flag(F.F.REVERSE_LONG_FLAG, F.F.REVERSE_SHORT_FLAG, flag_limit=0)
         self.root.add_flag(F.F.SYNOPSIS_LONG_FLAG, F.F.SYNOPSIS_SHORT_FLAG, flag_limit=0)
         self.root.add_flag(F.F.FROM_LANG_LONG_FLAG, F.F.FROM_LANG_SHORT_FLAG, flag_limit=1, storage=self._from_langs)
@@ -178,9 +187,16 @@ class TranslatorCli(Cli):
         self.root.get_flag(F.C.DOUBLE_MODE_STYLE_LONG_FLAG).set_get_default(lambda: Configurations.get_conf(F.C.DOUBLE_MODE_STYLE_LONG_FLAG))
         self.root.get_flag(F.C.LAYOUT_ADJUSTMENT_METHOD_LONG_FLAG).set_get_default(Configurations.get_adjustment_method)
         self.root.get_flag(F.C.LAYOUT_ADJUSTMENT_LANG_LONG_FLAG).set_get_default(Configurations.get_adjustment_lang)
+        self._root.get_flag(F.C.MAX_WORKERS_LONG_FLAG).set_type(int)
+        self.root.get_flag(F.C.MAX_WORKERS_LONG_FLAG).set_get_default(Configurations.get_max_workers)
+        self._root.get_flag(F.C.MAX_RECORDS_LONG_FLAG).set_type(int)
+        self.root.get_flag(F.C.MAX_RECORDS_LONG_FLAG).set_get_default(Configurations.get_max_records)
+        self.root.get_flag(F.C.OUTPUT_FORMAT_LONG_FLAG).set_get_default(Configurations.get_output_format)
 
     def _configure_functional_flags(self) -> None:
         self.root.get_flag(F.F.SILENT_LONG_FLAG).when_active(lambda: TranslationPrinter.turn(False))
+        self.root.get_flag(F.F.PACED_LONG_FLAG).when_active(lambda: TranslationPrinter.set_pacing(True))
+        self.root.get_flag(F.F.HEDGING_LONG_FLAG).when_active(lambda: self._scrapper.set_hedging(True))
         self.root.get_flag(F.F.SYNOPSIS_LONG_FLAG).when_active(lambda: TranslationPrinter.out(self.root.help.synopsis))
 
     def _create_params(self) -> None:
@@ -253,16 +269,16 @@ class TranslatorCli(Cli):
 
     def _cli_translate(self):
         # TODO: fix reverse mode for single
-        return self._scrapper.scrap_translation(from_lang=self._from_langs.get(), to_langs=self._to_langs.get_as_list(), words=self._words.get_as_list())
+        return self._scrapper.scrap_translation(from_lang=self._from_langs.get(), to_langs=self._to_langs.get_as_list(), words=self._words.get_as_list(), max_workers=Configurations.get_max_workers(), max_records=Configurations.get_max_records())
 
     def _translate_single(self) -> None:  # TODO: write a test for conj in single
         if self._conjugation_flag.is_inactive():
             return self._translate(self._cli_translate, prefix_style=TranslationTypes.SINGLE)
         else:
             self._correct_misplaced()
-            result = self._scrapper.scrap_translation_and_conjugation(from_lang=self._from_langs.get(), to_lang=self._to_langs.get(), word=self._words.get())
+            result = self._scrapper.scrap_translation_and_conjugation(from_lang=self._from_langs.get(), to_lang=self._to_langs.get(), word=self._words.get(), selection=self._get_table_selection(), max_records=Configurations.get_max_records())
             translations = next(result)
-            TranslationPrinter.print_with_formatting(translations, prefix_style=TranslationTypes.SINGLE)
+            self._print_translations(translations, prefix_style=TranslationTypes.SINGLE)
             conjugations = next(result)
             self._print_conjugations(conjugations)
             return translations
@@ -271,7 +287,17 @@ class TranslatorCli(Cli):
         return self._translate(self._cli_translate, prefix_style=TranslationTypes.LANG)
 
     def _translate_multi_word(self) -> None:
-        return self._translate(self._cli_translate, prefix_style=TranslationTypes.WORD)
+        '''
+        Prints the translations as they come out of the pipeline, nothing is returned since the printing consumes it
+        '''
+        if self._is_structured_output():
+            self._translate(self._cli_translate, prefix_style=TranslationTypes.WORD)
+            return
+        self._correct_misplaced()
+        if self._is_translating:
+            translations = self._scrapper.scrap_translation_pipelined(from_lang=self._from_langs.get(), to_langs=self._to_langs.get_as_list(), words=self._words.get_as_list(),
+                                                                      max_records=Configurations.get_max_records(), fetch_workers=max(Configurations.get_max_workers(), 1))
+            TranslationPrinter.print_pipeline(translations, prefix_style=TranslationTypes.WORD, to_lang=self._to_langs.get())
 
     def _translate_double(self) -> None:
         main_division = self.root.get_flag(F.C.DOUBLE_MODE_STYLE_LONG_FLAG).get()
@@ -280,24 +306,21 @@ class TranslatorCli(Cli):
         return translations
 
     def _get_conjugation(self) -> None:
-        tables = self._scrapper.scrap_conjugation(self._from_langs.get(), self._words.get())  # Check if it's being parsed well
+        tables = self._scrapper.scrap_conjugation(self._from_langs.get(), self._words.get(), selection=self._get_table_selection())  # Check if it's being parsed well
         self._print_conjugations(tables)
 
     def _print_conjugations(self, tables: Iterable) -> None:
-        filtered = self._filter_unnecessary_tables(tables)
-        formatted = TableFormatter.format_many(filtered)
+        if self._is_structured_output():
+            return TranslationPrinter.print_structured(tables, Configurations.get_output_format())
+        formatted = TableFormatter.format_many(tables)
         string = TableFormatter.format_many_into_string(formatted, sep='\n\n')
         TranslationPrinter.out(string)
 
     # TODO: test
-    def _filter_unnecessary_tables(self, tables: Iterable[DataFrame]) -> Iterable[DataFrame]:
+    def _get_table_selection(self) -> str:
         if self._conjugation_flag.is_active():
-            return islice(tables, 1)
-        tables_instances = list(tables)
-        length = len(tables_instances)
-        if length > 1:
-            return tables_instances[length//2:]
-        return tables_instances
+            return TableSelections.FIRST
+        return TableSelections.SECOND_HALF
 
     def _get_prefix_style_for_main_division(self, main_division: TranslationTypes) -> TranslationTypes:
         match main_division:
@@ -313,6 +336,8 @@ class TranslatorCli(Cli):
         self._print_definitions(definitions)
 
     def _print_definitions(self, definitions: Iterable[Definition]) -> None:  # TODO add simple formatter
+        if self._is_structured_output():
+            return TranslationPrinter.print_structured(definitions, Configurations.get_output_format())
         for definition in definitions:
             if definition.example:
                 TranslationPrinter.out(f'-{definition.definition.replace(".", ":")}\n\t{definition.example}\n')
@@ -323,9 +348,18 @@ class TranslatorCli(Cli):
         self._correct_misplaced()
         if self._is_translating:
             translation = translate()
-            TranslationPrinter.print_with_formatting(translation, prefix_style=prefix_style, main_division=main_division, to_lang=self._to_langs.get() if len(self._to_langs) == 1 else None)
+            self._print_translations(translation, prefix_style=prefix_style, main_division=main_division, to_lang=self._to_langs.get() if len(self._to_langs) == 1 else None)
             return translation
 
+    def _print_translations(self, translations: Iterable[TranslationResult], **kwargs) -> None:
+        if self._is_structured_output():
+            TranslationPrinter.print_structured(translations, Configurations.get_output_format())
+        else:
+            TranslationPrinter.print_with_formatting(translations, **kwargs)
+
+    def _is_structured_output(self) -> bool:
+        return Configurations.get_output_format() != OutputFormats.TEXT
+
     def _configure_lang_node(self) -> None:
         self._lang_node.set_active_on_flags_in_collection(self._current_modes, self._lang_flag, but_not=self._word_flag)
 
@@ -392,6 +426,9 @@ class TranslatorCli(Cli):
 
     def _set_flag_confs(self, *flags: Flag) -> None:
         for flag in flags:
+            if flag.name == F.C.OUTPUT_FORMAT_LONG_FLAG and flag.get() not in OutputFormats.get_formats():
+                TranslationPrinter.out(ConfigMessages.WRONG_OUTPUT_FORMAT.format(flag.get(), ', '.join(OutputFormats.get_formats())))
+                continue
             Configurations.set_conf(flag.name, flag.get())
 
     def _to_flag(self, to_flag: str) -> str:
@@ -419,7 +456,7 @@ class TranslatorCli(Cli):
     def set_out_stream(self, out):
         super().set_out_stream(out)
         ConfigDisplayer.out_func = out
-        TranslationPrinter.out_func = out
+        TranslationPrinter.set_sink(CallbackSink(out))
 
     def _correct_misplaced(self):
         '''
@@ -1,4 +1,6 @@
 import abc
+import tempfile
+from pathlib import Path
 
 from src.glosbe.translatorCli import TranslatorCli
 from tests.abstractTest import AbstractTest
@@ -10,13 +12,15 @@ class AbstractCliTest(AbstractTest, abc.ABC):
 	@classmethod
 	def setUpClass(cls) -> None:
 		super().setUpClass()
-		cls.cli = TranslatorCli()
+		cls._cache_dir = tempfile.TemporaryDirectory()
+		cls.cli = TranslatorCli(cache_dir=Path(cls._cache_dir.name))
 		cls.cli.turn_off_translating()
 
 	@classmethod
 	def tearDownClass(cls) -> None:
 		super().tearDownClass()
 		cls.cli.turn_on_translating()
+		cls._cache_dir.cleanup()
 
 	def get_file_name(self) -> str:
 		return self._get_test_name()
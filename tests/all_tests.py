@@ -2,16 +2,25 @@ import unittest
 
 from tests.LayoutAdjusterTest import LayoutAdjusterTest
 from tests.abstractTest import AbstractTest
+from tests.asyncScrappingTest import AsyncScrappingTest
+from tests.cachingTest import CachingTest
 from tests.configurationTest import ConfigurationTest
 from tests.doubleModeCliTest import DoubleModeCliTest
 from tests.flagSettingTest import FlagSettingTest
 from tests.formattingTest import FormattingTest
 from tests.funtionalFlagsTest import FunctionalFlagsTest
+from tests.hedgingTest import HedgingTest
 from tests.helpTest import HelpTest
 from tests.misplacedTest import MisplacedTest
 from tests.multiLangTranslationTest import MultiLangCliTest
 from tests.multiWordTranslationTest import MultiWordCliTest
+from tests.outputSinkTest import OutputSinkTest
+from tests.parsingTest import ParsingTest
+from tests.pipelineTest import PipelineTest
+from tests.resilienceTest import ResilienceTest
+from tests.scrappingTest import ScrappingTest
 from tests.singleTranslationTest import SingleModeCliTest
+from tests.throttlingTest import ThrottlingTest
 
 tests = [
     SingleModeCliTest,
@@ -25,6 +34,15 @@ tests = [
     FunctionalFlagsTest,
     ConfigurationTest,
     LayoutAdjusterTest,
+    ScrappingTest,
+    AsyncScrappingTest,
+    CachingTest,
+    ThrottlingTest,
+    ResilienceTest,
+    HedgingTest,
+    ParsingTest,
+    PipelineTest,
+    OutputSinkTest,
 ]
 
 
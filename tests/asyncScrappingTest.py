@@ -0,0 +1,79 @@
+import asyncio
+from unittest import skipIf
+from unittest.mock import MagicMock, patch
+
+from src.glosbe.translating.scrapping import Scrapper, ErrorMessages
+from tests.abstractTest import AbstractTest
+from tests.localGlosbe import LocalGlosbe
+
+try:
+	from src.glosbe.translating.asyncScrapping import AsyncScrapper
+except ImportError:
+	AsyncScrapper = None
+
+
+@skipIf(AsyncScrapper is None, 'aiohttp is not installed')
+class AsyncScrappingTest(AbstractTest):
+
+	glosbe: LocalGlosbe
+
+	@classmethod
+	def _get_test_name(cls) -> str:
+		return 'Async Scrapping'
+
+	@classmethod
+	def setUpClass(cls) -> None:
+		super().setUpClass()
+		cls.glosbe = LocalGlosbe()
+		cls.glosbe.start()
+
+	@classmethod
+	def tearDownClass(cls) -> None:
+		cls.glosbe.stop()
+		super().tearDownClass()
+
+	def test_translation_is_the_same_as_synchronous(self):
+		async def scrap():
+			async with AsyncScrapper() as scrapper:
+				return [translation async for translation in scrapper.scrap_translation('pl', ['de', 'es'], ['piec', 'dom', 'kot'])]
+
+		expected = list(Scrapper().scrap_translation('pl', ['de', 'es'], ['piec', 'dom', 'kot'], max_workers=4))
+		actual = asyncio.run(scrap())
+
+		self.assertEqual([t.trans_args for t in expected], [t.trans_args for t in actual])
+		self.assertEqual([t.records for t in expected], [t.records for t in actual])
+
+	def test_wrong_status_code_becomes_record(self):
+		self.glosbe.statuses['nieistniejące'] = 404
+
+		async def scrap():
+			async with AsyncScrapper() as scrapper:
+				return await scrapper.translate_single('pl', 'de', 'nieistniejące')
+
+		translation = asyncio.run(scrap())
+		self.assertEqual(1, len(translation.records))
+		self.assertIn('404', translation.records[0].translation)
+
+	def test_definitions_and_conjugation(self):
+		async def scrap():
+			async with AsyncScrapper() as scrapper:
+				definitions = [definition async for definition in scrapper.scrap_definition('pl', 'piec')]
+				tables = [table async for table in scrapper.scrap_conjugation('pl', 'piec')]
+				return definitions, tables
+
+		definitions, tables = asyncio.run(scrap())
+		self.assertEqual(list(Scrapper().scrap_definition('pl', 'piec')), definitions)
+		self.assertEqual(2, len(tables))
+
+	def test_timed_out_request_becomes_record(self):
+		session = MagicMock()
+		session.get.return_value.__aenter__.side_effect = asyncio.TimeoutError
+
+		async def scrap():
+			async with AsyncScrapper() as scrapper:
+				with patch.object(scrapper, '_get_session', return_value=session):
+					return [translation async for translation in scrapper.scrap_translation('pl', 'de', ['piec', 'dom'])]
+
+		translations = asyncio.run(scrap())
+		self.assertEqual(['piec', 'dom'], [translation.trans_args.word for translation in translations])
+		self.assertEqual([[ErrorMessages.CONNECTION_ERROR]] * 2, [[record.translation for record in translation.records] for translation in translations])
@@ -0,0 +1,110 @@
+import tempfile
+import time
+from pathlib import Path
+
+from src.glosbe.translating.caching import TranslationCache, ConjugationCache, DefinitionCache
+from src.glosbe.translating.parsing.parsing import Record, Definition
+from src.glosbe.translating.scrapping import Scrapper
+from src.glosbe.translating.web.connector import TransArgs, Connector
+from tests.abstractTest import AbstractTest
+from tests.localGlosbe import LocalGlosbe
+
+
+class CachingTest(AbstractTest):
+
+	@classmethod
+	def _get_test_name(cls) -> str:
+		return 'Caching'
+
+	def setUp(self) -> None:
+		super().setUp()
+		self._dir = tempfile.TemporaryDirectory()
+		self.path = Path(self._dir.name)
+
+	def tearDown(self) -> None:
+		super().tearDown()
+		self._dir.cleanup()
+
+	def test_stored_records_are_returned(self):
+		cache = TranslationCache(self.path / 'cache.sqlite')
+		records = [Record('Ofen', 'noun', 'masculine'), Record('backen', 'verb')]
+		cache.set(TransArgs('pl', 'de', 'piec'), records)
+
+		self.assertEqual(records, cache.get(TransArgs('pl', 'de', 'piec')))
+		self.assertIsNone(cache.get(TransArgs('pl', 'es', 'piec')))
+
+	def test_cache_persists_between_instances(self):
+		TranslationCache(self.path / 'cache.sqlite').set(TransArgs('pl', 'de', 'piec'), [Record('Ofen')])
+		self.assertEqual([Record('Ofen')], TranslationCache(self.path / 'cache.sqlite').get(TransArgs('pl', 'de', 'piec')))
+
+	def test_expired_entries_are_not_returned(self):
+		cache = TranslationCache(self.path / 'cache.sqlite', ttl=0.05)
+		cache.set(TransArgs('pl', 'de', 'piec'), [Record('Ofen')])
+		time.sleep(0.1)
+
+		self.assertIsNone(cache.get(TransArgs('pl', 'de', 'piec')))
+		self.assertEqual(0, len(cache))
+
+	def test_least_recently_used_entry_is_evicted(self):
+		cache = TranslationCache(self.path / 'cache.sqlite', max_entries=2)
+		cache.set(TransArgs('pl', 'de', 'piec'), [Record('Ofen')])
+		cache.set(TransArgs('pl', 'de', 'dom'), [Record('Haus')])
+		cache.get(TransArgs('pl', 'de', 'piec'))
+		cache.set(TransArgs('pl', 'de', 'kot'), [Record('Katze')])
+
+		self.assertEqual(2, len(cache))
+		self.assertIsNone(cache.get(TransArgs('pl', 'de', 'dom')))
+		self.assertIsNotNone(cache.get(TransArgs('pl', 'de', 'piec')))
+		self.assertIsNotNone(cache.get(TransArgs('pl', 'de', 'kot')))
+
+	def test_hit_is_faster_than_a_millisecond(self):
+		cache = TranslationCache(self.path / 'cache.sqlite')
+		trans_args = TransArgs('pl', 'de', 'piec')
+		cache.set(trans_args, [Record('Ofen', 'noun', 'masculine')] * 10)
+
+		repeats = 1000
+		start = time.perf_counter()
+		for _ in range(repeats):
+			cache.get(trans_args)
+		self.assertLess((time.perf_counter() - start) / repeats, 0.001)
+
+	def test_scrapper_does_not_fetch_cached_translations(self):
+		with LocalGlosbe() as glosbe:
+			scrapper = Scrapper(Connector(), cache_dir=self.path)
+			first = [list(t.records) for t in scrapper.scrap_translation('pl', ['de', 'es'], ['piec'])]
+			requests_count = glosbe.requests_count
+			second = [list(t.records) for t in scrapper.scrap_translation('pl', ['de', 'es'], ['piec'])]
+
+			self.assertEqual(2, requests_count)
+			self.assertEqual(requests_count, glosbe.requests_count)
+			self.assertEqual(first, second)
+
+	def test_conjugation_tables_are_restored(self):
+		with LocalGlosbe():
+			tables = list(Scrapper(Connector()).scrap_conjugation('pl', 'piec'))
+		cache = ConjugationCache(self.path / 'cache.sqlite')
+		cache.set(('pl', 'piec'), tables)
+
+		restored = cache.get(('pl', 'piec'))
+		self.assertEqual(2, len(restored))
+		self.assertEqual(tables, restored)
+
+	def test_definitions_are_restored(self):
+		cache = DefinitionCache(self.path / 'cache.sqlite')
+		definitions = [Definition('a stove', 'the stove is hot'), Definition('an oven')]
+		cache.set(('en', 'en', 'stove'), definitions)
+
+		self.assertEqual(definitions, cache.get(('en', 'en', 'stove')))
+		self.assertIsNone(cache.get(('en', 'de', 'stove')))
+		self.assertIsNone(cache.get(('en', 'en', 'oven')))
+
+	def test_scrapper_does_not_fetch_cached_conjugations_and_definitions(self):
+		with LocalGlosbe() as glosbe:
+			scrapper = Scrapper(Connector(), cache_dir=self.path)
+			first = list(scrapper.scrap_conjugation('pl', 'piec')), list(scrapper.scrap_definition('pl', 'piec'))
+			requests_count = glosbe.requests_count
+			second = list(scrapper.scrap_conjugation('pl', 'piec')), list(scrapper.scrap_definition('pl', 'piec'))
+
+			self.assertEqual(2, requests_count)
+			self.assertEqual(requests_count, glosbe.requests_count)
+			self.assertEqual(first, second)
@@ -1,9 +1,10 @@
 from parameterized import parameterized
 from smartcli.nodes.smartList import SmartList
 
-from src.glosbe.configurations import Configurations
+from src.glosbe.configurations import Configurations, ConfigMessages
 from src.glosbe.constants import FLAGS as F
 from src.glosbe.translating.scrapping import TranslationTypes
+from src.glosbe.translatingPrinting.formatting import OutputFormats
 from src.glosbe.translatingPrinting.translationPrinter import TranslationPrinter
 from tests.abstractCliTest import AbstractCliTest
 
@@ -132,4 +133,16 @@ class FlagSettingTest(AbstractCliTest):
 	])
 	def test_double_mode_formatting_in_one_flag(self, name: str, style: TranslationTypes, flag: str):
 		self.cli.parse(f't {flag} {style}')
-		self.assertEqual(style, Configurations.get_conf(F.C.DOUBLE_MODE_STYLE_LONG_FLAG))
\ No newline at end of file
+		self.assertEqual(style, Configurations.get_conf(F.C.DOUBLE_MODE_STYLE_LONG_FLAG))
+	@parameterized.expand([
+		('long_flag', F.C.OUTPUT_FORMAT_LONG_FLAG),
+		('short_flag', F.C.OUTPUT_FORMAT_SHORT_FLAG),
+	])
+	def test_wrong_output_format_is_not_saved(self, name: str, flag: str):
+		text = SmartList()
+		self.cli.set_out_stream(text.__iadd__)
+
+		self.cli.parse(f't {flag} xml')
+
+		self.assertEqual(OutputFormats.TEXT, Configurations.get_output_format())
+		self.assertIn(ConfigMessages.WRONG_OUTPUT_FORMAT.format('xml', ', '.join(OutputFormats.get_formats())), text)
@@ -1,9 +1,16 @@
+import json
 from typing import Any, Type
 
+from pandas import DataFrame
 from parameterized import parameterized
+from tabulate import tabulate
 
-from src.glosbe.translatingPrinting.formatting import GenderFormatter, PartOfSpeechFormatter, AbstractFormatter
+from src.glosbe.translating.parsing.parsing import Definition
+from src.glosbe.translating.parsing.tableExtraction import ConjugationTable
+from src.glosbe.translatingPrinting.formatting import GenderFormatter, PartOfSpeechFormatter, AbstractFormatter, JsonLinesFormatter, JsonFormatter, TsvFormatter, DataTableFormatter, CellTable, TableFormatter
+from src.glosbe.translatingPrinting.tableRendering import RoundedOutlineRenderer
 from tests.abstractCliTest import AbstractCliTest
+from tests.translationResults import get_translations
 
 
 class FormattingTest(AbstractCliTest):
@@ -22,4 +29,78 @@ class FormattingTest(AbstractCliTest):
 		name_func=lambda method, param_num, param: f'{method.__name__}_{param_num}_format_{param.args[0]}_with_{param.args[2].__name__}'
 	)
 	def test_formatter(self, arg: Any, expected: Any, formatter: Type[AbstractFormatter]):
-		self.assertEqual(expected, formatter.format(arg))
\ No newline at end of file
+		self.assertEqual(expected, formatter.format(arg))
+
+	def test_json_lines_stream_a_result_in_a_line(self):
+		lines = list(JsonLinesFormatter.format_many_into_printable_iterable(get_translations()))
+
+		self.assertEqual(2, len(lines))
+		self.assertTrue(all(line.endswith('\n') for line in lines))
+		self.assertEqual({'from_lang': 'pl', 'to_lang': 'de', 'word': 'piec', 'records': [
+			{'translation': 'Ofen', 'part_of_speech': 'noun', 'gender': 'masculine'},
+			{'translation': 'backen', 'part_of_speech': 'verb', 'gender': ''},
+		]}, json.loads(lines[0]))
+
+	def test_json_is_an_array_of_the_results(self):
+		string = ''.join(JsonFormatter.format_many_into_printable_iterable(get_translations(), max_records=1))
+
+		self.assertEqual([['Ofen'], []], [[record['translation'] for record in result['records']] for result in json.loads(string)])
+		self.assertEqual([], json.loads(''.join(JsonFormatter.format_many_into_printable_iterable([]))))
+
+	def test_tsv_has_a_line_for_each_record(self):
+		string = ''.join(TsvFormatter.format_many_into_printable_iterable(get_translations()))
+
+		self.assertEqual('pl\tde\tpiec\tOfen\tnoun\tmasculine\npl\tde\tpiec\tbacken\tverb\t\npl\tde\tbrak\t\t\t\n', string)
+
+	def test_tsv_escapes_the_separators(self):
+		string = TsvFormatter.format_into_string(Definition('with\ttab', 'two\nlines \\'))
+
+		self.assertEqual('with\\ttab\ttwo\\nlines \\\\\n', string)
+
+	def test_tsv_of_a_table_has_the_header_and_the_rows(self):
+		table = ConjugationTable([['', 'Singular', 'Plural']], [['1.', 'mache', 'machen'], ['2.', 'machst', 'macht']])
+		string = TsvFormatter.format_into_string(table)
+
+		self.assertEqual('\tSingular\tPlural\n1.\tmache\tmachen\n2.\tmachst\tmacht\n', string)
+
+	def test_trash_and_duplicates_are_cleared(self):
+		table = DataFrame([
+			['Unnamed: 0', 'Unnamed: 1', 'Plural', 'Plural'],
+			['1.', 'mache', 'mache', 'machen'],
+			['Unnamed: 0', 'machst', 'macht', 'macht'],
+		], columns=[0, 1, 2, 'Unnamed: 3'])
+		table = DataTableFormatter.format(CellTable.from_frame(table))
+
+		self.assertEqual([0, 1, 2, ''], table.columns)
+		self.assertEqual([
+			['', ' ', 'Plural', ''],
+			['1.', 'mache', '', 'machen'],
+			['', 'machst', 'macht', ''],
+		], table.to_rows())
+
+	def test_table_is_split_merged_and_named_by_its_rows(self):
+		table = ConjugationTable([['', 'Singular', 'Plural']], [
+			['Präsens', '', ''],
+			['ich', 'mache', 'mache'],
+			['du', 'machst', ''],
+			['', '', ''],
+			['Imperativ', 'mach', ''],
+			['Partizip', 'gemacht', ''],
+		])
+		tables = list(TableFormatter.format(table))
+
+		self.assertEqual([[['Präsens', ''], ['ich', 'mache'], ['du', 'machst'], ['Imperativ', 'mach'], ['Partizip', 'gemacht']]], [table.to_rows() for table in tables])
+		frame = tables[0].to_frame()
+		self.assertEqual(['Präsens', 'ich', 'du', 'Imperativ', 'Partizip'], list(frame.index))
+		self.assertEqual([1], list(frame.columns))
+
+	@parameterized.expand([
+		('latin', [['ich', 'mache', ' '], ['du', 'machst', None]]),
+		('cyrillic', [['я', 'делаю', ''], ['ты', 'делаешь', 'делай']]),
+		('cjk', [['我', '做', '  '], ['你们', '做', 'ｆｕｌｌ']]),
+		('number_column', [['1.', 'mache'], ['2.', 'machst']]),
+		('escape_codes', [['ich', '\x1b[31mmache\x1b[0m']]),
+		('empty', []),
+	])
+	def test_renderer_matches_tabulate(self, name: str, rows: list[list]):
+		self.assertEqual(tabulate(rows, tablefmt='rounded_outline'), RoundedOutlineRenderer.render(rows))
@@ -3,6 +3,8 @@ import unittest
 from parameterized import parameterized
 
 from src.glosbe.configurations import Configurations
+from src.glosbe.constants import FLAGS as F
+from src.glosbe.translating.web.hedging import Hedger
 from tests.abstractCliTest import AbstractCliTest
 
 
@@ -30,6 +32,13 @@ class FunctionalFlagsTest(AbstractCliTest):
 		self.assertCountEqual(e_from_langs, from_lang.get_as_list())
 		self.assertCountEqual(e_to_langs, to_langs.get_as_list())
 
+	def test_hedging_flag_turns_hedging_on(self):
+		self.addCleanup(self.cli._scrapper.set_hedging, False)
+		self.cli.turn_off_translating()
+		self.cli.parse(f't żal de pl {F.F.HEDGING_LONG_FLAG}')
+
+		self.assertIsInstance(self.cli._scrapper._connector._hedger, Hedger)
+
 	@parameterized.expand([
 		('', '', [], [], [], '')
 	])
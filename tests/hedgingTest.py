@@ -0,0 +1,61 @@
+from itertools import count
+
+from src.glosbe.translating.scrapping import Scrapper
+from src.glosbe.translating.web.connector import Connector, TransArgs
+from src.glosbe.translating.web.hedging import Hedger, LatencyTracker
+from tests.abstractTest import AbstractTest
+from tests.localGlosbe import LocalGlosbe
+
+
+class HedgingTest(AbstractTest):
+
+	@classmethod
+	def _get_test_name(cls) -> str:
+		return 'Hedging'
+
+	def test_delay_is_initial_until_enough_samples_then_percentile(self):
+		hedger = Hedger(percentile=0.9, min_samples=10, initial_delay=1.0)
+		self.assertEqual(1.0, hedger.get_delay())
+		for latency in range(1, 11):
+			hedger._latencies.record(latency / 100)
+		self.assertEqual(0.1, hedger.get_delay())
+		hedger.shutdown()
+
+	def test_latency_tracker_keeps_only_recent_window(self):
+		tracker = LatencyTracker(window=3)
+		for latency in (5, 1, 2, 3):
+			tracker.record(latency)
+		self.assertEqual(3, len(tracker))
+		self.assertEqual(3, tracker.get_percentile(1.0))
+
+	def test_slow_response_is_won_by_hedge(self):
+		calls = count()
+		with LocalGlosbe(latency=lambda: 1.0 if next(calls) == 0 else 0.0) as glosbe:
+			hedger = Hedger(min_samples=0, initial_delay=0.05)
+			connector = Connector(hedger=hedger)
+			response = connector.get_page(TransArgs('pl', 'de', 'piec').to_url())
+
+			self.assertEqual(200, response.status_code)
+			statistics = connector.get_hedging_statistics()
+			self.assertEqual(1, statistics.hedged)
+			self.assertEqual(1, statistics.won_by_hedge)
+			self.assertEqual(2, glosbe.requests_count)
+			connector.close_session()
+
+	def test_fast_response_is_not_hedged(self):
+		with LocalGlosbe() as glosbe:
+			connector = Connector(hedger=Hedger(min_samples=0, initial_delay=1.0))
+			connector.get_page(TransArgs('pl', 'de', 'piec').to_url())
+
+			self.assertEqual(0, connector.get_hedging_statistics().hedge_rate)
+			self.assertEqual(1, glosbe.requests_count)
+			connector.close_session()
+
+	def test_scrapper_turns_hedging_on_and_off(self):
+		with LocalGlosbe():
+			scrapper = Scrapper(Connector(), hedging=True)
+			next(scrapper.scrap_translation('pl', 'de', 'piec'))
+
+			self.assertEqual(1, scrapper.get_hedging_statistics().requests)
+			scrapper.set_hedging(False)
+			self.assertIsNone(scrapper.get_hedging_statistics())
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Callable
+from urllib.parse import unquote
+
+from src.glosbe.translating.web.connector import WebConstants
+
+PAGES_DIR = Path(__file__).parent / 'pages'
+
+
+def load_page(name: str, **values: str) -> str:
+	page = (PAGES_DIR / f'{name}.html').read_text(encoding='utf-8')
+	for key, value in values.items():
+		page = page.replace(f'{{{key}}}', value)
+	return page
+
+
+class LocalGlosbe:
+	'''
+	Stand-in for glosbe.com serving the saved pages from tests/pages on localhost
+	'''
+
+	def __init__(self, latency: float | Callable[[], float] = 0.0):
+		self.latency = latency
+		self.statuses: dict[str, int] = {}
+		self.requests_count = 0
+		self._lock = threading.Lock()
+		self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._create_handler())
+		self._server.daemon_threads = True
+		self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+		self._old_url = (WebConstants.SCHEME, WebConstants.MAIN_URL)
+
+	@property
+	def address(self) -> str:
+		host, port = self._server.server_address
+		return f'{host}:{port}'
+
+	def __enter__(self) -> LocalGlosbe:
+		self.start()
+		return self
+
+	def __exit__(self, *args) -> None:
+		self.stop()
+
+	def start(self) -> None:
+		self._thread.start()
+		WebConstants.SCHEME, WebConstants.MAIN_URL = 'http', self.address
+
+	def stop(self) -> None:
+		WebConstants.SCHEME, WebConstants.MAIN_URL = self._old_url
+		self._server.shutdown()
+		self._server.server_close()
+
+	def _create_handler(self) -> type[BaseHTTPRequestHandler]:
+		glosbe = self
+
+		class Handler(BaseHTTPRequestHandler):
+			protocol_version = 'HTTP/1.1'
+			disable_nagle_algorithm = True
+
+			def do_GET(self):
+				with glosbe._lock:
+					glosbe.requests_count += 1
+				latency = glosbe.latency() if callable(glosbe.latency) else glosbe.latency
+				if latency:
+					time.sleep(latency)
+				status, body = glosbe._respond(unquote(self.path))
+				encoded = body.encode('utf-8')
+				self.send_response(status)
+				self.send_header('Content-Type', 'text/html; charset=utf-8')
+				self.send_header('Content-Length', str(len(encoded)))
+				self.end_headers()
+				self.wfile.write(encoded)
+
+			def log_message(self, *args):
+				pass
+
+		return Handler
+
+	def _respond(self, path: str) -> tuple[int, str]:
+		parts = path.strip('/').split('/')
+		if len(parts) < 3:
+			return 404, ''
+		from_lang, to_lang, word = parts[:3]
+		status = self.statuses.get(word, 200)
+		if status != 200:
+			return status, f'Status {status}'
+		if parts[3:] == ['fragment', 'details']:
+			return 200, load_page('conjugation', word=word)
+		return 200, load_page('translation', word=word, from_lang=from_lang, to_lang=to_lang)
@@ -0,0 +1,90 @@
+import io
+import time
+
+from src.glosbe.translatingPrinting.outputSinks import StreamSink, PacedSink
+from src.glosbe.translatingPrinting.translationPrinter import TranslationPrinter
+from tests.abstractTest import AbstractTest
+from tests.translationResults import get_numbered_translations
+
+
+class CountingStream(io.StringIO):
+	'''
+	Text stream counting the writes to it, pretending to be a terminal if told so
+	'''
+
+	def __init__(self, is_tty: bool = False):
+		super().__init__()
+		self.is_tty = is_tty
+		self.writes = 0
+
+	def isatty(self) -> bool:
+		return self.is_tty
+
+	def write(self, text: str) -> int:
+		self.writes += 1
+		return super().write(text)
+
+
+class OutputSinkTest(AbstractTest):
+
+	@classmethod
+	def _get_test_name(cls) -> str:
+		return 'Output Sink'
+
+	def setUp(self) -> None:
+		super().setUp()
+		self._sink = TranslationPrinter.sink
+
+	def tearDown(self) -> None:
+		TranslationPrinter.set_sink(self._sink)
+		TranslationPrinter.set_pacing(False)
+		super().tearDown()
+
+	def test_pipe_is_written_at_once(self):
+		stream = CountingStream()
+		sink = StreamSink(stream)
+		for i in range(100):
+			sink.write(f'{i}\n')
+
+		self.assertEqual(0, stream.writes)
+		sink.flush()
+		self.assertEqual(1, stream.writes)
+		self.assertEqual(''.join(f'{i}\n' for i in range(100)), stream.getvalue())
+
+	def test_terminal_is_written_through(self):
+		stream = CountingStream(is_tty=True)
+		sink = StreamSink(stream)
+		sink.write('first\n')
+
+		self.assertTrue(sink.is_interactive())
+		self.assertEqual('first\n', stream.getvalue())
+
+	def test_paced_sink_breaks_between_writes(self):
+		stream = CountingStream(is_tty=True)
+		sink = PacedSink(StreamSink(stream), break_time=0.05)
+		start = time.monotonic()
+		for text in 'abc':
+			sink.write(text)
+
+		self.assertGreaterEqual(time.monotonic() - start, 0.1)
+		self.assertEqual('abc', stream.getvalue())
+
+	def test_printing_is_not_paced_by_default(self):
+		stream = CountingStream(is_tty=True)
+		TranslationPrinter.set_sink(StreamSink(stream))
+		start = time.monotonic()
+		TranslationPrinter.print_with_formatting(get_numbered_translations(20), to_lang='de')
+
+		self.assertLess(time.monotonic() - start, TranslationPrinter.break_time)
+		self.assertIn('translation19', stream.getvalue())
+
+	def test_pacing_is_skipped_when_not_printing_to_a_terminal(self):
+		stream = CountingStream()
+		TranslationPrinter.set_sink(StreamSink(stream))
+		TranslationPrinter.set_pacing(True)
+		start = time.monotonic()
+		TranslationPrinter.print_with_formatting(get_numbered_translations(20), to_lang='de')
+
+		self.assertLess(time.monotonic() - start, TranslationPrinter.break_time)
+		self.assertEqual(1, stream.writes)
+		self.assertIn('translation19', stream.getvalue())
@@ -0,0 +1,186 @@
+from typing import Iterable
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from parameterized import parameterized
+
+from src.glosbe.translating.parsing.parsing import TranslationParser, StreamingTranslationParser, Record, SoupParserBackend, LxmlParserBackend, Definition
+from src.glosbe.translating.parsing.parsing import ConjugationParser, TableSelections
+from src.glosbe.translating.parsing.tableExtraction import TableExtractor, ConjugationTable, find_tables
+from tests.abstractTest import AbstractTest
+from tests.localGlosbe import load_page
+
+
+class ChunkedPage:
+	'''
+	Response-like page handing out its body in chunks of the given size and counting the handed out chunks
+	'''
+
+	def __init__(self, text: str, chunk_size: int, status_code: int = 200):
+		self.text = text
+		self.status_code = status_code
+		self.encoding = 'utf-8'
+		self.chunks_read = 0
+		self.content = text.encode('utf-8')
+		self._chunk_size = chunk_size
+
+	def iter_content(self, chunk_size: int = None) -> Iterable[bytes]:
+		for i in range(0, len(self.content), self._chunk_size):
+			self.chunks_read += 1
+			yield self.content[i:i + self._chunk_size]
+
+
+TRICKY_PAGE = '''<html><body>
+<div class="inline  leading-10"><h3>\nrock &amp; <b>roll</b>\n</h3><span class="text-xxs"><span>noun<i>!</i></span><span>neuter</span><span>extra</span></span></div>
+<div class="inline leading-10"><span>Less frequent translations</span></div>
+<div class="inline leading-10 hidden"><h3>not a translation</h3><span><span>verb</span></span></div>
+<ul><li class="pb-2">\nfirst <b>bold</b> definition\n<div class="border-l-2">noun</div></li>
+<li class="pb-2">second\n\ndefinition<div>an <i>example</i>\n</div></li></ul>
+</body></html>'''
+
+
+SPANNED_TABLES = '''<table>
+<tr><th>a</th><th colspan="2">b</th></tr>
+<tr><td rowspan="3">c</td><td>d</td><td rowspan="2">e</td></tr>
+<tr><td colspan="100%">f  g\n</td></tr>
+<tr><td>h</td><td>i</td><td>j</td></tr>
+<tfoot><tr><td>k<br>l</td></tr></tfoot>
+</table>
+<table><thead><tr><th></th><th>x</th></tr><tr><th></th><th></th></tr><tr><th>y</th><th>x</th></tr></thead><tr><td>1</td></tr></table>'''
+
+
+def extract_tables(html: str) -> list[ConjugationTable]:
+	extractor = TableExtractor()
+	extractor.feed(html)
+	extractor.close()
+	return list(extractor.tables)
+
+
+class ParsingTest(AbstractTest):
+
+	@classmethod
+	def _get_test_name(cls) -> str:
+		return 'Parsing'
+
+	@parameterized.expand([
+		('one_chunk', 100_000),
+		('small_chunks', 7),
+		('single_bytes', 1),
+	])
+	def test_streaming_gives_the_same_records(self, name: str, chunk_size: int):
+		page = load_page('translation', word='żółw', from_lang='pl', to_lang='de')
+		expected = list(TranslationParser(ChunkedPage(page, chunk_size)).parse())
+		streamed = list(StreamingTranslationParser(ChunkedPage(page, chunk_size)).parse())
+
+		self.assertEqual(expected, streamed)
+		self.assertEqual(Record('żółw-de-1', 'noun', 'masculine'), streamed[0])
+		self.assertEqual(4, len(streamed))
+
+	def test_first_record_is_yielded_before_the_page_is_read(self):
+		page = ChunkedPage(load_page('translation', word='piec', from_lang='pl', to_lang='de'), 64)
+		records = StreamingTranslationParser(page).parse()
+		next(records)
+
+		self.assertLess(page.chunks_read, len(page.text) // 64 // 2)
+
+	def test_parsing_stops_at_max_records(self):
+		page = ChunkedPage(load_page('translation', word='piec', from_lang='pl', to_lang='de'), 64)
+		records = list(StreamingTranslationParser(page, max_records=1).parse())
+
+		self.assertEqual(['piec-de-1'], [record.translation for record in records])
+		self.assertLess(page.chunks_read, len(page.text) // 64 // 2)
+
+	@parameterized.expand([
+		('fixture', load_page('translation', word='żółw', from_lang='pl', to_lang='de')),
+		('tricky', TRICKY_PAGE),
+		('empty', ''),
+	])
+	def test_lxml_backend_gives_the_same_results_as_soup(self, name: str, page: str):
+		soup, lxml = SoupParserBackend(), LxmlParserBackend()
+
+		self.assertEqual(list(soup.parse_translations(page)), list(lxml.parse_translations(page)))
+		self.assertEqual(list(soup.parse_definitions(page)), list(lxml.parse_definitions(page)))
+
+	def test_tricky_page_is_parsed_as_expected(self):
+		records = list(LxmlParserBackend().parse_translations(TRICKY_PAGE))
+		definitions = list(LxmlParserBackend().parse_definitions(TRICKY_PAGE))
+
+		self.assertEqual([Record('rock & roll', 'noun!', 'neuter')], records)
+		self.assertEqual([Definition('first  definition', ''), Definition('second definition', 'an example')], definitions)
+
+	@parameterized.expand([
+		('fixture', load_page('translation', word='żółw', from_lang='pl', to_lang='de')),
+		('tricky', TRICKY_PAGE),
+	])
+	def test_straining_does_not_change_results(self, name: str, page: str):
+		strained, full = SoupParserBackend(), SoupParserBackend(is_straining=False)
+
+		self.assertEqual(list(full.parse_translations(page)), list(strained.parse_translations(page)))
+		self.assertEqual(list(full.parse_definitions(page)), list(strained.parse_definitions(page)))
+
+	@parameterized.expand([
+		('soup', SoupParserBackend()),
+		('lxml', LxmlParserBackend()),
+	])
+	def test_bytes_in_declared_encoding_give_the_same_results_as_text(self, name: str, backend):
+		page = load_page('translation', word='żółw', from_lang='pl', to_lang='de').replace('charset="utf-8"', '')
+		content = page.encode('iso-8859-2')
+
+		self.assertEqual(list(backend.parse_translations(page)), list(backend.parse_translations(content, 'iso-8859-2')))
+		self.assertEqual(list(backend.parse_definitions(page)), list(backend.parse_definitions(content, 'iso-8859-2')))
+
+	@parameterized.expand([
+		('soup', SoupParserBackend()),
+		('lxml', LxmlParserBackend()),
+	])
+	def test_one_document_gives_both_translations_and_definitions(self, name: str, backend):
+		page = load_page('translation', word='żółw', from_lang='pl', to_lang='de')
+		document = backend.get_document(page)
+
+		self.assertEqual(list(backend.parse_translations(page)), list(backend.extract_translations(document)))
+		self.assertEqual(list(backend.parse_definitions(page)), list(backend.extract_definitions(document)))
+
+	@parameterized.expand([
+		('fixture', load_page('conjugation', word='piec')),
+		('spanned', SPANNED_TABLES.replace('100%', '1')),
+	])
+	def test_tables_match_pandas(self, name: str, page: str):
+		tables = extract_tables(page)
+		expected = pd.read_html(page, keep_default_na=False, header=None)
+
+		self.assertEqual(len(expected), len(tables))
+		for table, expected_table in zip(tables, expected):
+			assert_frame_equal(expected_table.astype(str), table.to_frame())
+
+	def test_spans_are_expanded(self):
+		spanned, headed = extract_tables(SPANNED_TABLES)
+
+		self.assertEqual([['a', 'b', 'b', '']], spanned.header)
+		self.assertEqual([['c', 'd', 'e', ''], ['c', 'f g', 'e', ''], ['c', 'h', 'i', 'j'], ['k l', '', '', '']], spanned.rows)
+		self.assertEqual([['', 'x'], ['', ''], ['y', 'x']], headed.header)
+		self.assertEqual([['1', '']], headed.rows)
+
+	@parameterized.expand([
+		('all', TableSelections.ALL, 0, 5),
+		('first', TableSelections.FIRST, 0, 1),
+		('second_half', TableSelections.SECOND_HALF, 2, 3),
+	])
+	def test_only_selected_tables_are_extracted(self, name: str, selection: str, first: int, length: int):
+		page = ''.join(f'<table><tr><td>{i}<table><tr><td>nested</td></tr></table></td></tr></table>' for i in range(5))
+		tables = list(ConjugationParser(ChunkedPage(page, len(page)), selection=selection).parse())
+
+		self.assertEqual(5, len(find_tables(page)))
+		self.assertEqual(length, len(tables))
+		self.assertEqual([[f'{first}nested']], tables[0].rows)
+
+	def test_tables_are_extracted_from_bytes_in_declared_encoding(self):
+		page = ChunkedPage('', 1)
+		page.content, page.encoding = load_page('conjugation', word='żółw').encode('iso-8859-2'), 'iso-8859-2'
+		expected = list(ConjugationParser(ChunkedPage(load_page('conjugation', word='żółw'), 1), selection=TableSelections.SECOND_HALF).parse())
+
+		self.assertEqual(expected, list(ConjugationParser(page, selection=TableSelections.SECOND_HALF).parse()))
+
+	def test_page_without_tables_gives_error_table(self):
+		tables = list(ConjugationParser(ChunkedPage('<p>no conjugation</p>', 1)).parse())
+
+		self.assertEqual([ConjugationTable([['Error']], [[ConjugationParser.NO_TABLES_FOUND]])], tables)
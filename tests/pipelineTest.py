@@ -0,0 +1,96 @@
+import random
+import threading
+import time
+
+from src.glosbe.translating.pipeline import Pipeline
+from tests.abstractTest import AbstractTest
+
+
+class CountingSource:
+	'''
+	Iterable of the numbers up to the given one, counting how many have been read
+	'''
+
+	def __init__(self, length: int):
+		self.length = length
+		self.read = 0
+		self._lock = threading.Lock()
+
+	def __iter__(self):
+		for i in range(self.length):
+			with self._lock:
+				self.read += 1
+			yield i
+
+
+class PipelineTest(AbstractTest):
+
+	@classmethod
+	def _get_test_name(cls) -> str:
+		return 'Pipeline'
+
+	def test_results_keep_the_order_of_the_items(self):
+		def jitter(item: int) -> int:
+			time.sleep(random.uniform(0, 0.005))
+			return item
+
+		pipeline = Pipeline(range(200), capacity=16, queue_size=4)\
+			.add_stage('first', jitter, workers=8)\
+			.add_stage('second', lambda item: item * 2, workers=3)
+
+		self.assertEqual([i * 2 for i in range(200)], list(pipeline))
+
+	def test_source_is_not_read_ahead_of_the_capacity(self):
+		source = CountingSource(1000)
+		pipeline = Pipeline(source, capacity=8, queue_size=2).add_stage('identity', lambda item: item, workers=4)
+		ahead = []
+		for consumed, _ in enumerate(pipeline, start=1):
+			time.sleep(0.001)
+			ahead.append(source.read - consumed)
+
+		self.assertLessEqual(max(ahead), 8)
+		self.assertEqual(1000, source.read)
+
+	def test_error_is_raised_at_its_item(self):
+		def fail_on_three(item: int) -> int:
+			if item == 3:
+				raise ValueError(item)
+			return item
+
+		results = []
+		with self.assertRaises(ValueError):
+			for result in Pipeline(range(10)).add_stage('failing', fail_on_three, workers=4):
+				results.append(result)
+
+		self.assertEqual([0, 1, 2], results)
+
+	def test_stopping_early_stops_reading_the_source(self):
+		source = CountingSource(10_000)
+		for result in Pipeline(source, capacity=4, queue_size=2).add_stage('identity', lambda item: item):
+			if result == 2:
+				break
+		time.sleep(0.3)
+
+		self.assertLess(source.read, 20)
+
+	def test_pipeline_can_be_iterated_again(self):
+		pipeline = Pipeline(range(50), capacity=4, queue_size=2).add_stage('double', lambda item: item * 2, workers=3)
+		for result in pipeline:
+			if result == 4:
+				break
+
+		self.assertEqual([i * 2 for i in range(50)], list(pipeline))
+		self.assertEqual([i * 2 for i in range(50)], list(pipeline))
+		self.assertEqual(50, pipeline.get_statistics()[0].items)
+
+	def test_statistics_count_each_stage(self):
+		pipeline = Pipeline(range(20))\
+			.add_stage('slow', lambda item: time.sleep(0.01) or item, workers=2)\
+			.add_stage('fast', lambda item: item)
+		list(pipeline)
+		slow, fast = pipeline.get_statistics()
+
+		self.assertEqual(('slow', 20, 2), (slow.name, slow.items, slow.workers))
+		self.assertEqual(('fast', 20, 1), (fast.name, fast.items, fast.workers))
+		self.assertGreater(slow.utilisation, fast.utilisation)
+		self.assertLessEqual(slow.utilisation, 1.0)
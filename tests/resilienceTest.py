@@ -0,0 +1,99 @@
+import socket
+import time
+
+from src.glosbe.translating.scrapping import Scrapper, ErrorMessages
+from src.glosbe.translating.web.connector import Connector, TransArgs, WebConstants
+from src.glosbe.translating.web.resilience import RetryPolicy, CircuitBreaker, CircuitStates, CircuitOpenError, ExceededRetriesError
+from tests.abstractTest import AbstractTest
+from tests.localGlosbe import LocalGlosbe
+
+
+class ResilienceTest(AbstractTest):
+
+	@classmethod
+	def _get_test_name(cls) -> str:
+		return 'Resilience'
+
+	def test_delays_grow_exponentially_up_to_the_cap(self):
+		policy = RetryPolicy(base_delay=1, max_delay=4)
+		for retry, cap in enumerate((1, 2, 4, 4, 4)):
+			delays = [policy.get_delay(retry) for _ in range(50)]
+			self.assertTrue(all(0 <= delay <= cap for delay in delays))
+			self.assertGreater(len(set(delays)), 1, 'Delays have no jitter')
+
+	def test_circuit_opens_after_consecutive_failures_and_half_opens_after_timeout(self):
+		breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+		breaker.record_failure()
+		breaker.before_request()
+		breaker.record_failure()
+
+		self.assertEqual(CircuitStates.OPEN, breaker.state)
+		self.assertRaises(CircuitOpenError, breaker.before_request)
+		time.sleep(0.06)
+		breaker.before_request()
+		self.assertEqual(CircuitStates.HALF_OPEN, breaker.state)
+		self.assertRaises(CircuitOpenError, breaker.before_request)
+		breaker.record_success()
+		self.assertEqual(CircuitStates.CLOSED, breaker.state)
+
+	def test_unfinished_trial_is_replaced_after_timeout(self):
+		breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+		breaker.record_failure()
+		time.sleep(0.06)
+		breaker.before_request()
+
+		self.assertRaises(CircuitOpenError, breaker.before_request)
+		time.sleep(0.06)
+		breaker.before_request()
+		self.assertEqual(CircuitStates.HALF_OPEN, breaker.state)
+
+	def test_timed_out_request_is_retried_and_counts_as_failure(self):
+		with LocalGlosbe(latency=0.5) as glosbe:
+			connector = Connector(retry_policy=RetryPolicy(retries=1, base_delay=0.01), circuit_breaker=CircuitBreaker(failure_threshold=2), timeout=0.05)
+			self.assertRaises(ExceededRetriesError, connector.get_page, TransArgs('pl', 'de', 'piec').to_url())
+
+			self.assertEqual(2, glosbe.requests_count)
+			self.assertEqual(CircuitStates.OPEN, connector._circuit_breaker.state)
+			connector.close_session()
+
+	def test_timed_out_translation_becomes_record(self):
+		with LocalGlosbe(latency=0.5):
+			connector = Connector(retry_policy=RetryPolicy(retries=1, base_delay=0.01), timeout=0.05)
+			translation = next(Scrapper(connector).scrap_translation('pl', 'de', 'piec'))
+			connector.close_session()
+
+		self.assertEqual(ErrorMessages.EXCEEDED_NUMBER_OF_RETRIES, translation.records[0].translation)
+
+	def test_server_errors_are_retried(self):
+		with LocalGlosbe() as glosbe:
+			glosbe.statuses['piec'] = 503
+			connector = Connector(retry_policy=RetryPolicy(retries=2, base_delay=0.01))
+			response = connector.get_page(TransArgs('pl', 'de', 'piec').to_url())
+
+			self.assertEqual(503, response.status_code)
+			self.assertEqual(3, glosbe.requests_count)
+			connector.close_session()
+
+	def test_not_found_is_not_retried(self):
+		with LocalGlosbe() as glosbe:
+			glosbe.statuses['piec'] = 404
+			connector = Connector(retry_policy=RetryPolicy(retries=2, base_delay=0.01))
+			connector.get_page(TransArgs('pl', 'de', 'piec').to_url())
+
+			self.assertEqual(1, glosbe.requests_count)
+			connector.close_session()
+
+	def test_unreachable_glosbe_fails_fast_after_the_circuit_opens(self):
+		with socket.socket() as unused:
+			unused.bind(('127.0.0.1', 0))
+			address = '127.0.0.1:{}'.format(unused.getsockname()[1])
+		old_url = WebConstants.SCHEME, WebConstants.MAIN_URL
+		WebConstants.SCHEME, WebConstants.MAIN_URL = 'http', address
+		try:
+			connector = Connector(retry_policy=RetryPolicy(retries=1, base_delay=0.01), circuit_breaker=CircuitBreaker(failure_threshold=2))
+			self.assertRaises(ExceededRetriesError, connector.get_page, TransArgs('pl', 'de', 'piec').to_url())
+			translations = list(Scrapper(connector).scrap_translation('pl', ['de', 'es'], ['piec']))
+		finally:
+			WebConstants.SCHEME, WebConstants.MAIN_URL = old_url
+
+		self.assertEqual([ErrorMessages.SERVICE_UNAVAILABLE] * 2, [translation.records[0].translation for translation in translations])
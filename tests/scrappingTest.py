@@ -0,0 +1,186 @@
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pathlib import Path
+
+from parameterized import parameterized
+
+from src.glosbe.translating.parsing.parsing import TableSelections
+from src.glosbe.translating.parsing.parsingPool import ParsingPool
+from src.glosbe.translating.scrapping import Scrapper
+from src.glosbe.translating.web.connector import Connector
+from tests.abstractTest import AbstractTest
+from tests.localGlosbe import LocalGlosbe
+
+
+class ScrappingTest(AbstractTest):
+
+	glosbe: LocalGlosbe
+
+	@classmethod
+	def _get_test_name(cls) -> str:
+		return 'Scrapping'
+
+	@classmethod
+	def setUpClass(cls) -> None:
+		super().setUpClass()
+		cls.glosbe = LocalGlosbe()
+		cls.glosbe.start()
+
+	@classmethod
+	def tearDownClass(cls) -> None:
+		cls.glosbe.stop()
+		super().tearDownClass()
+
+	def setUp(self) -> None:
+		super().setUp()
+		self.scrapper = Scrapper(Connector())
+
+	def _scrap(self, to_langs: list[str], words: list[str], by_word: bool, max_workers: int = None) -> list[tuple[str, str, list[str]]]:
+		translations = self.scrapper.scrap_translation('pl', to_langs, words, by_word=by_word, max_workers=max_workers)
+		return [(t.trans_args.to_lang, t.trans_args.word, [r.translation for r in t.records]) for t in translations]
+
+	@parameterized.expand([
+		('by_lang', ['de', 'es', 'en'], ['piec', 'dom', 'kot'], False),
+		('by_word', ['de', 'es', 'en'], ['piec', 'dom', 'kot'], True),
+	])
+	def test_concurrent_translation_keeps_order(self, name: str, to_langs: list[str], words: list[str], by_word: bool):
+		serial = self._scrap(to_langs, words, by_word)
+		concurrent = self._scrap(to_langs, words, by_word, max_workers=4)
+
+		self.assertEqual(serial, concurrent)
+		self.assertEqual(len(to_langs) * len(words), len(concurrent))
+		self.assertEqual(['piec-de-1', 'piec-de-2', 'piec-de-3', 'piec-de-4'], concurrent[0][2])
+
+	def test_connection_is_reused_across_calls(self):
+		self._scrap(['de'], ['piec'], False)
+		list(self.scrapper.scrap_definition('pl', 'piec'))
+		list(self.scrapper.scrap_conjugation('pl', 'piec'))
+		self._scrap(['de', 'es'], ['piec', 'dom'], False)
+
+		statistics = self.scrapper.get_connection_statistics()
+		self.assertEqual(6, statistics.requests)  # pl-de-piec is fetched once
+		self.assertEqual(1, statistics.connections)
+		self.assertAlmostEqual(5 / 6, statistics.reuse_rate)
+
+	def test_idle_session_is_recreated(self):
+		scrapper = Scrapper(Connector(idle_timeout=0))
+		list(scrapper.scrap_definition('pl', 'piec'))
+		list(scrapper.scrap_definition('pl', 'dom'))
+
+		statistics = scrapper.get_connection_statistics()
+		self.assertEqual(2, statistics.requests)
+		self.assertEqual(2, statistics.connections)
+
+	@parameterized.expand([
+		('serially', None),
+		('concurrently', 4),
+	])
+	def test_duplicated_words_are_fetched_once(self, name: str, max_workers: int):
+		requests_count = self.glosbe.requests_count
+		translations = self._scrap(['de'], ['piec', 'dom', 'piec', 'piec'], False, max_workers=max_workers)
+
+		self.assertEqual(['piec', 'dom', 'piec', 'piec'], [word for lang, word, records in translations])
+		self.assertEqual(translations[0], translations[2])
+		self.assertEqual(2, self.glosbe.requests_count - requests_count)
+		statistics = self.scrapper.get_coalescing_statistics()
+		self.assertEqual(2, statistics.issued)
+		self.assertEqual(2, statistics.coalesced)
+
+	def test_concurrent_identical_lookups_share_one_fetch(self):
+		self.glosbe.latency = 0.2
+		requests_count = self.glosbe.requests_count
+		try:
+			with ThreadPoolExecutor(max_workers=5) as executor:
+				translations = list(executor.map(lambda _: next(self.scrapper.scrap_translation('pl', 'de', 'kot')), range(5)))
+		finally:
+			self.glosbe.latency = 0
+
+		self.assertEqual(1, self.glosbe.requests_count - requests_count)
+		self.assertTrue(all(translation.records == translations[0].records for translation in translations))
+		self.assertEqual(4, self.scrapper.get_coalescing_statistics().coalesced)
+
+	def test_translation_and_conjugation_are_fetched_in_parallel(self):
+		self.glosbe.latency = 0.3
+		try:
+			start = time.monotonic()
+			translations, conjugations = self.scrapper.scrap_translation_and_conjugation('pl', 'de', 'piec')
+			elapsed = time.monotonic() - start
+		finally:
+			self.glosbe.latency = 0
+
+		self.assertEqual('piec-de-1', translations[0].records[0].translation)
+		self.assertTrue(conjugations)
+		self.assertLess(elapsed, 0.55)
+
+	def test_streamed_translation_matches_the_fetched_one(self):
+		fetched = next(self.scrapper.scrap_translation('pl', 'de', 'piec'))
+		streamed = self.scrapper.scrap_translation_streaming('pl', 'de', 'piec')
+
+		self.assertEqual(fetched.records, list(streamed.records))
+
+	@parameterized.expand([
+		('fetched', lambda scrapper: next(scrapper.scrap_translation('pl', 'de', 'piec', max_records=2))),
+		('streamed', lambda scrapper: scrapper.scrap_translation_streaming('pl', 'de', 'piec', max_records=2)),
+	])
+	def test_max_records_limits_the_translation(self, name: str, translate):
+		records = list(translate(self.scrapper).records)
+
+		self.assertEqual(['piec-de-1', 'piec-de-2'], [record.translation for record in records])
+
+	def test_limited_translation_is_not_cached(self):
+		with tempfile.TemporaryDirectory() as cache_dir:
+			scrapper = Scrapper(Connector(), cache_dir=Path(cache_dir))
+			limited = next(scrapper.scrap_translation('pl', 'de', 'piec', max_records=2))
+			full = next(scrapper.scrap_translation('pl', 'de', 'piec'))
+			limited_again = next(scrapper.scrap_translation('pl', 'de', 'piec', max_records=2))
+
+		self.assertEqual(2, len(limited.records))
+		self.assertEqual(4, len(full.records))
+		self.assertEqual(limited.records, limited_again.records)
+
+	def test_translation_and_definition_share_one_fetch(self):
+		requests_before = self.glosbe.requests_count
+		translation, definitions = self.scrapper.scrap_translation_and_definition('pl', 'de', 'piec')
+		again = next(self.scrapper.scrap_translation('pl', 'de', 'piec'))
+
+		self.assertEqual(1, self.glosbe.requests_count - requests_before)
+		self.assertEqual(['piec-de-1', 'piec-de-2', 'piec-de-3', 'piec-de-4'], [record.translation for record in translation.records])
+		self.assertEqual(translation.records, again.records)
+		self.assertTrue(definitions)
+
+	def test_failed_page_is_fetched_again(self):
+		self.glosbe.statuses['dom'] = 404
+		try:
+			missing = next(self.scrapper.scrap_translation('pl', 'de', 'dom'))
+		finally:
+			del self.glosbe.statuses['dom']
+		found = next(self.scrapper.scrap_translation('pl', 'de', 'dom'))
+
+		self.assertNotEqual(missing.records, found.records)
+		self.assertEqual(['dom-de-1', 'dom-de-2', 'dom-de-3', 'dom-de-4'], [record.translation for record in found.records])
+
+	def test_parsing_pool_gives_the_same_results(self):
+		with ParsingPool(max_workers=2) as pool:
+			pooled = Scrapper(Connector(), parsing_pool=pool)
+			for scrap in (
+				lambda scrapper: [t.records for t in scrapper.scrap_translation('pl', ['de', 'es'], ['piec', 'dom'], max_workers=4)],
+				lambda scrapper: [t.records for t in scrapper.scrap_translation('pl', 'de', 'piec', max_records=2)],
+				lambda scrapper: list(scrapper.scrap_definition('pl', 'piec')),
+				lambda scrapper: list(scrapper.scrap_conjugation('pl', 'piec', TableSelections.SECOND_HALF)),
+			):
+				self.assertEqual(scrap(self.scrapper), scrap(pooled))
+
+	def test_pipelined_translation_matches_the_concurrent_one(self):
+		self.glosbe.statuses['zzz'] = 404
+		try:
+			words = ['piec', 'zzz', 'dom', 'piec']
+			concurrent = self._scrap(['de', 'es'], words, True, max_workers=4)
+			pipeline = self.scrapper.scrap_translation_pipelined('pl', ['de', 'es'], words, by_word=True, fetch_workers=3, capacity=4)
+			pipelined = [(t.trans_args.to_lang, t.trans_args.word, [r.translation for r in t.records]) for t in pipeline]
+		finally:
+			del self.glosbe.statuses['zzz']
+
+		self.assertEqual(concurrent, pipelined)
+		self.assertEqual([8, 8], [stage.items for stage in pipeline.get_statistics()])
@@ -0,0 +1,75 @@
+import threading
+import time
+
+from src.glosbe.translating.web.connector import Connector, TransArgs
+from src.glosbe.translating.web.resilience import RetryPolicy
+from src.glosbe.translating.web.throttling import Throttle, TokenBucket
+from tests.abstractTest import AbstractTest
+from tests.localGlosbe import LocalGlosbe
+
+
+class ThrottlingTest(AbstractTest):
+
+	@classmethod
+	def _get_test_name(cls) -> str:
+		return 'Throttling'
+
+	def test_token_bucket_limits_rate(self):
+		bucket = TokenBucket(rate=50, capacity=1)
+		start = time.perf_counter()
+		for _ in range(6):
+			bucket.acquire()
+		self.assertGreaterEqual(time.perf_counter() - start, 0.09)
+
+	def test_throttling_responses_decrease_limits(self):
+		throttle = Throttle(rate=10, concurrency=8)
+		throttle.acquire()
+		throttle.release(429)
+
+		state = throttle.get_state()
+		self.assertEqual(5, state.rate)
+		self.assertEqual(4, state.concurrency_limit)
+		self.assertEqual(0, state.in_flight)
+
+	def test_successful_responses_increase_limits(self):
+		throttle = Throttle(rate=10, burst=100, concurrency=2)
+		for _ in range(4):
+			throttle.acquire()
+			throttle.release(200)
+
+		state = throttle.get_state()
+		self.assertGreater(state.rate, 10)
+		self.assertGreater(state.concurrency_limit, 3)
+
+	def test_concurrency_limit_is_respected(self):
+		throttle = Throttle(rate=1000, burst=1000, concurrency=2)
+		max_in_flight = 0
+		lock = threading.Lock()
+
+		def request():
+			nonlocal max_in_flight
+			throttle.acquire()
+			with lock:
+				max_in_flight = max(max_in_flight, throttle.get_state().in_flight)
+			time.sleep(0.02)
+			throttle.release()
+
+		threads = [threading.Thread(target=request) for _ in range(8)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		self.assertEqual(2, max_in_flight)
+
+	def test_connector_backs_off_on_too_many_requests(self):
+		with LocalGlosbe() as glosbe:
+			glosbe.statuses['zakazane'] = 429
+			connector = Connector(throttle=Throttle(rate=10, concurrency=4), retry_policy=RetryPolicy(retries=0))
+			connector.get_page(TransArgs('pl', 'de', 'piec').to_url())
+			rate_after_success = connector.get_throttle_state().rate
+			connector.get_page(TransArgs('pl', 'de', 'zakazane').to_url())
+
+			self.assertGreater(rate_after_success, 10)
+			self.assertLess(connector.get_throttle_state().rate, rate_after_success)
+			self.assertLess(connector.get_throttle_state().concurrency_limit, 4)
+			connector.close_session()
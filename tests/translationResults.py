@@ -0,0 +1,17 @@
+from src.glosbe.translating.parsing.parsing import Record
+from src.glosbe.translating.scrapping import TranslationResult
+from src.glosbe.translating.web.connector import TransArgs
+
+
+def get_translations() -> list[TranslationResult]:
+	'''
+	:return: a translation with records given lazily, as the scrapper gives them, and a translation without any
+	'''
+	return [
+		TranslationResult(TransArgs('pl', 'de', 'piec'), iter([Record('Ofen', 'noun', 'masculine'), Record('backen', 'verb')])),
+		TranslationResult(TransArgs('pl', 'de', 'brak'), []),
+	]
+
+
+def get_numbered_translations(count: int) -> list[TranslationResult]:
+	return [TranslationResult(TransArgs('pl', 'de', f'word{i}'), [Record(f'translation{i}')]) for i in range(count)]